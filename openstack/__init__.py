@@ -12,8 +12,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import pbr.version
+import sys
 
 
-__version__ = pbr.version.VersionInfo(
-    'python-openstacksdk').version_string()
+def _get_version():
+    import pbr.version
+    return pbr.version.VersionInfo('python-openstacksdk').version_string()
+
+
+if sys.version_info >= (3, 7):
+    # Looking the version up costs more than the rest of ``import openstack``
+    # so defer it until someone asks.
+    def __getattr__(name):
+        if name == '__version__':
+            global __version__
+            __version__ = _get_version()
+            return __version__
+        raise AttributeError("module %r has no attribute %r" %
+                             (__name__, name))
+else:
+    __version__ = _get_version()
@@ -0,0 +1,481 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Asynchronous counterparts of the transport, session and resource layers
+built on asyncio and `aiohttp <https://aiohttp.readthedocs.io/>`_, for
+applications that need many concurrent requests without a thread for each.
+
+This module requires Python 3.6 or later and aiohttp, neither of which the
+rest of the SDK depends on, so it is never imported by other modules.
+
+An :class:`~openstack.aio.AsyncSession` wraps a regular
+:class:`~openstack.session.Session`, sharing its authenticator, user
+preferences and endpoint cache, and sends requests with an
+:class:`~openstack.aio.AsyncTransport`.  An
+:class:`~openstack.aio.AsyncResource` wraps a resource class and offers
+awaitable versions of its class methods::
+
+    import asyncio
+
+    from openstack import aio
+    from openstack import connection
+    from openstack.compute.v2 import server
+
+    conn = connection.Connection(...)
+    servers = aio.AsyncResource(server.Server)
+
+    async def get_all(ids):
+        async with aio.AsyncSession(conn.session) as sess:
+            return await asyncio.gather(
+                *[servers.get_by_id(sess, i) for i in ids])
+
+Tokens are fetched with the synchronous authenticator, which blocks the
+event loop while it authenticates.  That happens once per token lifetime,
+or never when the token is refreshed in the background, see
+:meth:`~openstack.auth.identity.base.BaseIdentityPlugin.start_refresh`.
+"""
+
+import asyncio
+import json
+import logging
+import ssl
+from urllib import parse as url_parse
+
+import aiohttp
+
+from openstack import exceptions
+from openstack import json_codec as json_codec_
+from openstack import transport as xport
+from openstack import utils
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncResponse(object):
+    """A response whose body has been read.
+
+    It offers the parts of ``requests.Response`` the SDK relies on.
+    """
+
+    def __init__(self, method, url, status_code, headers, content,
+                 encoding=None):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.body = None
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncTransport(object):
+
+    DEFAULT_LIMIT = 100
+
+    def __init__(self, user_agent=None, verify=True,
+                 redirect=xport.Transport.DEFAULT_REDIRECT_LIMIT,
+                 accept=xport.JSON, limit=DEFAULT_LIMIT, limit_per_host=0,
+                 retry=None, json_codec=None):
+        """Create an asynchronous transport.
+
+        The arguments are those of :class:`~openstack.transport.Transport`
+        except for the connection pool, which is sized by:
+
+        :param int limit: The maximum number of connections open at once.
+        :param int limit_per_host: The maximum number of connections open
+            to each host, no limit if 0.
+
+        The aiohttp session is created on first use so the transport can be
+        constructed outside of a running event loop.  Unlike with
+        :class:`~openstack.transport.Transport`, redirections are followed
+        by aiohttp and a ``redirect`` of True or an integer both allow them.
+        """
+        if user_agent is None:
+            self._user_agent = xport.USER_AGENT
+        else:
+            self._user_agent = "%s %s" % (user_agent, xport.USER_AGENT)
+        self.verify = verify
+        self._redirect = redirect
+        self._accept = accept
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._retry = retry
+        self._retries = {}
+        self._session = None
+        if json_codec is None or isinstance(json_codec, str):
+            json_codec = json_codec_.get_codec(json_codec)
+        self._json_codec = json_codec
+
+    def _ssl_context(self):
+        if self.verify is False:
+            return False
+        if self.verify is True:
+            return None
+        return ssl.create_default_context(cafile=self.verify)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host,
+                ssl=self._ssl_context())
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close all the connections of the transport."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, method, url, redirect=None, retry=None,
+                      **kwargs):
+        """Send a request.
+
+        Takes the same arguments as
+        :meth:`~openstack.transport.Transport.request` except that only
+        ``headers``, ``params`` and ``data`` are passed on to aiohttp.
+
+        :returns: An :class:`~openstack.aio.AsyncResponse` with the decoded
+                  JSON body in ``body`` if JSON was accepted.
+        """
+        headers = kwargs.setdefault('headers', {})
+
+        json_data = kwargs.pop('json', None)
+        if json_data is not None:
+            kwargs['data'] = self._json_codec.dumps(json_data)
+            headers['Content-Type'] = xport.JSON
+
+        user_agent = kwargs.pop('user_agent', None)
+        if isinstance(user_agent, str) and user_agent != '':
+            headers['User-Agent'] = '%s %s' % (user_agent, self._user_agent)
+        elif 'User-Agent' not in headers:
+            headers['User-Agent'] = self._user_agent
+
+        if redirect is None:
+            redirect = self._redirect
+        if 'accept' in kwargs:
+            accept = kwargs.pop('accept')
+        else:
+            accept = self._accept
+        if accept:
+            headers.setdefault('Accept', accept)
+
+        resp = await self._send_with_retry(method, url, redirect,
+                                           retry or self._retry, **kwargs)
+
+        if resp.status_code >= 400:
+            raise exceptions.HttpException(
+                '%s Error for url: %s' % (resp.status_code, url),
+                details=xport.Transport._parse_error_response(resp),
+                status_code=resp.status_code)
+        if accept == xport.JSON and resp.content:
+            try:
+                resp.body = self._json_codec.loads(resp.content)
+            except ValueError:
+                raise exceptions.InvalidResponse(response=resp.text)
+
+        return resp
+
+    async def _send_request(self, method, url, redirect, headers=None,
+                            params=None, data=None):
+        if isinstance(redirect, bool):
+            redirects = {'allow_redirects': redirect}
+        else:
+            redirects = {'allow_redirects': redirect > 0,
+                         'max_redirects': max(redirect, 1)}
+        async with self._get_session().request(
+                method, url, headers=headers, params=params, data=data,
+                **redirects) as resp:
+            content = await resp.read()
+            _logger.debug("RESP: %s %s [%s]", method, url, resp.status)
+            return AsyncResponse(method, str(resp.url), resp.status,
+                                 resp.headers, content,
+                                 encoding=resp.charset)
+
+    async def _send_with_retry(self, method, url, redirect, retry, **kwargs):
+        if retry is None:
+            return await self._send_request(method, url, redirect, **kwargs)
+
+        data = kwargs.get('data')
+        position = utils.tell_body(data)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = await self._send_request(method, url, redirect,
+                                                **kwargs)
+            except aiohttp.ClientConnectionError as e:
+                delay = retry.get_delay(method, attempt)
+                if delay is None or not utils.rewind_body(data, position):
+                    raise
+                reason = 'connection'
+                _logger.debug("Connection to %s failed: %s", url, e)
+            else:
+                delay = retry.get_delay(method, attempt, response=resp)
+                if delay is None or not utils.rewind_body(data, position):
+                    return resp
+                reason = resp.status_code
+            parts = url_parse.urlsplit(url)
+            counts = self._retries.setdefault(
+                '%s://%s' % (parts.scheme, parts.netloc), {})
+            counts[reason] = counts.get(reason, 0) + 1
+            _logger.info("Retrying %s %s in %.2f seconds after %s",
+                         method, url, delay, reason)
+            await asyncio.sleep(delay)
+
+    def get_retry_stats(self):
+        """Get the number of requests retried for each host.
+
+        See :meth:`~openstack.transport.Transport.get_retry_stats`.
+        """
+        return dict((host, dict(counts))
+                    for host, counts in self._retries.items())
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request('HEAD', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request('DELETE', url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request('PATCH', url, **kwargs)
+
+
+class AsyncSession(object):
+
+    def __init__(self, session, transport=None):
+        """Create an asynchronous session.
+
+        :param session: The session providing authentication, endpoints
+            and preferences.  Its transport is used by the authenticator.
+        :type session: :class:`~openstack.session.Session`
+        :param transport: The transport requests are sent with.  If not
+            provided, one verifying certificates like the transport of
+            ``session`` is created.
+        :type transport: :class:`~openstack.aio.AsyncTransport`
+
+        The methods accept the arguments of the
+        :class:`~openstack.session.Session` methods.
+        """
+        self.session = session
+        if transport is None:
+            transport = AsyncTransport(
+                verify=getattr(session.transport, 'verify', True),
+                retry=session.retry)
+        self.transport = transport
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(self, path, method, service=None, authenticate=True,
+                       **kwargs):
+        """Send a request, see :meth:`~openstack.session.Session._request`.
+
+        A request rejected with 401 Unauthorized is sent once more with a
+        new token, like the synchronous session does.
+        """
+        sess = self.session
+        headers = kwargs.setdefault('headers', dict())
+        if not authenticate:
+            endpoint = sess._get_endpoint(service, cache=False)
+            url = utils.urljoin(endpoint, path)
+            return await self.transport.request(method, url, **kwargs)
+
+        position = utils.tell_body(kwargs.get('data'))
+        token = sess._authenticate(headers)
+        url = utils.urljoin(sess._get_endpoint(service), path)
+        try:
+            return await self.transport.request(method, url, **kwargs)
+        except exceptions.HttpException as e:
+            if (e.status_code != 401 or
+                    not utils.rewind_body(kwargs.get('data'), position) or
+                    not sess._invalidate(token)):
+                raise
+            _logger.debug("Token rejected, retrying %s %s", method, url)
+
+        sess._authenticate(headers)
+        url = utils.urljoin(sess._get_endpoint(service), path)
+        return await self.transport.request(method, url, **kwargs)
+
+    async def head(self, path, **kwargs):
+        return await self._request(path, 'HEAD', **kwargs)
+
+    async def get(self, path, **kwargs):
+        return await self._request(path, 'GET', **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self._request(path, 'POST', **kwargs)
+
+    async def put(self, path, **kwargs):
+        return await self._request(path, 'PUT', **kwargs)
+
+    async def delete(self, path, **kwargs):
+        return await self._request(path, 'DELETE', **kwargs)
+
+    async def patch(self, path, **kwargs):
+        return await self._request(path, 'PATCH', **kwargs)
+
+
+class AsyncResource(object):
+
+    def __init__(self, resource):
+        """Wrap a resource class to use it with an asynchronous session.
+
+        The methods behave like the class methods of the same name on
+        ``resource`` but must be awaited, and take an
+        :class:`~openstack.aio.AsyncSession`.
+
+        :param resource: A :class:`~openstack.resource.Resource` subclass.
+        """
+        self.resource = resource
+
+    def _get_url(self, path_args, resource_id=None):
+        if path_args:
+            url = self.resource.base_path % path_args
+        else:
+            url = self.resource.base_path
+        if resource_id:
+            url = utils.urljoin(url, resource_id)
+        return url
+
+    async def create_by_id(self, session, attrs, resource_id=None,
+                           path_args=None):
+        cls = self.resource
+        if not cls.allow_create:
+            raise exceptions.MethodNotSupported('create')
+
+        if cls.resource_key:
+            body = {cls.resource_key: attrs}
+        else:
+            body = attrs
+
+        url = self._get_url(path_args, resource_id)
+        if resource_id:
+            resp = await session.put(url, service=cls.service, json=body)
+        else:
+            resp = await session.post(url, service=cls.service, json=body)
+        resp = resp.body
+
+        if cls.resource_key:
+            resp = resp[cls.resource_key]
+
+        return resp
+
+    async def get_data_by_id(self, session, resource_id, path_args=None,
+                             include_headers=False):
+        cls = self.resource
+        if not cls.allow_retrieve:
+            raise exceptions.MethodNotSupported('retrieve')
+
+        url = self._get_url(path_args, resource_id)
+        response = await session.get(url, service=cls.service)
+        body = response.body
+
+        if cls.resource_key:
+            body = body[cls.resource_key]
+
+        if include_headers:
+            body.update(response.headers)
+
+        return body
+
+    async def get_by_id(self, session, resource_id, path_args=None,
+                        include_headers=False):
+        body = await self.get_data_by_id(session, resource_id,
+                                         path_args=path_args,
+                                         include_headers=include_headers)
+        return self.resource.existing(**body)
+
+    async def page(self, session, limit, marker=None, path_args=None,
+                   **params):
+        data, resp = await self._page(session, limit, marker, path_args,
+                                      **params)
+        return data
+
+    async def _page(self, session, limit, marker=None, path_args=None,
+                    **params):
+        cls = self.resource
+        filters = {}
+
+        if limit:
+            filters['limit'] = limit
+        if marker:
+            filters['marker'] = marker
+
+        url = self._get_url(path_args)
+        if filters:
+            url = '%s?%s' % (url, url_parse.urlencode(filters))
+
+        resp = await session.get(url, service=cls.service, params=params)
+        data = resp.body
+
+        if cls.resources_key:
+            data = data[cls.resources_key]
+
+        return data, resp
+
+    async def list(self, session, limit=None, marker=None, path_args=None,
+                   raw=False, **params):
+        """Iterate over the resources with ``async for``.
+
+        With ``raw`` the dicts of the response bodies are yielded instead of
+        resources, as with :meth:`openstack.resource.Resource.list`.
+        """
+        cls = self.resource
+        if not cls.allow_list:
+            raise exceptions.MethodNotSupported('list')
+
+        more_data = True
+        total = 0
+
+        while more_data:
+            page, resp = await self._page(session, limit, marker, path_args,
+                                          **params)
+            total += len(page)
+            more_data = cls._should_page(resp, page, limit, total)
+
+            for data in page:
+                marker = data.get(cls.id_attribute)
+                yield data if raw else cls.existing(**data)
@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
+import calendar
+import time
 
-from oslo_utils import timeutils
+import iso8601
 
 from openstack.auth import service_catalog as catalog
 
@@ -24,6 +25,9 @@ from openstack.auth import service_catalog as catalog
 # Do not use token before expiration
 BEST_BEFORE_SECONDS = 30
 
+# A clock that can't jump backwards where the platform provides one.
+_clock = getattr(time, 'monotonic', time.time)
+
 
 class AccessInfo(object):
     """Encapsulates a raw authentication token from keystone.
@@ -34,6 +38,27 @@ class AccessInfo(object):
     def __init__(self, **kwargs):
         """Construct access info."""
         self._info = kwargs
+        self._expires = None
+        #: Token expiration as seconds since the epoch.
+        self.expires_at = None
+        self._deadline = None
+
+    def _set_expires(self, expires):
+        """Parse the token expiration once, at construction.
+
+        The expiration is kept as a datetime for :attr:`expires`, as an epoch
+        float and as a deadline on :data:`_clock` so checking the token in
+        :meth:`will_expire_soon` is a single comparison.
+        """
+        if expires is None:
+            return
+        try:
+            self._expires = iso8601.parse_date(expires)
+        except (iso8601.ParseError, TypeError) as e:
+            raise ValueError(str(e))
+        self.expires_at = (calendar.timegm(self._expires.utctimetuple()) +
+                           self._expires.microsecond / 1000000.0)
+        self._deadline = _clock() + (self.expires_at - time.time())
 
     @classmethod
     def factory(cls, resp=None, body=None, **kwargs):
@@ -68,9 +93,9 @@ class AccessInfo(object):
         :return: boolean : true if expiration is within the given duration
 
         """
-        norm_expires = timeutils.normalize_time(self.expires)
-        soon = (timeutils.utcnow() + datetime.timedelta(seconds=best_before))
-        return norm_expires < soon
+        if self._deadline is None:
+            return False
+        return self._deadline - best_before < _clock()
 
     @classmethod
     def is_valid(cls, body, **kwargs):
@@ -287,6 +312,7 @@ class AccessInfoV2(AccessInfo):
     def __init__(self, **kwargs):
         super(AccessInfoV2, self).__init__(**kwargs)
         self._info.update(version='v2.0')
+        self._set_expires(self._info.get('token', {}).get('expires'))
         service_catalog = self._info['serviceCatalog']
         self.service_catalog = catalog.ServiceCatalogV2(service_catalog)
 
@@ -308,7 +334,7 @@ class AccessInfoV2(AccessInfo):
 
     @property
     def expires(self):
-        return timeutils.parse_isotime(self._info['token']['expires'])
+        return self._expires
 
     @property
     def username(self):
@@ -414,6 +440,7 @@ class AccessInfoV3(AccessInfo):
     def __init__(self, token, **kwargs):
         super(AccessInfoV3, self).__init__(**kwargs)
         self._info.update(version='v3')
+        self._set_expires(self._info.get('expires_at'))
         self.service_catalog = catalog.ServiceCatalog(self._info['catalog'])
         if token:
             self._info.update(auth_token=token)
@@ -436,7 +463,7 @@ class AccessInfoV3(AccessInfo):
 
     @property
     def expires(self):
-        return timeutils.parse_isotime(self._info['expires_at'])
+        return self._expires
 
     @property
     def user_id(self):
@@ -16,28 +16,46 @@ For examples of this class, see the v2 and v3 authentication plugins.
 """
 
 import abc
+import hashlib
+import json
+import logging
+import threading
+import time
 
 import six
 
 from openstack.auth import base
 
+_logger = logging.getLogger(__name__)
+
 
 @six.add_metaclass(abc.ABCMeta)
 class BaseIdentityPlugin(base.BaseAuthPlugin):
 
     #: Consider a token valid if it does not expire for this many seconds
     BEST_BEFORE_SECONDS = 1
+    #: Default number of seconds before expiry the refresher renews a token
+    REFRESH_BEFORE_SECONDS = 120
+    #: Seconds the refresher waits before retrying a failed authorization
+    REFRESH_RETRY_SECONDS = 10
 
-    def __init__(self, auth_url=None, reauthenticate=True):
+    def __init__(self, auth_url=None, reauthenticate=True, token_cache=None):
         """Create an identity authorization plugin.
 
         :param string auth_url: Authorization URL
         :param bool reauthenticate: Should the plugin attempt reauthorization.
+        :param token_cache: Cache to share tokens with other plugins and
+                            processes using the same credentials.
+        :type token_cache: :class:`~openstack.auth.token_cache.BaseTokenCache`
         """
         super(BaseIdentityPlugin, self).__init__()
         self.auth_url = auth_url
         self.access_info = None
         self.reauthenticate = reauthenticate
+        self.token_cache = token_cache
+        self._lock = threading.Lock()
+        self._refresher = None
+        self._refresh_stop = threading.Event()
 
     @abc.abstractmethod
     def authorize(self, transport, **kwargs):
@@ -69,34 +87,85 @@ class BaseIdentityPlugin(base.BaseAuthPlugin):
         """
         return self.get_access(transport).auth_token
 
-    def _needs_reauthenticate(self):
-        """Return if the existing token needs to be re-authenticated.
+    def get_cache_id_elements(self):
+        """Get the elements that identify the token this plugin fetches.
 
-        The token should be refreshed if it is about to expire.
+        Plugins should extend this with their credentials and scope so that
+        plugins only share cached tokens when they would authenticate the
+        same way.
 
-        :returns: True if the plugin should fetch a new token. False otherwise.
+        :returns dict: Elements to be hashed into :meth:`get_cache_id`.
+        """
+        return {'auth_url': self.auth_url}
+
+    def get_cache_id(self):
+        """Get a key for this plugin's token in a token cache.
+
+        The key is a hash so secrets in the elements are not exposed.
+
+        :returns string: A key for the token cache.
+        """
+        elements = json.dumps(self.get_cache_id_elements(), sort_keys=True)
+        return hashlib.sha256(elements.encode('utf-8')).hexdigest()
+
+    def _authorize(self, transport):
+        """Authorize and store the new token in the token cache."""
+        access_info = self.authorize(transport)
+        if self.token_cache is not None:
+            try:
+                self.token_cache.set(self.get_cache_id(), access_info)
+            except Exception as e:
+                _logger.warn("Unable to cache token: %s", e)
+        return access_info
+
+    def _authorize_or_load(self, transport):
+        """Use a valid cached token or otherwise authorize."""
+        if self.token_cache is None:
+            return self._authorize(transport)
+        key = self.get_cache_id()
+        with self.token_cache.lock(key):
+            access_info = self.token_cache.get(key)
+            if self._is_valid(access_info):
+                return access_info
+            return self._authorize(transport)
+
+    def _is_valid(self, access_info):
+        """Return if the given access information can still be used.
+
+        :returns: True if the token is present and not about to expire or
+                  reauthentication has been disallowed. False otherwise.
         """
-        if not self.access_info:
+        if not access_info:
             # authentication was never fetched.
-            return True
+            return False
 
         if not self.reauthenticate:
             # don't re-authenticate if it has been disallowed.
+            return True
+
+        return not access_info.will_expire_soon(self.BEST_BEFORE_SECONDS)
+
+    def _needs_reauthenticate(self):
+        """Return if the existing token needs to be re-authenticated.
+
+        The token should be refreshed if it is about to expire.
+
+        :returns: True if the plugin should fetch a new token. False otherwise.
+        """
+        if self._is_valid(self.access_info):
             return False
 
-        if self.access_info.will_expire_soon(self.BEST_BEFORE_SECONDS):
+        if self.access_info:
             # if it's about to expire we should re-authenticate now.
             self.invalidate()
-            return True
-
-        # otherwise it's fine and use the existing one.
-        return False
+        return True
 
     def get_access(self, transport):
         """Fetch or return a current AccessInfo object.
 
         If a valid AccessInfo is present then it is returned otherwise a new
-        one will be fetched.
+        one will be fetched.  This is safe to call from many threads at once;
+        only one of them authorizes while the rest wait for its result.
 
         :param transport: A transport object for the authenticator.
         :type transport: :class:`~openstack.transport.Transport`
@@ -105,10 +174,70 @@ class BaseIdentityPlugin(base.BaseAuthPlugin):
 
         :returns AccessInfo: Valid AccessInfo
         """
-        if self._needs_reauthenticate():
-            self.access_info = self.authorize(transport)
+        access_info = self.access_info
+        if self._is_valid(access_info):
+            return access_info
+
+        with self._lock:
+            # Another thread may have authorized while we were waiting.
+            if self._needs_reauthenticate():
+                self.access_info = self._authorize_or_load(transport)
+            return self.access_info
+
+    def start_refresh(self, transport, before=None):
+        """Start renewing the token in a background thread.
+
+        The token is renewed ``before`` seconds ahead of its expiration and
+        swapped in once the new one is ready, so requests keep using the
+        current token and never wait on authentication while it is valid.
+        This is opt-in; without it the token is renewed on the first request
+        made after it is about to expire.
 
-        return self.access_info
+        :param transport: A transport object for the authenticator.
+        :type transport: :class:`~openstack.transport.Transport`
+        :param int before: Seconds before expiration to renew the token.
+                           Defaults to :data:`REFRESH_BEFORE_SECONDS`.
+        """
+        if self._refresher is not None:
+            return
+        if before is None:
+            before = self.REFRESH_BEFORE_SECONDS
+        self._refresh_stop.clear()
+        self._refresher = threading.Thread(target=self._refresh,
+                                           args=(transport, before))
+        self._refresher.daemon = True
+        self._refresher.start()
+
+    def stop_refresh(self):
+        """Stop the background refresher started by :meth:`start_refresh`."""
+        refresher = self._refresher
+        if refresher is None:
+            return
+        self._refresh_stop.set()
+        refresher.join()
+        self._refresher = None
+
+    def _refresh(self, transport, before):
+        while not self._refresh_stop.is_set():
+            try:
+                access_info = self.get_access(transport)
+                expires_at = getattr(access_info, 'expires_at', None)
+                if expires_at is None:
+                    # Nothing to schedule the refresh against.
+                    return
+                # Tokens that live for less than ``before`` are renewed
+                # halfway through instead of continuously.
+                remaining = expires_at - time.time()
+                if self._refresh_stop.wait(max(remaining - before,
+                                               remaining / 2)):
+                    return
+                access_info = self._authorize(transport)
+            except Exception as e:
+                _logger.warn("Token refresh failed: %s", e)
+                self._refresh_stop.wait(self.REFRESH_RETRY_SECONDS)
+                continue
+            with self._lock:
+                self.access_info = access_info
 
     def invalidate(self):
         """Invalidate the current authentication data.
@@ -123,6 +252,14 @@ class BaseIdentityPlugin(base.BaseAuthPlugin):
                        invalidate. This means that it makes sense to try again.
                        If nothing happens returns False to indicate give up.
         """
+        if self.access_info is not None and self.token_cache is not None:
+            # Only drop the cached token if it is ours; another process may
+            # already have replaced it with a fresh one.
+            key = self.get_cache_id()
+            cached = self.token_cache.get(key)
+            if (cached is not None and
+                    cached.auth_token == self.access_info.auth_token):
+                self.token_cache.delete(key)
         self.access_info = None
         return True
 
@@ -52,7 +52,8 @@ class Auth(base.BaseIdentityPlugin):
         :raises TypeError: if a user_id, user_name or token is not provided.
         """
 
-        super(Auth, self).__init__(auth_url=auth_url)
+        super(Auth, self).__init__(auth_url=auth_url,
+                                   token_cache=auth_args.get('token_cache'))
 
         if not auth_url:
             msg = ("The authorization URL auth_url was not provided.")
@@ -71,6 +72,9 @@ class Auth(base.BaseIdentityPlugin):
         """The full URL where we will send authentication data."""
         return self.auth_plugin.token_url
 
+    def get_cache_id_elements(self):
+        return self.auth_plugin.get_cache_id_elements()
+
     def authorize(self, transport, **kwargs):
         return self.auth_plugin.authorize(transport, **kwargs)
 
@@ -50,6 +50,7 @@ class Auth(base.BaseIdentityPlugin):
         'project_name',
         'reauthenticate',
         'token',
+        'token_cache',
         'trust_id',
     ]
 
@@ -62,6 +63,7 @@ class Auth(base.BaseIdentityPlugin):
                  project_id=None,
                  project_name=None,
                  reauthenticate=True,
+                 token_cache=None,
                  trust_id=None):
         """Construct an Identity V2 Authentication Plugin.
 
@@ -78,13 +80,16 @@ class Auth(base.BaseIdentityPlugin):
         :param string project_name: Tenant name for project scoping.
         :param bool reauthenticate: Get new token if token expires.
         :param string token: Existing token for authentication.
+        :param token_cache: Cache to share tokens through.
+        :type token_cache: :class:`~openstack.auth.token_cache.BaseTokenCache`
         :param string trust_id: Trust ID for trust scoping.
 
         :raises :class:`~openstack.exceptions.AuthorizationFailure`: if a
         user_id, user_name or token is not provided.
         """
         super(Auth, self).__init__(auth_url=auth_url,
-                                   reauthenticate=reauthenticate)
+                                   reauthenticate=reauthenticate,
+                                   token_cache=token_cache)
 
         if not (user_id or user_name or token):
             msg = 'You need to specify either a user_name, user_id or token'
@@ -125,6 +130,18 @@ class Auth(base.BaseIdentityPlugin):
 
         return access.AccessInfoV2(**resp_data)
 
+    def get_cache_id_elements(self):
+        """Identity v2 credentials and scope identifying the token."""
+        elements = super(Auth, self).get_cache_id_elements()
+        elements.update(user_id=self.user_id,
+                        user_name=self.user_name,
+                        password=self.password,
+                        token=self.token,
+                        tenant_id=self.tenant_id,
+                        tenant_name=self.tenant_name,
+                        trust_id=self.trust_id)
+        return elements
+
     def get_auth_data(self, headers):
         """Identity v2 token authentication data."""
         if self.token is None:
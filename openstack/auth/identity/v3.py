@@ -55,6 +55,7 @@ class Auth(base.BaseIdentityPlugin):
         'project_name',
         'reauthenticate',
         'token',
+        'token_cache',
         'trust_id',
         'user_domain_id',
         'user_domain_name',
@@ -73,6 +74,7 @@ class Auth(base.BaseIdentityPlugin):
                  project_name=None,
                  reauthenticate=True,
                  token=None,
+                 token_cache=None,
                  trust_id=None,
                  user_domain_id=None,
                  user_domain_name=None,
@@ -96,6 +98,8 @@ class Auth(base.BaseIdentityPlugin):
         :param string project_name: Project name for project scoping.
         :param bool reauthenticate: Get new token if token expires.
         :param string token: Token to use for authentication.
+        :param token_cache: Cache to share tokens through.
+        :type token_cache: :class:`~openstack.auth.token_cache.BaseTokenCache`
         :param string trust_id: Trust ID for trust scoping.
         :param string user_domain_id: User's domain ID for authentication.
         :param string user_domain_name: User's domain name for authentication.
@@ -107,7 +111,8 @@ class Auth(base.BaseIdentityPlugin):
         """
 
         super(Auth, self).__init__(auth_url=auth_url,
-                                   reauthenticate=reauthenticate)
+                                   reauthenticate=reauthenticate,
+                                   token_cache=token_cache)
 
         if not (user_id or user_name or token):
             msg = 'You need to specify either a user_name, user_id or token'
@@ -198,6 +203,26 @@ class Auth(base.BaseIdentityPlugin):
         return access.AccessInfoV3(resp.headers['X-Subject-Token'],
                                    **resp_data)
 
+    def get_cache_id_elements(self):
+        """Identity v3 credentials and scope identifying the token."""
+        elements = super(Auth, self).get_cache_id_elements()
+        password = self.password_method
+        elements.update(password=password.password,
+                        user_id=password.user_id,
+                        user_name=password.user_name,
+                        user_domain_id=password.user_domain_id,
+                        user_domain_name=password.user_domain_name,
+                        token=(self.token_method.token
+                               if self.token_method else None),
+                        domain_id=self.domain_id,
+                        domain_name=self.domain_name,
+                        project_id=self.project_id,
+                        project_name=self.project_name,
+                        project_domain_id=self.project_domain_id,
+                        project_domain_name=self.project_domain_name,
+                        trust_id=self.trust_id)
+        return elements
+
     def invalidate(self):
         """Invalidate the current authentication data."""
         if super(Auth, self).invalidate():
@@ -16,7 +16,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import re
 
 import six
@@ -32,9 +31,17 @@ class ServiceCatalog(object):
         if catalog is None:
             self.catalog = []
             raise exceptions.EmptyCatalog('The service catalog is missing')
-        self.catalog = copy.deepcopy(catalog)
+        # Only the service and endpoint dicts are modified while parsing,
+        # so those are all that need to be copied.
+        self.catalog = []
+        for service in catalog:
+            service = dict(service)
+            service['endpoints'] = [dict(endpoint) for endpoint
+                                    in service.get('endpoints', [])]
+            self.catalog.append(service)
         self._normalize()
         self._parse_endpoints()
+        self._build_index()
 
     def _normalize(self):
         return
@@ -61,6 +68,31 @@ class ServiceCatalog(object):
                 split[2] = path
                 endpoint['url'] = parse.urlunsplit(split)
 
+    def _build_index(self):
+        """Index the endpoints by service type, region and interface.
+
+        Every endpoint is also filed under ``None`` for region and interface,
+        so a filter that leaves either unset finds its endpoints, already in
+        catalog order, in a single bucket.
+        """
+        self._index = {}
+        position = 0
+        for service in self.catalog:
+            regions = self._index.setdefault(service.get('type'), {})
+            name = service.get('name')
+            for endpoint in service['endpoints']:
+                url = endpoint.get('url', None)
+                if not url:
+                    continue
+                entry = (position, name, url, endpoint.get('version', None))
+                position += 1
+                region = endpoint.get('region', None)
+                interface = endpoint.get('interface', None)
+                for r in set([None, region]):
+                    interfaces = regions.setdefault(r, {})
+                    for i in set([None, interface]):
+                        interfaces.setdefault(i, []).append(entry)
+
     def _get_endpoints(self, filtration):
         """Fetch and filter urls and version tuples for the specified service.
 
@@ -68,23 +100,22 @@ class ServiceCatalog(object):
         service (or all) containing the specified type, name, region and
         visibility.
         """
-        eps = []
-        for service in self.catalog:
-            if not filtration.match_service_type(service.get('type')):
-                continue
-            if not filtration.match_service_name(service.get('name')):
-                continue
-            for endpoint in service.get('endpoints', []):
-                if not filtration.match_region(endpoint.get('region', None)):
-                    continue
-                if not filtration.match_visibility(endpoint.get('interface')):
-                    continue
-                url = endpoint.get('url', None)
-                if not url:
-                    continue
-                version = endpoint.get('version', None)
-                eps.append((url, version))
-        return eps
+        if filtration.service_type == filtration.ANY:
+            services = list(self._index.values())
+        else:
+            services = [self._index.get(filtration.service_type, {})]
+
+        buckets = []
+        for regions in services:
+            interfaces = regions.get(filtration.region or None, {})
+            buckets.append(interfaces.get(filtration.visibility or None, []))
+
+        if len(buckets) == 1:
+            entries = buckets[0]
+        else:
+            entries = sorted(entry for bucket in buckets for entry in bucket)
+        return [(url, version) for position, name, url, version in entries
+                if filtration.match_service_name(name)]
 
     def get_urls(self, filtration):
         """Fetch the urls based on the given service filter.
@@ -127,11 +158,12 @@ class ServiceCatalog(object):
         :param ServiceFilter service: The filter to identify the desired
                                       service.
         """
-        urls = self.get_urls(service)
-        if len(urls) < 1:
+        endpoints = self._get_endpoints(service)
+        if len(endpoints) < 1:
             message = "Endpoint not found for %s" % six.text_type(service)
             raise exceptions.EndpointNotFound(message)
-        return urls[0]
+        url, version = endpoints[0]
+        return url % {'version': service.get_version_path(version)}
 
 
 class ServiceCatalogV2(ServiceCatalog):
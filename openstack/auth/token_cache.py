@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Token caches let identity plugins share a token between processes.  A plugin
+constructed with a ``token_cache`` looks in the cache before authenticating
+and stores every new token it fetches, so many short lived processes using
+the same credentials only authenticate once per token lifetime.  For
+example::
+
+    from openstack.auth import token_cache
+    from openstack import connection
+
+    cache = token_cache.FileTokenCache()
+    conn = connection.Connection(auth_url='https://10.1.1.1:5000/v3/',
+                                 user_name='alibaba',
+                                 password='openSesame',
+                                 project_name='thieves',
+                                 token_cache=cache)
+
+Cached entries are keyed by the plugin's
+:meth:`~openstack.auth.identity.base.BaseIdentityPlugin.get_cache_id`, which
+is derived from the authorization URL, credentials and scope.
+"""
+
+import abc
+import contextlib
+import json
+import logging
+import os
+import stat
+import tempfile
+
+import six
+
+from openstack.auth import access
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_logger = logging.getLogger(__name__)
+
+
+@six.add_metaclass(abc.ABCMeta)
+class BaseTokenCache(object):
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Return the cached AccessInfo for a key or None if there is none."""
+
+    @abc.abstractmethod
+    def set(self, key, access_info):
+        """Store an AccessInfo under a key."""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """Remove the entry for a key if there is one."""
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Hold a lock on a key while fetching a token for it.
+
+        Caches shared between processes should override this so only one
+        process authenticates while the others wait and use its token.
+        """
+        yield
+
+
+class FileTokenCache(BaseTokenCache):
+    """A token cache storing one JSON file per key in a private directory.
+
+    The directory is created readable only by the current user and entries
+    are written with the same restriction.  Entries that are readable by
+    anyone else are ignored.  Files are replaced atomically so readers never
+    see partial entries, and on platforms with ``fcntl`` an exclusive lock
+    file serializes authentication between processes.
+    """
+
+    def __init__(self, directory=None):
+        """Create a file backed token cache.
+
+        :param string directory: Where to keep the cache.  Defaults to
+            ``openstack/tokens`` under ``$XDG_CACHE_HOME`` or ``~/.cache``.
+        """
+        if directory is None:
+            base = (os.environ.get('XDG_CACHE_HOME') or
+                    os.path.join(os.path.expanduser('~'), '.cache'))
+            directory = os.path.join(base, 'openstack', 'tokens')
+        self.directory = directory
+
+    def _path(self, key, suffix='.json'):
+        return os.path.join(self.directory, key + suffix)
+
+    def _ensure_directory(self):
+        try:
+            os.makedirs(self.directory, 0o700)
+        except OSError:
+            if not os.path.isdir(self.directory):
+                raise
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                mode = os.fstat(f.fileno()).st_mode
+                if mode & (stat.S_IRWXG | stat.S_IRWXO):
+                    _logger.warn("Ignoring token cache %s, it is readable "
+                                 "by other users", path)
+                    return None
+                data = json.load(f)
+            return access.AccessInfo.factory(**data)
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            _logger.warn("Ignoring unreadable token cache %s: %s", path, e)
+            return None
+
+    def set(self, key, access_info):
+        self._ensure_directory()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.' + key)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(access_info._info, f)
+            os.rename(tmp, self._path(key))
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        if fcntl is None:
+            yield
+            return
+        self._ensure_directory()
+        fd = os.open(self._path(key, '.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
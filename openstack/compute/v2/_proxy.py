@@ -29,8 +29,8 @@ class Proxy(object):
     def find_extension(self, name_or_id):
         return extension.Extension.find(self.session, name_or_id)
 
-    def list_extensions(self):
-        return extension.Extension.list(self.session)
+    def list_extensions(self, **params):
+        return extension.Extension.list(self.session, **params)
 
     def create_flavor(self, **data):
         return flavor.Flavor(data).create(self.session)
@@ -41,6 +41,9 @@ class Proxy(object):
     def find_flavor(self, name_or_id):
         return flavor.Flavor.find(self.session, name_or_id)
 
+    def find_flavors(self, names_or_ids):
+        return flavor.Flavor.find_many(self.session, names_or_ids)
+
     def get_flavor(self, **data):
         return flavor.Flavor(data).get(self.session)
 
@@ -59,11 +62,14 @@ class Proxy(object):
     def find_image(self, name_or_id):
         return image.Image.find(self.session, name_or_id)
 
+    def find_images(self, names_or_ids):
+        return image.Image.find_many(self.session, names_or_ids)
+
     def get_image(self, **data):
         return image.Image(data).get(self.session)
 
-    def list_images(self):
-        return image.Image.list(self.session)
+    def list_images(self, **params):
+        return image.Image.list(self.session, **params)
 
     def update_image(self, **data):
         return image.Image(data).update(self.session)
@@ -89,14 +95,14 @@ class Proxy(object):
     def find_limits_absolute(self, name_or_id):
         return limits_absolute.LimitsAbsolute.find(self.session, name_or_id)
 
-    def list_limits_absolute(self):
-        return limits_absolute.LimitsAbsolute.list(self.session)
+    def list_limits_absolute(self, **params):
+        return limits_absolute.LimitsAbsolute.list(self.session, **params)
 
     def find_limits_rate(self, name_or_id):
         return limits_rate.LimitsRate.find(self.session, name_or_id)
 
-    def list_limits_rate(self):
-        return limits_rate.LimitsRate.list(self.session)
+    def list_limits_rate(self, **params):
+        return limits_rate.LimitsRate.list(self.session, **params)
 
     def create_server(self, **data):
         return server.Server(data).create(self.session)
@@ -107,11 +113,14 @@ class Proxy(object):
     def find_server(self, name_or_id):
         return server.Server.find(self.session, name_or_id)
 
+    def find_servers(self, names_or_ids):
+        return server.Server.find_many(self.session, names_or_ids)
+
     def get_server(self, **data):
         return server.Server(data).get(self.session)
 
-    def list_servers(self):
-        return server.Server.list(self.session)
+    def list_servers(self, **params):
+        return server.Server.list(self.session, **params)
 
     def update_server(self, **data):
         return server.Server(data).update(self.session)
@@ -131,8 +140,8 @@ class Proxy(object):
     def get_server_interface(self, **data):
         return server_interface.ServerInterface(data).get(self.session)
 
-    def list_server_interfaces(self):
-        return server_interface.ServerInterface.list(self.session)
+    def list_server_interfaces(self, **params):
+        return server_interface.ServerInterface.list(self.session, **params)
 
     def update_server_interface(self, **data):
         return server_interface.ServerInterface(data).update(self.session)
@@ -140,5 +149,5 @@ class Proxy(object):
     def find_server_ip(self, name_or_id):
         return server_ip.ServerIP.find(self.session, name_or_id)
 
-    def list_server_ips(self):
-        return server_ip.ServerIP.list(self.session)
+    def list_server_ips(self, **params):
+        return server_ip.ServerIP.list(self.session, **params)
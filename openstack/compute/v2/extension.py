@@ -22,6 +22,7 @@ class Extension(resource.Resource):
 
     # capabilities
     allow_list = True
+    next_links = True
 
     # Properties
     alias = resource.prop('alias')
@@ -26,6 +26,7 @@ class Flavor(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    next_links = True
 
     # Properties
     disk = resource.prop('disk', type=int)
@@ -26,6 +26,7 @@ class Image(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    next_links = True
 
     # Properties
     created = resource.prop('created')
@@ -29,6 +29,7 @@ class Keypair(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    next_links = True
 
     # Properties
     fingerprint = resource.prop('fingerprint')
@@ -30,9 +30,13 @@ class LimitsAbsolute(resource.Resource):
     value = resource.prop('value')
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path
         resp = session.get(url, service=cls.service, params=params).body
         resp = resp['limits']['absolute']
-        return [cls.existing(name=key, value=value)
+        data = [{'name': key, 'value': value}
                 for key, value in six.iteritems(resp)]
+        if raw:
+            return data
+        return [cls.existing(**item) for item in data]
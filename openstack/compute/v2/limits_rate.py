@@ -29,8 +29,11 @@ class LimitsRate(resource.Resource):
     uri = resource.prop('uri')
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path
         resp = session.get(url, service=cls.service, params=params).body
         resp = resp['limits']['rate']
+        if raw:
+            return resp
         return [cls.existing(**data) for data in resp]
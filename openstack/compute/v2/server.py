@@ -31,6 +31,7 @@ class Server(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    next_links = True
 
     # Properties
     access_ipv4 = resource.prop('accessIPv4')
@@ -27,6 +27,7 @@ class ServerInterface(resource.Resource):
     allow_update = False
     allow_delete = True
     allow_list = True
+    next_links = True
 
     # Properties
     fixed_ips = resource.prop('fixed_ips')
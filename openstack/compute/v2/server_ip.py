@@ -33,7 +33,8 @@ class ServerIP(resource.Resource):
     version = resource.prop('version')
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path % path_args
         resp = session.get(url, service=cls.service, params=params)
         ray = []
@@ -45,5 +46,5 @@ class ServerIP(resource.Resource):
                     'version': address['version'],
                     'addr': address['addr'],
                 }
-                ray.append(cls.existing(**record))
+                ray.append(record if raw else cls.existing(**record))
         return ray
@@ -41,6 +41,7 @@ class ServerMeta(resource.Resource):
         url = utils.urljoin(url, resource_id)
         body = {cls.resource_key: {attrs['key']: attrs['value']}}
         resp = session.put(url, service=cls.service, json=body).body
+        cls._invalidate_find(session)
         return {'key': resource_id,
                 'value': resp[cls.resource_key][resource_id]}
 
@@ -62,12 +63,17 @@ class ServerMeta(resource.Resource):
         url = cls.base_path % path_args
         url = utils.urljoin(url, resource_id)
         session.delete(url, service=cls.service, accept=None)
+        cls._invalidate_find(session)
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = '/servers/%(server_id)s/metadata' % path_args
         resp = session.get(url, service=cls.service, params=params).body
         resp = resp['metadata']
-        return [cls.existing(server_id=path_args['server_id'], key=key,
-                             value=value)
+        data = [{'server_id': path_args['server_id'], 'key': key,
+                 'value': value}
                 for key, value in six.iteritems(resp)]
+        if raw:
+            return data
+        return [cls.existing(**item) for item in data]
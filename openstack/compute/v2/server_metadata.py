@@ -35,6 +35,7 @@ class ServerMetadata(resource.Resource):
         body = {"metadata": no_id}
         url = cls.base_path % path_args
         resp = session.put(url, service=cls.service, json=body).body
+        cls._invalidate_find(session)
         attrs = resp["metadata"].copy()
         attrs['server_id'] = resource_id
         return attrs
@@ -59,6 +59,7 @@ try to find it and if that fails, you would create it::
 """
 import logging
 import sys
+import threading
 
 from openstack import module_loader
 from openstack import session
@@ -71,6 +72,10 @@ class Connection(object):
 
     def __init__(self, transport=None, authenticator=None, preference=None,
                  verify=True, user_agent=None,
+                 pool_connections=xport.Transport.DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=xport.Transport.DEFAULT_POOL_MAXSIZE,
+                 pool_block=xport.Transport.DEFAULT_POOL_BLOCK,
+                 max_retries=xport.Transport.DEFAULT_MAX_RETRIES,
                  auth_plugin=None, **auth_args):
         """Create a context for a connection to a cloud provider.
 
@@ -108,6 +113,18 @@ class Connection(object):
             specified in :attr:`~openstack.transport.USER_AGENT`.
             The resulting ``user_agent`` value is used for the ``User-Agent``
             HTTP header.
+        :param int pool_connections: If a transport is not provided to the
+            connection, the number of hosts the created transport keeps
+            connection pools for.
+        :param int pool_maxsize: If a transport is not provided to the
+            connection, the number of connections the created transport
+            keeps open to each host.
+        :param bool pool_block: If a transport is not provided to the
+            connection, whether the created transport waits for a free
+            connection when a host's pool is exhausted.
+        :param int max_retries: If a transport is not provided to the
+            connection, the number of times the created transport retries
+            a failed connection attempt.
         :param str auth_plugin: The name of authentication plugin to use.  If
             the authentication plugin name is not provided, the connection will
             try to guess what plugin to use based on the *auth_url* in the
@@ -117,7 +134,12 @@ class Connection(object):
             authentication arguments that are used by the authentication
             plugin.
         """
-        self.transport = self._create_transport(transport, verify, user_agent)
+        self.transport = self._create_transport(
+            transport, verify, user_agent,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries)
         self.authenticator = self._create_authenticator(authenticator,
                                                         auth_plugin,
                                                         **auth_args)
@@ -125,10 +147,11 @@ class Connection(object):
                                        preference)
         self._open()
 
-    def _create_transport(self, transport, verify, user_agent):
+    def _create_transport(self, transport, verify, user_agent, **pool_args):
         if transport:
             return transport
-        return xport.Transport(verify=verify, user_agent=user_agent)
+        return xport.Transport(verify=verify, user_agent=user_agent,
+                               **pool_args)
 
     def _create_authenticator(self, authenticator, auth_plugin, **auth_args):
         if authenticator:
@@ -141,10 +164,13 @@ class Connection(object):
     def _open(self):
         """Open the connection.
 
-        NOTE(thowe): Have this set up some lazy loader instead.
+        Service proxies are loaded on first access of their attribute, so
+        applications only pay for importing the services they use.
         """
+        self._services = {}
+        self._services_lock = threading.Lock()
         for service in self.session.get_services():
-            self._load(service)
+            self._services[service.get_service_module()] = service
 
     def _load(self, service):
         attr_name = service.get_service_module()
@@ -156,6 +182,27 @@ class Connection(object):
         except Exception as e:
             _logger.warn("Unable to load %s: %s" % (module, e))
 
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, which for a service is
+        # until its proxy has been loaded onto the instance.
+        lock = self.__dict__.get('_services_lock')
+        if lock is not None:
+            # Another thread may be loading the proxy, so wait for it
+            # before deciding that the attribute doesn't exist.
+            with lock:
+                service = self._services.pop(name, None)
+                if service is not None:
+                    # Whether or not it loads, don't try again.
+                    self._load(service)
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def __dir__(self):
+        names = set(dir(self.__class__)) | set(self.__dict__)
+        return sorted(names | set(self.__dict__.get('_services', {})))
+
     def create(self, obj):
         """Create an object.
 
@@ -30,8 +30,8 @@ class Proxy(object):
     def find_database(self, name_or_id):
         return database.Database.find(self.session, name_or_id)
 
-    def list_database(self):
-        return database.Database.list(self.session)
+    def list_database(self, **params):
+        return database.Database.list(self.session, **params)
 
     def find_flavor(self, name_or_id):
         return flavor.Flavor.find(self.session, name_or_id)
@@ -39,8 +39,8 @@ class Proxy(object):
     def get_flavor(self, **data):
         return flavor.Flavor(data).get(self.session)
 
-    def list_flavor(self):
-        return flavor.Flavor.list(self.session)
+    def list_flavor(self, **params):
+        return flavor.Flavor.list(self.session, **params)
 
     def create_instance(self, **data):
         return instance.Instance(data).create(self.session)
@@ -54,8 +54,8 @@ class Proxy(object):
     def get_instance(self, **data):
         return instance.Instance(data).get(self.session)
 
-    def list_instance(self):
-        return instance.Instance.list(self.session)
+    def list_instance(self, **params):
+        return instance.Instance.list(self.session, **params)
 
     def update_instance(self, **data):
         return instance.Instance(data).update(self.session)
@@ -69,5 +69,5 @@ class Proxy(object):
     def find_user(self, name_or_id):
         return user.User.find(self.session, name_or_id)
 
-    def list_user(self):
-        return user.User.list(self.session)
+    def list_user(self, **params):
+        return user.User.list(self.session, **params)
@@ -52,4 +52,5 @@ class User(resource.Resource):
         # Create expects an array of users
         body = {'users': [attrs]}
         resp = session.post(url, service=cls.service, json=body).body
+        cls._invalidate_find(session)
         return resp
@@ -0,0 +1,107 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A :class:`~openstack.find_cache.FindCache` remembers the results of
+:meth:`~openstack.resource.Resource.find` for a session, so resolving the
+same names and ids again doesn't cost one or two listings each time::
+
+    from openstack import find_cache
+    from openstack import session
+    sess = session.Session(xport, auther, find_cache=find_cache.FindCache())
+
+Results are kept for ``ttl`` seconds and the least recently used ones are
+evicted once there are ``max_size`` of them.  Creating, updating or deleting
+a resource through the same session drops the cached results for its
+resource class, as it may have changed which names resolve to what.
+Changes made by other clients are only seen once the results expire.
+"""
+
+import collections
+import threading
+import time
+
+
+class FindCache(object):
+
+    def __init__(self, ttl=60, max_size=1000, clock=time.time):
+        """Create a cache for find results.
+
+        :param float ttl: The number of seconds a result is kept.
+        :param int max_size: The number of results kept at most.
+        :param clock: A function returning the current time in seconds.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (result, expiry), from the least to the most recently used
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(resource_cls, name_or_id, path_args=None):
+        """Build the key of a lookup, None if it can't be cached."""
+        if path_args:
+            try:
+                path_args = tuple(sorted(path_args.items()))
+                hash(path_args)
+            except TypeError:
+                return None
+        else:
+            path_args = None
+        return (resource_cls, name_or_id, path_args)
+
+    def get(self, key):
+        """Get a cached result.
+
+        :returns: A tuple of whether a valid result was cached and the
+            result, which is None when nothing was found.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[1] <= self._clock():
+                self.misses += 1
+                return False, None
+            # Put it back as the most recently used.
+            self._entries[key] = entry
+            self.hits += 1
+            return True, entry[0]
+
+    def set(self, key, result):
+        """Cache the result of a lookup."""
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                if len(self._entries) >= self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            self._entries[key] = (result, self._clock() + self.ttl)
+
+    def invalidate(self, resource_cls):
+        """Drop the cached results for a resource class."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] is resource_cls]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all the cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """Return the hit, miss and eviction counters and the size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._entries)}
@@ -32,8 +32,8 @@ class Proxy(object):
     def get_role(self, **data):
         return role.Role(data).get(self.session)
 
-    def list_roles(self):
-        return role.Role.list(self.session)
+    def list_roles(self, **params):
+        return role.Role.list(self.session, **params)
 
     def update_role(self, **data):
         return role.Role(data).update(self.session)
@@ -50,8 +50,8 @@ class Proxy(object):
     def get_tenant(self, **data):
         return tenant.Tenant(data).get(self.session)
 
-    def list_tenants(self):
-        return tenant.Tenant.list(self.session)
+    def list_tenants(self, **params):
+        return tenant.Tenant.list(self.session, **params)
 
     def update_tenant(self, **data):
         return tenant.Tenant(data).update(self.session)
@@ -68,8 +68,8 @@ class Proxy(object):
     def get_user(self, **data):
         return user.User(data).get(self.session)
 
-    def list_users(self):
-        return user.User.list(self.session)
+    def list_users(self, **params):
+        return user.User.list(self.session, **params)
 
     def update_user(self, **data):
         return user.User(data).update(self.session)
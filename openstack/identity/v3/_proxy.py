@@ -37,8 +37,8 @@ class Proxy(object):
     def get_credential(self, **data):
         return credential.Credential(data).get(self.session)
 
-    def list_credentials(self):
-        return credential.Credential.list(self.session)
+    def list_credentials(self, **params):
+        return credential.Credential.list(self.session, **params)
 
     def update_credential(self, **data):
         return credential.Credential(data).update(self.session)
@@ -55,8 +55,8 @@ class Proxy(object):
     def get_domain(self, **data):
         return domain.Domain(data).get(self.session)
 
-    def list_domains(self):
-        return domain.Domain.list(self.session)
+    def list_domains(self, **params):
+        return domain.Domain.list(self.session, **params)
 
     def update_domain(self, **data):
         return domain.Domain(data).update(self.session)
@@ -73,8 +73,8 @@ class Proxy(object):
     def get_endpoint(self, **data):
         return endpoint.Endpoint(data).get(self.session)
 
-    def list_endpoints(self):
-        return endpoint.Endpoint.list(self.session)
+    def list_endpoints(self, **params):
+        return endpoint.Endpoint.list(self.session, **params)
 
     def update_endpoint(self, **data):
         return endpoint.Endpoint(data).update(self.session)
@@ -91,8 +91,8 @@ class Proxy(object):
     def get_group(self, **data):
         return group.Group(data).get(self.session)
 
-    def list_groups(self):
-        return group.Group.list(self.session)
+    def list_groups(self, **params):
+        return group.Group.list(self.session, **params)
 
     def update_group(self, **data):
         return group.Group(data).update(self.session)
@@ -109,8 +109,8 @@ class Proxy(object):
     def get_policy(self, **data):
         return policy.Policy(data).get(self.session)
 
-    def list_policys(self):
-        return policy.Policy.list(self.session)
+    def list_policys(self, **params):
+        return policy.Policy.list(self.session, **params)
 
     def update_policy(self, **data):
         return policy.Policy(data).update(self.session)
@@ -127,8 +127,8 @@ class Proxy(object):
     def get_project(self, **data):
         return project.Project(data).get(self.session)
 
-    def list_projects(self):
-        return project.Project.list(self.session)
+    def list_projects(self, **params):
+        return project.Project.list(self.session, **params)
 
     def update_project(self, **data):
         return project.Project(data).update(self.session)
@@ -145,8 +145,8 @@ class Proxy(object):
     def get_service(self, **data):
         return service.Service(data).get(self.session)
 
-    def list_services(self):
-        return service.Service.list(self.session)
+    def list_services(self, **params):
+        return service.Service.list(self.session, **params)
 
     def update_service(self, **data):
         return service.Service(data).update(self.session)
@@ -163,8 +163,8 @@ class Proxy(object):
     def get_user(self, **data):
         return user.User(data).get(self.session)
 
-    def list_users(self):
-        return user.User.list(self.session)
+    def list_users(self, **params):
+        return user.User.list(self.session, **params)
 
     def update_user(self, **data):
         return user.User(data).update(self.session)
@@ -31,7 +31,7 @@ class Version(resource.Resource):
     updated = resource.prop('updated')
 
     @classmethod
-    def list(cls, session, **params):
+    def list(cls, session, raw=False, prefetch=0, stream=False, **params):
         resp = session.get(cls.base_path, service=cls.service, params=params)
         for data in resp.body[cls.resources_key]['values']:
-            yield cls.existing(**data)
+            yield data if raw else cls.existing(**data)
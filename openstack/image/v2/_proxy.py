@@ -29,6 +29,9 @@ class Proxy(object):
     def find_image(self, name_or_id):
         return image.Image.find(self.session, name_or_id)
 
+    def find_images(self, names_or_ids):
+        return image.Image.find_many(self.session, names_or_ids)
+
     def get_image(self, **data):
         return image.Image(data).get(self.session)
 
@@ -40,4 +40,11 @@ class Image(resource.Resource):
     tags = resource.prop('tags')
     updated_at = resource.prop('updated_at')
     virtual_size = resource.prop('virtual_size')
-    visibility = resource.prop('visibility')
\ No newline at end of file
+    visibility = resource.prop('visibility')
+
+    @classmethod
+    def _should_page(cls, response, data, limit, total):
+        if not super(Image, cls)._should_page(response, data, limit, total):
+            return False
+        # Glance links the next page from the body while there is one.
+        return 'next' in response.body
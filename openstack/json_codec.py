@@ -0,0 +1,153 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The JSON codecs a :class:`~openstack.transport.Transport` can encode request
+bodies and decode response bodies with.
+
+Encoding and decoding large listings and bulk requests costs a fair amount
+of CPU with the standard library's :mod:`json`, so by default a transport
+uses the fastest codec installed, in this order:
+
+* ``orjson``
+* ``ujson``
+* ``simplejson``, only on Python 2 and when its C speedups are built, as
+  the standard library's :mod:`json` is generally faster on Python 3
+* the standard library's :mod:`json`
+
+``tools/bench_json.py`` compares them on typical Nova, Neutron and Swift
+listings.
+
+A codec can also be chosen by name, or given as any object with ``dumps``
+and ``loads`` methods::
+
+    from openstack import json_codec
+    from openstack import transport
+    xport = transport.Transport(json_codec='json')
+    xport = transport.Transport(json_codec=json_codec.get_codec('ujson'))
+
+``loads`` is given the raw bytes of a body, it must raise ``ValueError``
+when they aren't valid JSON.  ``dumps`` may return text or UTF-8 bytes.
+"""
+
+import json
+
+import six
+
+
+class JSONCodec(object):
+    """The standard library's :mod:`json`, always available."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, data):
+        if isinstance(data, six.binary_type) and not six.PY2:
+            # Before Python 3.6 json only decodes text.
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class OrjsonCodec(object):
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        # Like json, encode the int keys some bodies have as strings.
+        self._option = getattr(orjson, 'OPT_NON_STR_KEYS', 0)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj, option=self._option)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(object):
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, escape_forward_slashes=False)
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+
+class SimplejsonCodec(object):
+
+    name = 'simplejson'
+
+    def __init__(self):
+        import simplejson
+        # Without its C extension simplejson is slower than json.
+        if simplejson.encoder.c_make_encoder is None:
+            raise ImportError('simplejson speedups are not available')
+        self._simplejson = simplejson
+
+    def dumps(self, obj):
+        return self._simplejson.dumps(obj)
+
+    def loads(self, data):
+        return self._simplejson.loads(data)
+
+
+#: The codecs by name, in the order they are preferred.
+CODECS = (
+    ('orjson', OrjsonCodec),
+    ('ujson', UjsonCodec),
+    ('simplejson', SimplejsonCodec),
+    ('json', JSONCodec),
+)
+
+#: The codecs chosen from by default.
+DEFAULT_CODECS = ('orjson', 'ujson', 'simplejson', 'json')
+if not six.PY2:
+    DEFAULT_CODECS = ('orjson', 'ujson', 'json')
+
+_default = None
+
+
+def get_codec(name=None):
+    """Get a codec.
+
+    :param str name: The name of the codec, or None for the fastest one
+        installed.
+
+    :raises: ``ValueError`` if the name is unknown and ``ImportError`` if
+        the codec's module isn't installed.
+    """
+    global _default
+    if name is not None:
+        for codec_name, codec_cls in CODECS:
+            if codec_name == name:
+                return codec_cls()
+        raise ValueError('Unknown JSON codec %r' % name)
+
+    if _default is None:
+        for codec_name, codec_cls in CODECS:
+            if codec_name not in DEFAULT_CODECS:
+                continue
+            try:
+                _default = codec_cls()
+            except ImportError:
+                continue
+            break
+    return _default
@@ -0,0 +1,151 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Incremental decoding of the array in a JSON document, so that the items of a
+large listing can be used as soon as they are received rather than once the
+whole response has been read and decoded::
+
+    resp = sess.get('/servers/detail', service=filt, stream=True)
+    servers = json_stream.ArrayStream(resp.iter_content(65536), 'servers')
+    for server in servers:
+        ...
+    links = servers.body.get('servers_links')
+
+Only the items are decoded one at a time, each with the standard library's
+decoder.  The other members of the object, such as pagination links, are
+decoded as a whole and available from ``body`` once the items have all been
+read.  Memory use is bounded by the size of an item plus a chunk.
+"""
+
+import codecs
+import json
+
+import six
+
+_WHITESPACE = ' \t\n\r'
+
+
+class ArrayStream(object):
+
+    def __init__(self, chunks, key=None, encoding='utf-8'):
+        """Decode the items of a JSON array from chunks of a document.
+
+        :param chunks: An iterable of the bytes of the document.
+        :param str key: The member of the top level object that holds the
+            array, or None if the document is the array itself.
+        :param str encoding: The encoding of the document.
+        """
+        self.key = key
+        #: The other members of the top level object, complete once all the
+        #: items have been read.
+        self.body = {}
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Read another chunk, returns False at the end of the document."""
+        if self._eof:
+            return False
+        # Drop what was consumed so the buffer doesn't grow with the list.
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, six.binary_type):
+                chunk = self._text.decode(chunk)
+            if chunk:
+                self._buf += chunk
+                return True
+        self._buf += self._text.decode(b'', True)
+        self._eof = True
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON document')
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char not in chars:
+            raise ValueError('Expected %s at position %d, got %r' %
+                             (' or '.join(chars), self._pos, char))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode the next value, reading as much as it needs."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may go on in the next chunk.
+            if end < len(self._buf) or self._eof:
+                self._pos = end
+                return value
+            if not self._fill():
+                self._pos = end
+                return value
+
+    def _items(self):
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _members(self, stop_at_key):
+        """Decode members into body, stopping before the key's value."""
+        while True:
+            name = self._value()
+            self._expect(':')
+            if stop_at_key and name == self.key:
+                return True
+            self.body[name] = self._value()
+            if self._expect(',}') == '}':
+                return False
+
+    def __iter__(self):
+        if self.key is None:
+            self._expect('[')
+            for item in self._items():
+                yield item
+            return
+
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        if not self._members(True):
+            return
+        self._expect('[')
+        for item in self._items():
+            yield item
+        if self._expect(',}') == ',':
+            self._members(False)
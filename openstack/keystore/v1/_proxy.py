@@ -32,8 +32,8 @@ class Proxy(object):
     def get_container(self, **data):
         return container.Container(data).get(self.session)
 
-    def list_container(self):
-        return container.Container.list(self.session)
+    def list_container(self, **params):
+        return container.Container.list(self.session, **params)
 
     def update_container(self, **data):
         return container.Container(data).update(self.session)
@@ -50,8 +50,8 @@ class Proxy(object):
     def get_order(self, **data):
         return order.Order(data).get(self.session)
 
-    def list_order(self):
-        return order.Order.list(self.session)
+    def list_order(self, **params):
+        return order.Order.list(self.session, **params)
 
     def update_order(self, **data):
         return order.Order(data).update(self.session)
@@ -68,8 +68,8 @@ class Proxy(object):
     def get_secret(self, **data):
         return secret.Secret(data).get(self.session)
 
-    def list_secret(self):
-        return secret.Secret.list(self.session)
+    def list_secret(self, **params):
+        return secret.Secret.list(self.session, **params)
 
     def update_secret(self, **data):
         return secret.Secret(data).update(self.session)
@@ -27,12 +27,17 @@ class Capability(resource.Resource):
     value = resource.prop('value')
 
     @classmethod
-    def page(cls, session, limit, marker=None, path_args=None, **params):
+    def _page(cls, session, limit, marker=None, path_args=None, **params):
         if marker:
-            return []
+            return [], None
 
-        resp = super(Capability, cls).page(session, limit,
-                                           marker, path_args, **params)
+        data, resp = super(Capability, cls)._page(session, limit,
+                                                  marker, path_args, **params)
 
         return [{"id": key, "value": value}
-                for key, value in six.iteritems(resp)]
+                for key, value in six.iteritems(data)], resp
+
+    @classmethod
+    def _should_page(cls, response, data, limit, total):
+        # All the capabilities come in one response.
+        return False
@@ -12,23 +12,59 @@
 
 """
 Load various modules for authorization and services.
+
+Plugins are found through entry points, which means scanning every installed
+distribution.  That is only done once per process, and not at all for the
+plugins that come with the SDK.
 """
-from stevedore import extension
+import sys
+import threading
 
 from openstack import exceptions
 
+AUTH_PLUGIN_NAMESPACE = "openstack.auth.plugin"
+
+#: The authorization plugins that come with the SDK, which are loaded
+#: without scanning entry points.  This must match ``setup.cfg``.
+BUILTIN_AUTH_PLUGINS = {
+    'identity': ('openstack.auth.identity.discoverable', 'Auth'),
+    'identity_v2': ('openstack.auth.identity.v2', 'Auth'),
+    'identity_v3': ('openstack.auth.identity.v3', 'Auth'),
+}
+
+_auth_mgr = None
+_auth_mgr_lock = threading.Lock()
+
+
+def _get_auth_mgr():
+    global _auth_mgr
+    with _auth_mgr_lock:
+        if _auth_mgr is None:
+            # Importing stevedore pulls in pkg_resources, which scans every
+            # installed distribution, so only do it when really needed.
+            from stevedore import extension
+            _auth_mgr = extension.ExtensionManager(
+                namespace=AUTH_PLUGIN_NAMESPACE,
+                invoke_on_load=False,
+            )
+        return _auth_mgr
+
 
 class ModuleLoader(object):
 
-    def __init__(self):
-        self.auth_mgr = extension.ExtensionManager(
-            namespace="openstack.auth.plugin",
-            invoke_on_load=False,
-        )
+    @property
+    def auth_mgr(self):
+        """The process wide manager of authorization plugin entry points."""
+        return _get_auth_mgr()
 
     def get_auth_plugin(self, plugin_name):
         if not plugin_name:
             plugin_name = 'identity'
+        builtin = BUILTIN_AUTH_PLUGINS.get(plugin_name)
+        if builtin is not None:
+            module, attr = builtin
+            __import__(module)
+            return getattr(sys.modules[module], attr)
         try:
             return self.auth_mgr[plugin_name].plugin
         except KeyError:
@@ -36,8 +36,8 @@ class Proxy(object):
     def find_extension(self, name_or_id):
         return extension.Extension.find(self.session, name_or_id)
 
-    def list_extensions(self):
-        return extension.Extension.list(self.session)
+    def list_extensions(self, **params):
+        return extension.Extension.list(self.session, **params)
 
     def create_ip(self, **data):
         return floating_ip.FloatingIP(data).create(self.session)
@@ -72,8 +72,8 @@ class Proxy(object):
     def get_health_monitor(self, **data):
         return health_monitor.HealthMonitor(data).get(self.session)
 
-    def list_health_monitors(self):
-        return health_monitor.HealthMonitor.list(self.session)
+    def list_health_monitors(self, **params):
+        return health_monitor.HealthMonitor.list(self.session, **params)
 
     def update_health_monitor(self, **data):
         return health_monitor.HealthMonitor(data).update(self.session)
@@ -90,8 +90,8 @@ class Proxy(object):
     def get_listener(self, **data):
         return listener.Listener(data).get(self.session)
 
-    def list_listeners(self):
-        return listener.Listener.list(self.session)
+    def list_listeners(self, **params):
+        return listener.Listener.list(self.session, **params)
 
     def update_listener(self, **data):
         return listener.Listener(data).update(self.session)
@@ -108,8 +108,8 @@ class Proxy(object):
     def get_load_balancer(self, **data):
         return load_balancer.LoadBalancer(data).get(self.session)
 
-    def list_load_balancers(self):
-        return load_balancer.LoadBalancer.list(self.session)
+    def list_load_balancers(self, **params):
+        return load_balancer.LoadBalancer.list(self.session, **params)
 
     def update_load_balancer(self, **data):
         return load_balancer.LoadBalancer(data).update(self.session)
@@ -126,8 +126,8 @@ class Proxy(object):
     def get_metering_label(self, **data):
         return metering_label.MeteringLabel(data).get(self.session)
 
-    def list_metering_labels(self):
-        return metering_label.MeteringLabel.list(self.session)
+    def list_metering_labels(self, **params):
+        return metering_label.MeteringLabel.list(self.session, **params)
 
     def update_metering_label(self, **data):
         return metering_label.MeteringLabel(data).update(self.session)
@@ -145,8 +145,9 @@ class Proxy(object):
     def get_metering_label_rule(self, **data):
         return metering_label_rule.MeteringLabelRule(data).get(self.session)
 
-    def list_metering_label_rules(self):
-        return metering_label_rule.MeteringLabelRule.list(self.session)
+    def list_metering_label_rules(self, **params):
+        return metering_label_rule.MeteringLabelRule.list(self.session,
+                                                          **params)
 
     def update_metering_label_rule(self, **data):
         return metering_label_rule.MeteringLabelRule(data).update(self.session)
@@ -160,6 +161,9 @@ class Proxy(object):
     def find_network(self, name_or_id):
         return network.Network.find(self.session, name_or_id)
 
+    def find_networks(self, names_or_ids):
+        return network.Network.find_many(self.session, names_or_ids)
+
     def get_network(self, **data):
         return network.Network(data).get(self.session)
 
@@ -181,8 +185,8 @@ class Proxy(object):
     def get_pool(self, **data):
         return pool.Pool(data).get(self.session)
 
-    def list_pools(self):
-        return pool.Pool.list(self.session)
+    def list_pools(self, **params):
+        return pool.Pool.list(self.session, **params)
 
     def update_pool(self, **data):
         return pool.Pool(data).update(self.session)
@@ -199,8 +203,8 @@ class Proxy(object):
     def get_pool_member(self, **data):
         return pool_member.PoolMember(data).get(self.session)
 
-    def list_pool_members(self):
-        return pool_member.PoolMember.list(self.session)
+    def list_pool_members(self, **params):
+        return pool_member.PoolMember.list(self.session, **params)
 
     def update_pool_member(self, **data):
         return pool_member.PoolMember(data).update(self.session)
@@ -214,6 +218,9 @@ class Proxy(object):
     def find_port(self, name_or_id):
         return port.Port.find(self.session, name_or_id)
 
+    def find_ports(self, names_or_ids):
+        return port.Port.find_many(self.session, names_or_ids)
+
     def get_port(self, **data):
         return port.Port(data).get(self.session)
 
@@ -240,8 +247,8 @@ class Proxy(object):
                     result.append(puerta)
         return result
 
-    def list_quotas(self):
-        return quota.Quota.list(self.session)
+    def list_quotas(self, **params):
+        return quota.Quota.list(self.session, **params)
 
     def create_router(self, **data):
         return router.Router(data).create(self.session)
@@ -252,6 +259,9 @@ class Proxy(object):
     def find_router(self, name_or_id):
         return router.Router.find(self.session, name_or_id)
 
+    def find_routers(self, names_or_ids):
+        return router.Router.find_many(self.session, names_or_ids)
+
     def get_router(self, **data):
         return router.Router(**data).get(self.session)
 
@@ -276,6 +286,10 @@ class Proxy(object):
     def find_security_group(self, name_or_id):
         return security_group.SecurityGroup.find(self.session, name_or_id)
 
+    def find_security_groups(self, names_or_ids):
+        return security_group.SecurityGroup.find_many(self.session,
+                                                      names_or_ids)
+
     def get_security_group(self, **data):
         return security_group.SecurityGroup(**data).get(self.session)
 
@@ -318,6 +332,9 @@ class Proxy(object):
     def find_subnet(self, name_or_id):
         return subnet.Subnet.find(self.session, name_or_id)
 
+    def find_subnets(self, names_or_ids):
+        return subnet.Subnet.find_many(self.session, names_or_ids)
+
     def get_subnet(self, **data):
         return subnet.Subnet(**data).get(self.session)
 
@@ -22,6 +22,8 @@ class Extension(resource.Resource):
 
     # capabilities
     allow_list = True
+    next_links = True
+    multi_value_filters = True
 
     # Properties
     alias = resource.prop('alias')
@@ -26,6 +26,8 @@ class LoadBalancer(resource.Resource):
     allow_update = True
     allow_delete = True
     allow_list = True
+    next_links = True
+    multi_value_filters = True
     put_update = True
 
     # Properties
@@ -22,6 +22,8 @@ class Quota(resource.Resource):
 
     # capabilities
     allow_list = True
+    next_links = True
+    multi_value_filters = True
 
     # Properties
     floating_ip = resource.prop('floatingip', type=int)
@@ -46,53 +46,62 @@ from openstack.network.v2 import security_group_rule as rule
 from openstack.network.v2 import subnet
 
 
+def _raw_list(cls):
+    """Make a list method that yields dicts instead of resources."""
+    def list_raw(session, limit=None, marker=None, path_args=None,
+                 **params):
+        return cls.list(session, limit=limit, marker=marker,
+                        path_args=path_args, raw=True, **params)
+    return staticmethod(list_raw)
+
+
 class Thin(object):
 
     create_ip = floating_ip.FloatingIP.create_by_id
     delete_ip = floating_ip.FloatingIP.delete_by_id
     find_ip = floating_ip.FloatingIP.find
     get_ip = floating_ip.FloatingIP.get_data_by_id
-    list_ips = floating_ip.FloatingIP.list
+    list_ips = _raw_list(floating_ip.FloatingIP)
     update_ip = floating_ip.FloatingIP.update_by_id
 
     create_network = network.Network.create_by_id
     delete_network = network.Network.delete_by_id
     find_network = network.Network.find
     get_network = network.Network.get_data_by_id
-    list_networks = network.Network.list
+    list_networks = _raw_list(network.Network)
     update_network = network.Network.update_by_id
 
     create_port = port.Port.create_by_id
     delete_port = port.Port.delete_by_id
     find_port = port.Port.find
     get_port = port.Port.get_data_by_id
-    list_ports = port.Port.list
+    list_ports = _raw_list(port.Port)
     update_port = port.Port.update_by_id
 
     create_router = router.Router.create_by_id
     delete_router = router.Router.delete_by_id
     find_router = router.Router.find
     get_router = router.Router.get_data_by_id
-    list_routers = router.Router.list
+    list_routers = _raw_list(router.Router)
     update_router = router.Router.update_by_id
 
     create_security_group = group.SecurityGroup.create_by_id
     delete_security_group = group.SecurityGroup.delete_by_id
     find_security_group = group.SecurityGroup.find
     get_security_group = group.SecurityGroup.get_data_by_id
-    list_security_groups = group.SecurityGroup.list
+    list_security_groups = _raw_list(group.SecurityGroup)
     update_security_group = group.SecurityGroup.update_by_id
 
     create_security_group_rule = rule.SecurityGroupRule.create_by_id
     delete_security_group_rule = rule.SecurityGroupRule.delete_by_id
     find_security_group_rule = rule.SecurityGroupRule.find
     get_security_group_rule = rule.SecurityGroupRule.get_data_by_id
-    list_security_group_rules = rule.SecurityGroupRule.list
+    list_security_group_rules = _raw_list(rule.SecurityGroupRule)
     update_security_group_rule = rule.SecurityGroupRule.update_by_id
 
     create_subnet = subnet.Subnet.create_by_id
     delete_subnet = subnet.Subnet.delete_by_id
     find_subnet = subnet.Subnet.find
     get_subnet = subnet.Subnet.get_data_by_id
-    list_subnets = subnet.Subnet.list
+    list_subnets = _raw_list(subnet.Subnet)
     update_subnet = subnet.Subnet.update_by_id
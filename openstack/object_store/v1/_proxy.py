@@ -137,7 +137,10 @@ class Proxy(object):
         # or downloading them is a hassle because the end-user would have
         # to maintain both the container and the object separately.
         for ob in objs:
-            ob.container = container.name
+            if kwargs.get('raw'):
+                ob['container'] = container.name
+            else:
+                ob.container = container.name
             yield ob
 
     def get_object_data(self, obj):
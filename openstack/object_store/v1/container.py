@@ -100,6 +100,17 @@ class Container(resource.Resource):
     #: has a copy of the object before any data is sent.
     if_none_match = resource.prop("if-none-match")
 
+    @classmethod
+    def _should_page(cls, response, data, limit, total):
+        more = super(Container, cls)._should_page(response, data, limit, total)
+        if not more:
+            return False
+        # The account listing tells how many containers there are.
+        try:
+            return total < int(response.headers["x-account-container-count"])
+        except (KeyError, TypeError, ValueError):
+            return True
+
     def _do_create_update(self, session, method):
         url = utils.urljoin(self.base_path, self.id)
 
@@ -110,6 +121,7 @@ class Container(resource.Resource):
 
         data = method(url, service=self.service, accept=None,
                       headers=headers).headers
+        self._invalidate_find(session)
         self._reset_dirty()
         return data
 
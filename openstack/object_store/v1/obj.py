@@ -147,6 +147,17 @@ class Object(resource.Resource):
     #: value in the X-Delete-At metadata item.
     delete_after = resource.prop("x-delete-after", type=int)
 
+    @classmethod
+    def _should_page(cls, response, data, limit, total):
+        more = super(Object, cls)._should_page(response, data, limit, total)
+        if not more:
+            return False
+        # The container listing tells how many objects there are.
+        try:
+            return total < int(response.headers["x-container-object-count"])
+        except (KeyError, TypeError, ValueError):
+            return True
+
     def get(self, session):
         if not self.allow_retrieve:
             raise exceptions.MethodNotSupported('retrieve')
@@ -181,5 +192,6 @@ class Object(resource.Resource):
         else:
             resp = session.post(url, service=self.service, data=None,
                                 accept=None).headers
+        self._invalidate_find(session)
 
         self._attrs.update(resp)
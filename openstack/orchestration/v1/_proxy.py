@@ -21,8 +21,8 @@ class Proxy(object):
     def find_stack(self, name_or_id):
         return stack.Stack.find(self.session, name_or_id)
 
-    def list_stacks(self):
-        return stack.Stack.list(self.session)
+    def list_stacks(self, **params):
+        return stack.Stack.list(self.session, **params)
 
     def get_stack(self, **data):
         return stack.Stack(data).get(self.session)
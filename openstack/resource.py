@@ -24,6 +24,23 @@ For update management, :class:`~openstack.resource.Resource`
 maintains a dirty list so when updating an object only the attributes
 that have actually been changed are sent to the server.
 
+Resources that are created in large numbers, from listings for example, can
+be made compact by a subclass that sets
+:data:`~openstack.resource.Resource.compact`::
+
+    class CompactPort(port.Port):
+        compact = True
+
+    for p in CompactPort.list(session):
+        ...
+
+The data of compact :meth:`~openstack.resource.Resource.existing` resources
+is kept as the server sent it rather than going through the prop setters, so
+keys without a prop can only be reached with ``p['key']``.  On Python 3, a
+compact class whose every class up to
+:class:`~openstack.resource.Resource` declares empty ``__slots__`` also has
+instances without a ``__dict__``, which saves some more memory.
+
 There is also some support here for lazy loading that needs improvement.
 
 There are plenty of examples of use of this class in the SDK code.
@@ -31,11 +48,17 @@ There are plenty of examples of use of this class in the SDK code.
 
 import abc
 import collections
+import copy
+import sys
+import threading
 
 import six
+from six.moves import queue
 from six.moves.urllib import parse as url_parse
 
 from openstack import exceptions
+from openstack import find_cache
+from openstack import json_stream
 from openstack import utils
 
 
@@ -96,6 +119,18 @@ class prop(object):
         self.alias = alias
         self.default = default
 
+    def _discard(self, instance):
+        cache = instance._coerced
+        if cache:
+            cache.pop(self.name, None)
+
+    @staticmethod
+    def _coerce(value):
+        parsed = getattr(value, 'parsed', None)
+        if parsed is not None:
+            return parsed
+        return value
+
     def __get__(self, instance, owner):
         if instance is None:
             return None
@@ -108,10 +143,19 @@ class prop(object):
                 return self.default
 
         if self.type and not isinstance(value, self.type):
-            value = self.type(value)
-            attr = getattr(value, 'parsed', None)
-            if attr is not None:
-                value = attr
+            # Coerced values are cached per instance along with the raw
+            # value they came from, so the cache can't go stale however
+            # the raw value gets replaced.
+            cache = instance._coerced
+            if cache is None:
+                cache = instance._coerced = {}
+            else:
+                entry = cache.get(self.name)
+                if entry is not None and entry[0] is value:
+                    return entry[1]
+            coerced = self._coerce(self.type(value))
+            cache[self.name] = (value, coerced)
+            value = coerced
 
         return value
 
@@ -119,9 +163,11 @@ class prop(object):
         if self.type and not isinstance(value, self.type):
             value = str(self.type(value))  # validate to fail fast
 
+        self._discard(instance)
         instance._attrs[self.name] = value
 
     def __delete__(self, instance):
+        self._discard(instance)
         try:
             del instance._attrs[self.name]
         except KeyError:
@@ -167,6 +213,26 @@ class Resource(collections.MutableMapping):
 
     put_update = False
 
+    #: Set if the service sends a ``next`` link in ``<resources_key>_links``
+    #: whenever a listing has more results, so a page without one is known
+    #: to be the last.
+    next_links = False
+
+    #: Set if the service accepts a filter repeated with several values,
+    #: such as ``?name=a&name=b``, matching any of them.
+    multi_value_filters = False
+
+    #: The number of bytes read at a time from a streamed listing.
+    STREAM_CHUNK_SIZE = 65536
+
+    #: Set to keep the data of :meth:`existing` resources as the server
+    #: sent it, rather than setting each key as an attribute.  This makes
+    #: large listings cheaper, but keys without a prop are then only
+    #: reachable as items.
+    compact = False
+
+    __slots__ = ('_attrs', '_dirty', '_loaded', '_coerced')
+
     def __init__(self, attrs=None, loaded=False):
         """Construct a Resource to interact with a service's REST API.
 
@@ -184,14 +250,24 @@ class Resource(collections.MutableMapping):
             attrs = {}
 
         self._attrs = attrs
+        # The dirty set is only allocated once something changes.
+        self._dirty = None if loaded or not attrs else set(attrs.keys())
+        self._loaded = loaded
+        # Values of props coerced to their type, created on first use.
+        self._coerced = None
+
+        if self.compact and loaded:
+            # Trust what the server sent, props coerce it when read.
+            return
+        # Keys without a prop can't be attributes of a slotted instance.
+        props_only = self.compact or not hasattr(self, '__dict__')
         # ensure setters are called for type coercion
         for k, v in attrs.items():
             if k != 'id':  # id property is read only
+                if props_only and not hasattr(type(self), k):
+                    continue
                 setattr(self, k, v)
 
-        self._dirty = set() if loaded else set(attrs.keys())
-        self._loaded = loaded
-
     def __repr__(self):
         return "%s: %s" % (self.get_resource_name(), self._attrs)
 
@@ -263,11 +339,11 @@ class Resource(collections.MutableMapping):
 
         if changed:
             self._attrs[name] = value
-            self._dirty.add(name)
+            self._mark_dirty(name)
 
     def __delitem__(self, name):
         del self._attrs[name]
-        self._dirty.add(name)
+        self._mark_dirty(name)
 
     def __len__(self):
         return len(self._attrs)
@@ -299,10 +375,15 @@ class Resource(collections.MutableMapping):
     @property
     def is_dirty(self):
         """True if the resource needs to be updated to the remote."""
-        return len(self._dirty) > 0
+        return bool(self._dirty)
+
+    def _mark_dirty(self, name):
+        if self._dirty is None:
+            self._dirty = set()
+        self._dirty.add(name)
 
     def _reset_dirty(self):
-        self._dirty = set()
+        self._dirty = None
 
     ##
     # CRUD OPERATIONS
@@ -344,6 +425,7 @@ class Resource(collections.MutableMapping):
         else:
             resp = session.post(url, service=cls.service,
                                 json=body).body
+        cls._invalidate_find(session)
 
         if cls.resource_key:
             resp = resp[cls.resource_key]
@@ -543,6 +625,7 @@ class Resource(collections.MutableMapping):
             resp = session.put(url, service=cls.service, json=body).body
         else:
             resp = session.patch(url, service=cls.service, json=body).body
+        cls._invalidate_find(session)
 
         if cls.resource_key:
             resp = resp[cls.resource_key]
@@ -600,6 +683,7 @@ class Resource(collections.MutableMapping):
             url = cls.base_path
         url = utils.urljoin(url, resource_id)
         session.delete(url, service=cls.service, accept=None)
+        cls._invalidate_find(session)
 
     def delete(self, session):
         """Delete the remote resource associated with this instance.
@@ -614,13 +698,14 @@ class Resource(collections.MutableMapping):
         self.delete_by_id(session, self.id, path_args=self)
 
     @classmethod
-    def list(cls, session, limit=None, marker=None, path_args=None, **params):
+    def list(cls, session, limit=None, marker=None, path_args=None,
+             raw=False, prefetch=0, stream=False, **params):
         """Get a response that is a list of potentially paginated objects.
 
         This method starts at ``limit`` and ``marker`` (both defaulting to
         None), advances the marker to the last item received in each response,
-        and continues making requests for more resources until no results
-        are returned.
+        and continues making requests for more resources until a response
+        shows that it was the last page.
 
         :param session: The session to use for making this request.
         :type session: :class:`~openstack.session.Session`
@@ -634,41 +719,271 @@ class Resource(collections.MutableMapping):
         :param dict path_args: A dictionary of arguments to construct
                                a compound URL.
                                See `How path_args are used`_ for details.
+        :param bool raw: If ``True``, yield the dicts of the response body
+                         as they are, without building a :class:`Resource`
+                         for each of them.  This is much cheaper when
+                         scanning large listings.
+        :param int prefetch: The number of pages to read ahead.  If it is
+                             not zero, the pages are requested by a
+                             background thread while the caller goes
+                             through the items already received, so long
+                             listings don't wait for a round trip at every
+                             page.  At most ``prefetch`` pages are held
+                             ahead of the caller.  Resources that are listed
+                             in a single response ignore it.
+        :param bool stream: If ``True``, each page is read from the
+                            connection as it arrives and its items are
+                            decoded and yielded one at a time, rather than
+                            once the whole page has been received and
+                            decoded.  This lowers the latency of the first
+                            item and bounds the memory used by very large
+                            pages.  It can't be combined with ``prefetch``.
+                            Resources that are listed in a single response
+                            ignore it.
         :param dict params: Parameters to be passed into the underlying
                             :meth:`~openstack.session.Session.get` method.
 
-        :return: A generator of :class:`Resource` objects.
+        :return: A generator of :class:`Resource` objects, or of dicts when
+                 ``raw`` is ``True``.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
                  :data:`Resource.allow_list` is not set to ``True``.
         """
         if not cls.allow_list:
             raise exceptions.MethodNotSupported('list')
 
+        if stream:
+            if prefetch:
+                raise ValueError('stream and prefetch can not be combined')
+            pages = cls._stream_pages(session, limit, marker, path_args,
+                                      params)
+        else:
+            pages = cls._pages(session, limit, marker, path_args, params)
+        if prefetch:
+            pages = cls._prefetch(pages, prefetch)
+        for page in pages:
+            for data in page:
+                yield data if raw else cls.existing(**data)
+
+    @classmethod
+    def _pages(cls, session, limit, marker, path_args, params):
+        """Generate the pages of a listing, advancing the marker."""
         more_data = True
+        total = 0
 
         while more_data:
-            resp = cls.page(session, limit, marker, path_args, **params)
-
-            # TODO(briancurtin): Although there are a few different ways
-            # across services, we can know from a response if it's the end
-            # without doing an extra request to get an empty response.
-            # Resources should probably carry something like a `_should_page`
-            # method to handle their service's pagination style.
-            if not resp:
-                more_data = False
-
-            # Keep track of how many items we've yielded. If we yielded
-            # less than our limit, we don't need to do an extra request
-            # to get back an empty data set, which acts as a sentinel.
-            yielded = 0
-            for data in resp:
-                value = cls.existing(**data)
-                marker = value.id
-                yielded += 1
-                yield value
-
-            if limit and yielded < limit:
-                more_data = False
+            page, resp = cls._page(session, limit, marker, path_args,
+                                   **params)
+            total += len(page)
+            # Decide before yielding, the response can then be dropped.
+            more_data = cls._should_page(resp, page, limit, total)
+            if page:
+                marker = page[-1].get(cls.id_attribute)
+            yield page
+
+    @classmethod
+    def _stream_pages(cls, session, limit, marker, path_args, params):
+        """Generate the pages of a listing as streams of their items."""
+        more_data = True
+        total = 0
+
+        while more_data:
+            url = cls._list_url(limit, marker, path_args)
+            resp = session.get(url, service=cls.service, params=params,
+                               stream=True)
+            items = json_stream.ArrayStream(
+                resp.iter_content(cls.STREAM_CHUNK_SIZE), cls.resources_key,
+                resp.encoding or 'utf-8')
+            page = [0, None]
+            yield cls._stream_items(resp, items, page)
+
+            # The caller asks for the next page once it has read this one,
+            # by then the rest of the body has been decoded.
+            resp.body = items.body
+            count, last = page
+            total += count
+            # Only the length of the page is known, it isn't kept.
+            more_data = cls._should_page(resp, six.moves.range(count), limit,
+                                         total)
+            if last is not None:
+                marker = last.get(cls.id_attribute)
+
+    @staticmethod
+    def _stream_items(resp, items, page):
+        """Yield the items of a page, counting them and keeping the last."""
+        try:
+            for data in items:
+                page[0] += 1
+                page[1] = data
+                yield data
+        finally:
+            resp.close()
+
+    @staticmethod
+    def _prefetch(pages, size):
+        """Read pages in a background thread, at most size ahead."""
+        done = object()
+        pending = queue.Queue(size)
+        stop = threading.Event()
+
+        def fetch():
+            try:
+                for page in pages:
+                    pending.put((page, None))
+                    if stop.is_set():
+                        return
+            except Exception:
+                pending.put((done, sys.exc_info()))
+            else:
+                pending.put((done, None))
+
+        thread = threading.Thread(target=fetch)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                page, error = pending.get()
+                if page is done:
+                    if error is not None:
+                        six.reraise(*error)
+                    return
+                yield page
+        finally:
+            # The caller may stop early, unblock the thread so it ends.
+            stop.set()
+            try:
+                pending.get_nowait()
+            except queue.Empty:
+                pass
+
+    @classmethod
+    def _should_page(cls, response, data, limit, total):
+        """Tell whether :meth:`list` needs to ask for another page.
+
+        Resources of services with their own pagination style override
+        this.  By default a listing ends with an empty page, a page shorter
+        than ``limit``, a page without a ``next`` link when the service
+        provides them (see :data:`next_links`) or, as with Keystone,
+        a ``links`` object whose ``next`` is null.
+
+        :param response: The response of the last page request.
+        :param list data: The items of the last page.
+        :param limit: The limit of the request, or ``None``.
+        :param int total: The number of items listed so far, including
+                          the last page.
+
+        :return: ``True`` if there may be more items to list.
+        """
+        if not data or (limit and len(data) < limit):
+            return False
+
+        body = response.body
+        if not isinstance(body, dict):
+            return True
+        links = body.get('%s_links' % cls.resources_key)
+        if links is not None or cls.next_links:
+            return any(link.get('rel') == 'next' for link in links or ())
+        links = body.get('links')
+        if isinstance(links, dict) and 'next' in links:
+            return links['next'] is not None
+        return True
+
+    @classmethod
+    def list_many(cls, session, parents, concurrency=4, limit=None,
+                  path_args=None, raw=False, **params):
+        """List this resource under many parents in parallel.
+
+        Each parent is listed by its own :meth:`list`, up to
+        ``concurrency`` of them at a time, and the items are yielded as
+        their pages arrive, so items of different parents are interleaved::
+
+            objects = Object.list_many(session,
+                                       [{'container': name} for name in names])
+            for path_args, obj in objects:
+                ...
+
+        :param session: The session to use for making the requests.
+        :type session: :class:`~openstack.session.Session`
+        :param parents: The parents to list the resource under.  A parent
+                        is either a dictionary of ``path_args``, such as
+                        another :class:`Resource`, or a
+                        :class:`~openstack.session.Session` to list with
+                        instead of ``session``, for example to list the
+                        resource in several projects.
+        :param int concurrency: The number of listings that run at once.
+        :param limit: The page size of each listing, see :meth:`list`.
+        :param dict path_args: The ``path_args`` used with the parents that
+                               are sessions.
+        :param bool raw: Yield dicts instead of :class:`Resource` objects,
+                         see :meth:`list`.
+        :param dict params: Parameters to be passed into the underlying
+                            :meth:`~openstack.session.Session.get` method.
+
+        :return: A generator of ``(parent, item)`` tuples.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+                 :data:`Resource.allow_list` is not set to ``True``.
+        """
+        if not cls.allow_list:
+            raise exceptions.MethodNotSupported('list')
+
+        # Go through list() so that resources overriding it are listed
+        # the way they define.
+        list_args = dict(params, raw=raw)
+        if limit is not None:
+            list_args['limit'] = limit
+        if path_args is not None:
+            list_args['path_args'] = path_args
+
+        done = object()
+        jobs = queue.Queue()
+        for parent in parents:
+            jobs.put(parent)
+        results = queue.Queue(concurrency)
+        stop = threading.Event()
+
+        def work():
+            try:
+                while not stop.is_set():
+                    try:
+                        parent = jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(parent, collections.Mapping):
+                        items = cls.list(session,
+                                         **dict(list_args, path_args=parent))
+                    else:
+                        items = cls.list(parent, **list_args)
+                    for item in items:
+                        results.put((parent, item))
+                        if stop.is_set():
+                            return
+            except Exception:
+                results.put((done, sys.exc_info()))
+            else:
+                results.put((done, None))
+
+        workers = min(concurrency, jobs.qsize())
+        for i in range(workers):
+            thread = threading.Thread(target=work)
+            thread.daemon = True
+            thread.start()
+        try:
+            while workers:
+                parent, item = results.get()
+                if parent is done:
+                    workers -= 1
+                    if item is not None:
+                        six.reraise(*item)
+                    continue
+                yield parent, item
+        finally:
+            # Each worker puts at most one more item once stopped, make
+            # room for them so none of them stays blocked.
+            stop.set()
+            while True:
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    break
 
     @classmethod
     def page(cls, session, limit, marker=None, path_args=None, **params):
@@ -691,7 +1006,22 @@ class Resource(collections.MutableMapping):
 
         :return: An array of :class:`Resource` objects.
         """
+        return cls._page(session, limit, marker, path_args, **params)[0]
+
+    @classmethod
+    def _page(cls, session, limit, marker=None, path_args=None, **params):
+        """Get one page, returning its items and the response."""
+        url = cls._list_url(limit, marker, path_args)
+        resp = session.get(url, service=cls.service, params=params)
+        data = resp.body
+
+        if cls.resources_key:
+            data = data[cls.resources_key]
+
+        return data, resp
 
+    @classmethod
+    def _list_url(cls, limit, marker, path_args):
         filters = {}
 
         if limit:
@@ -705,18 +1035,28 @@ class Resource(collections.MutableMapping):
             url = cls.base_path
         if filters:
             url = '%s?%s' % (url, url_parse.urlencode(filters))
+        return url
 
-        resp = session.get(url, service=cls.service, params=params).body
-
-        if cls.resources_key:
-            resp = resp[cls.resources_key]
+    @staticmethod
+    def _get_find_cache(session):
+        cache = getattr(session, 'find_cache', None)
+        if isinstance(cache, find_cache.FindCache):
+            return cache
+        return None
 
-        return resp
+    @classmethod
+    def _invalidate_find(cls, session):
+        cache = cls._get_find_cache(session)
+        if cache is not None:
+            cache.invalidate(cls)
 
     @classmethod
     def find(cls, session, name_or_id, path_args=None):
         """Find a resource by its name or id.
 
+        If the session has a :class:`~openstack.find_cache.FindCache`,
+        results are looked up there first.
+
         :param session: The session to use for making this request.
         :type session: :class:`~openstack.session.Session`
         :param resource_id: This resource's identifier, if needed by
@@ -728,6 +1068,27 @@ class Resource(collections.MutableMapping):
         :return: The :class:`Resource` object matching the given name or id
                  or None if nothing matches.
         """
+        cache = cls._get_find_cache(session)
+        key = None
+        if cache is not None:
+            key = cache.make_key(cls, name_or_id, path_args)
+        if key is None:
+            return cls._find(session, name_or_id, path_args)
+
+        hit, data = cache.get(key)
+        if not hit:
+            result = cls._find(session, name_or_id, path_args)
+            # The cache keeps its own copy, nested values included, so
+            # callers can change what they get.
+            data = None if result is None else copy.deepcopy(result._attrs)
+            cache.set(key, data)
+            return result
+        if data is None:
+            return None
+        return cls.existing(**copy.deepcopy(data))
+
+    @classmethod
+    def _find(cls, session, name_or_id, path_args=None):
         try:
             args = {
                 cls.id_attribute: name_or_id,
@@ -752,3 +1113,105 @@ class Resource(collections.MutableMapping):
                 raise exceptions.DuplicateResource(msg)
 
         return None
+
+    @classmethod
+    def find_many(cls, session, names_or_ids, path_args=None):
+        """Find many resources by their names or ids at once.
+
+        Where :meth:`find` makes up to two requests for each name or id,
+        this resolves them all with as few listings as possible.  If the
+        service supports it (see :data:`multi_value_filters`), the
+        resources are listed filtered by all the ids and then by the names
+        that were not ids.  Otherwise all the resources are listed once and
+        matched locally.  As with :meth:`find`, an id match wins over a name
+        match, and the session's find cache is used if it has one.
+
+        :param session: The session to use for making this request.
+        :type session: :class:`~openstack.session.Session`
+        :param names_or_ids: The names or ids to look for.
+        :param dict path_args: A dictionary of arguments to construct
+                               a compound URL.
+                               See `How path_args are used`_ for details.
+
+        :return: A dictionary mapping each name or id to the matching
+                 :class:`Resource` object, or to None if nothing matches.
+        :raises: :exc:`~openstack.exceptions.DuplicateResource` if any name
+                 matches more than one resource.  The message lists all of
+                 those names.
+        """
+        wanted = []
+        seen = set()
+        for value in names_or_ids:
+            if value not in seen:
+                seen.add(value)
+                wanted.append(value)
+
+        found = {}
+        cache = cls._get_find_cache(session)
+        keys = {}
+        if cache is not None:
+            for value in wanted:
+                key = cache.make_key(cls, value, path_args)
+                if key is None:
+                    continue
+                hit, data = cache.get(key)
+                if hit:
+                    found[value] = copy.deepcopy(data)
+                else:
+                    keys[value] = key
+            wanted = [value for value in wanted if value not in found]
+
+        duplicates = []
+        if wanted:
+            ids, names = cls._index_many(session, wanted, path_args)
+            for value in wanted:
+                data = ids.get(value)
+                if data is None:
+                    matches = names.get(value, ())
+                    if len(matches) > 1:
+                        duplicates.append(value)
+                        continue
+                    data = matches[0] if matches else None
+                found[value] = data
+                if value in keys:
+                    cache.set(keys[value], copy.deepcopy(data))
+
+        if duplicates:
+            msg = "More than one %s exists with the names %s."
+            msg = msg % (cls.get_resource_name(),
+                         ', '.join("'%s'" % value for value in duplicates))
+            raise exceptions.DuplicateResource(msg)
+
+        result = {}
+        for value, data in six.iteritems(found):
+            result[value] = None if data is None else cls.existing(**data)
+        return result
+
+    @classmethod
+    def _index_many(cls, session, values, path_args):
+        """List what may match the values, indexed by id and by name."""
+        if cls.multi_value_filters:
+            # The whole resources are listed, as they are returned and
+            # cached like those of find().
+            params = {cls.id_attribute: values}
+            items = list(cls.list(session, path_args=path_args, raw=True,
+                                  **params))
+            ids = set(item.get(cls.id_attribute) for item in items)
+            rest = [value for value in values if value not in ids]
+            if rest and cls.name_attribute:
+                params = {cls.name_attribute: rest}
+                items.extend(cls.list(session, path_args=path_args, raw=True,
+                                      **params))
+        else:
+            items = cls.list(session, path_args=path_args, raw=True)
+
+        ids = {}
+        names = {}
+        for item in items:
+            item_id = item.get(cls.id_attribute)
+            if item_id in ids:
+                continue
+            ids[item_id] = item
+            if cls.name_attribute:
+                names.setdefault(item.get(cls.name_attribute), []).append(item)
+        return ids, names
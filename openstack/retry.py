@@ -0,0 +1,119 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A :class:`~openstack.retry.RetryPolicy` tells a
+:class:`~openstack.transport.Transport` which failed requests to send again
+and how long to wait before doing so.  By default a transport doesn't retry
+at all, a policy can be given for all the requests of a transport::
+
+    from openstack import retry
+    from openstack import transport
+    trans = transport.Transport(retry=retry.RetryPolicy(max_attempts=5))
+
+or for the requests of a single :class:`~openstack.session.Session`::
+
+    from openstack import session
+    sess = session.Session(trans, auther, retry=retry.RetryPolicy())
+
+Requests are retried when the connection fails or the response status is
+one of the policy's ``statuses``, but only for the policy's ``methods``,
+which by default are the idempotent HTTP methods.  Between attempts the
+transport waits for an exponentially growing delay with random jitter, or
+for as long as the ``Retry-After`` header of the response asks.
+
+The number of retries for each host is kept by the transport, see
+:meth:`~openstack.transport.Transport.get_retry_stats`, so it is possible to
+see which services are pushing back.
+"""
+
+import email.utils
+import random
+import time
+
+
+class RetryPolicy(object):
+
+    #: Statuses that are worth trying again: rate limiting and server errors
+    #: that are usually temporary.
+    DEFAULT_STATUSES = (429, 500, 502, 503, 504)
+    #: Methods that can be sent more than once with the same result.
+    IDEMPOTENT_METHODS = ('DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE')
+
+    def __init__(self, max_attempts=3, statuses=DEFAULT_STATUSES,
+                 methods=IDEMPOTENT_METHODS, backoff=0.5, max_backoff=30,
+                 jitter=True, retry_after=True):
+        """Create a retry policy.
+
+        :param int max_attempts: The maximum number of times a request is
+            sent, including the first attempt.
+        :param statuses: The response status codes to retry.
+        :param methods: The HTTP methods to retry.
+        :param float backoff: The delay in seconds before the first retry.
+            It doubles for each retry after that.
+        :param float max_backoff: The longest delay in seconds.  A request
+            is not retried if the server asks to wait for longer than that
+            with a ``Retry-After`` header.
+        :param bool jitter: If True each delay is picked at random between
+            zero and the exponential backoff, so clients that failed together
+            don't all come back together.
+        :param bool retry_after: If True, a ``Retry-After`` header on the
+            response overrides the backoff delay.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_after = retry_after
+
+    def get_delay(self, method, attempt, response=None):
+        """Decide whether to send a request again.
+
+        :param str method: The HTTP method of the request.
+        :param int attempt: How many times the request has been sent.
+        :param response: The response received, or None if the connection
+            failed.
+        :type response: :class:`requests.Response`
+
+        :returns: The number of seconds to wait before sending the request
+            again, or None if it should not be retried.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            if self.retry_after:
+                delay = self._parse_retry_after(
+                    response.headers.get('Retry-After'))
+                if delay is not None:
+                    return delay if delay <= self.max_backoff else None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value):
+        """Convert a Retry-After header to seconds, None if it is invalid."""
+        if not value:
+            return None
+        try:
+            return max(0, int(value))
+        except ValueError:
+            pass
+        date = email.utils.parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0, email.utils.mktime_tz(date) - time.time())
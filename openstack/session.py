@@ -58,7 +58,9 @@ Creating a new object::
 """
 
 import logging
+import threading
 
+from openstack import exceptions
 from openstack import user_preference
 from openstack import utils
 
@@ -68,7 +70,8 @@ _logger = logging.getLogger(__name__)
 
 class Session(object):
 
-    def __init__(self, transport, authenticator, preference=None):
+    def __init__(self, transport, authenticator, preference=None,
+                 retry=None, find_cache=None):
         """Create a new object with a transport and authenticator.
 
         Session layer which uses the transport for communication.  The
@@ -85,6 +88,12 @@ class Session(object):
             in the preference object.  If no preferences are provided, the
             services that appear first in the service catalog will be used.
         :type preference: :class:`~openstack.user_preference.UserPreference`
+        :param retry: The policy for sending failed requests again.  If not
+            provided, the policy of the transport applies.
+        :type retry: :class:`~openstack.retry.RetryPolicy`
+        :param find_cache: A cache for the results of
+            :meth:`~openstack.resource.Resource.find` through this session.
+        :type find_cache: :class:`~openstack.find_cache.FindCache`
 
         All the other methods of the session accept the following parameters:
 
@@ -100,12 +109,77 @@ class Session(object):
         self.transport = transport
         self.authenticator = authenticator
         self.preference = preference or user_preference.UserPreference()
+        self.retry = retry
+        self.find_cache = find_cache
+        self._endpoints = {}
+        self._endpoints_token = None
+        self._auth_lock = threading.Lock()
+
+    @staticmethod
+    def _filter_key(service):
+        if service is None:
+            return None
+        return (service.service_type, service.service_name, service.region,
+                service.visibility, service.version)
+
+    def _get_endpoint(self, service, cache=True):
+        """Resolve the endpoint for a service.
+
+        Resolved endpoints are cached keyed on the service filter and any
+        user preference for that service type.  The cache is only valid for
+        the token it was built with, see :meth:`_check_endpoints`.
+        """
+        preference = None
+        if service:
+            preference = self.preference.get_preference(service.service_type)
+        key = (self._filter_key(service), self._filter_key(preference))
+        if cache:
+            try:
+                return self._endpoints[key]
+            except KeyError:
+                pass
+
+        if preference:
+            service = preference.join(service)
+        endpoint = self.authenticator.get_endpoint(self.transport, service)
+        if cache:
+            self._endpoints[key] = endpoint
+        return endpoint
+
+    def _check_endpoints(self, token):
+        """Drop cached endpoints if the token, and so the catalog, changed."""
+        if token != self._endpoints_token:
+            self._endpoints = {}
+            self._endpoints_token = token
+
+    def _authenticate(self, headers):
+        token = self.authenticator.get_token(self.transport)
+        if token:
+            headers['X-Auth-Token'] = token
+        self._check_endpoints(token)
+        return token
+
+    def _invalidate(self, token):
+        """Invalidate the authenticator after ``token`` was rejected.
+
+        When many requests fail together only the first invalidates, the
+        rest see the authenticator already moved on to a new token.
+
+        :returns bool: True if it makes sense to retry the request.
+        """
+        with self._auth_lock:
+            if self.authenticator.get_token(self.transport) != token:
+                return True
+            return self.authenticator.invalidate()
 
     def _request(self, path, method, service=None, authenticate=True,
                  **kwargs):
         """Send an HTTP request with the specified characteristics.
 
-        Handle a session level request.
+        Handle a session level request.  If an authenticated request is
+        rejected with 401 Unauthorized, the authenticator is invalidated and
+        the request is sent once more with a new token, provided its body
+        can be replayed.
 
         :param string path: Path relative to authentictor base url.
         :param string method: The http method to use. (eg. 'GET', 'POST').
@@ -119,18 +193,29 @@ class Session(object):
         """
 
         headers = kwargs.setdefault('headers', dict())
-        if authenticate:
-            token = self.authenticator.get_token(self.transport)
-            if token:
-                headers['X-Auth-Token'] = token
-        if service:
-            preference = self.preference.get_preference(service.service_type)
-            if preference:
-                service = preference.join(service)
-
-        endpoint = self.authenticator.get_endpoint(self.transport, service)
-        url = utils.urljoin(endpoint, path)
-
+        if self.retry is not None:
+            kwargs.setdefault('retry', self.retry)
+        if not authenticate:
+            # Without a token we can't tell whether the catalog has changed
+            # underneath us, so don't use the endpoint cache.
+            endpoint = self._get_endpoint(service, cache=False)
+            url = utils.urljoin(endpoint, path)
+            return self.transport.request(method, url, **kwargs)
+
+        position = utils.tell_body(kwargs.get('data'))
+        token = self._authenticate(headers)
+        url = utils.urljoin(self._get_endpoint(service), path)
+        try:
+            return self.transport.request(method, url, **kwargs)
+        except exceptions.HttpException as e:
+            if (e.status_code != 401 or
+                    not utils.rewind_body(kwargs.get('data'), position) or
+                    not self._invalidate(token)):
+                raise
+            _logger.debug("Token rejected, retrying %s %s", method, url)
+
+        self._authenticate(headers)
+        url = utils.urljoin(self._get_endpoint(service), path)
         return self.transport.request(method, url, **kwargs)
 
     def head(self, path, **kwargs):
@@ -36,8 +36,8 @@ class Proxy(object):
     def get_alarm(self, **data):
         return alarm.Alarm(data).get(self.session)
 
-    def list_alarms(self):
-        return alarm.Alarm.list(self.session)
+    def list_alarms(self, **params):
+        return alarm.Alarm.list(self.session, **params)
 
     def update_alarm(self, **data):
         return alarm.Alarm(data).update(self.session)
@@ -45,20 +45,20 @@ class Proxy(object):
     def find_alarm_change(self, name_or_id):
         return alarm_change.AlarmChange.find(self.session, name_or_id)
 
-    def list_alarm_changes(self):
-        return alarm_change.AlarmChange.list(self.session)
+    def list_alarm_changes(self, **params):
+        return alarm_change.AlarmChange.list(self.session, **params)
 
     def find_capability(self, name_or_id):
         return capability.Capability.find(self.session, name_or_id)
 
-    def list_capabilitys(self):
-        return capability.Capability.list(self.session)
+    def list_capabilitys(self, **params):
+        return capability.Capability.list(self.session, **params)
 
     def find_meter(self, name_or_id):
         return meter.Meter.find(self.session, name_or_id)
 
-    def list_meters(self):
-        return meter.Meter.list(self.session)
+    def list_meters(self, **params):
+        return meter.Meter.list(self.session, **params)
 
     def find_resource(self, name_or_id):
         return resource.Resource.find(self.session, name_or_id)
@@ -66,8 +66,8 @@ class Proxy(object):
     def get_resource(self, **data):
         return resource.Resource(data).get(self.session)
 
-    def list_resources(self):
-        return resource.Resource.list(self.session)
+    def list_resources(self, **params):
+        return resource.Resource.list(self.session, **params)
 
     def create_sample(self, **data):
         return sample.Sample(data).create(self.session)
@@ -75,11 +75,11 @@ class Proxy(object):
     def find_sample(self, name_or_id):
         return sample.Sample.find(self.session, name_or_id)
 
-    def list_samples(self):
-        return sample.Sample.list(self.session)
+    def list_samples(self, **params):
+        return sample.Sample.list(self.session, **params)
 
     def find_statistics(self, name_or_id):
         return statistics.Statistics.find(self.session, name_or_id)
 
-    def list_statistics(self):
-        return statistics.Statistics.list(self.session)
+    def list_statistics(self, **params):
+        return statistics.Statistics.list(self.session, **params)
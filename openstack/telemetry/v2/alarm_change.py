@@ -34,9 +34,12 @@ class AlarmChange(resource.Resource):
     user_id = resource.prop('user_id')
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path % path_args
         resp = session.get(url, service=cls.service, params=params)
+        if raw:
+            return resp.body
 
         changes = []
         for item in resp.body:
@@ -29,9 +29,11 @@ class Capability(resource.Resource):
     enabled = resource.prop('enabled')
 
     @classmethod
-    def list(cls, session, limit=None, marker=None, **params):
+    def list(cls, session, limit=None, marker=None, raw=False, prefetch=0,
+             stream=False, **params):
         resp = session.get(cls.base_path, service=cls.service, params=params)
         ray = []
         for key, value in six.iteritems(resp.body['api']):
-            ray.append(cls.existing(id=key, enabled=value))
+            data = {'id': key, 'enabled': value}
+            ray.append(data if raw else cls.existing(**data))
         return ray
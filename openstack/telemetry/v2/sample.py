@@ -40,9 +40,12 @@ class Sample(resource.Resource):
         return "sample: %s" % self._attrs
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path % path_args
         resp = session.get(url, service=cls.service, params=params)
+        if raw:
+            return resp.body
 
         changes = []
         for item in resp.body:
@@ -53,6 +56,7 @@ class Sample(resource.Resource):
         url = self.base_path % {'meter': self.meter}
         # telemetry expects a list of samples
         resp = session.post(url, service=self.service, json=[self._attrs])
+        self._invalidate_find(session)
 
         sample = self.existing(**resp.body.pop())
         self._attrs['id'] = sample.id
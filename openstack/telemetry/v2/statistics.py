@@ -43,9 +43,12 @@ class Statistics(resource.Resource):
     unit = resource.prop('unit')
 
     @classmethod
-    def list(cls, session, path_args=None, **params):
+    def list(cls, session, path_args=None, raw=False, prefetch=0, stream=False,
+             **params):
         url = cls.base_path % path_args
         resp = session.get(url, service=cls.service, params=params)
+        if raw:
+            return resp.body
         stats = []
         for stat in resp.body:
             stats.append(cls.existing(**stat))
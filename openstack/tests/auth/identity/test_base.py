@@ -0,0 +1,232 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+
+import mock
+import testtools
+
+from openstack.auth.identity import base
+from openstack.auth import token_cache
+
+
+class FakeAccess(object):
+
+    def __init__(self, token, expiring=False, expires_at=None):
+        self.auth_token = token
+        self.expiring = expiring
+        self.expires_at = expires_at
+
+    def will_expire_soon(self, best_before):
+        return self.expiring
+
+
+class FakeAuth(base.BaseIdentityPlugin):
+
+    def __init__(self, delay=0.05, lifetime=3600):
+        super(FakeAuth, self).__init__(auth_url='http://127.0.0.1:5000/v3')
+        self.delay = delay
+        self.lifetime = lifetime
+        self.count = 0
+        self.count_lock = threading.Lock()
+
+    def authorize(self, transport, **kwargs):
+        with self.count_lock:
+            self.count += 1
+            count = self.count
+        # Widen the window for other threads to pile up behind us.
+        time.sleep(self.delay)
+        return FakeAccess('token%d' % count,
+                          expires_at=time.time() + self.lifetime)
+
+
+class TestBaseIdentityPlugin(testtools.TestCase):
+
+    THREADS = 50
+
+    def get_tokens(self, sot, xport):
+        tokens = []
+        start = threading.Event()
+
+        def get_token():
+            start.wait()
+            tokens.append(sot.get_token(xport))
+
+        threads = [threading.Thread(target=get_token)
+                   for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        return tokens
+
+    def wait_for(self, predicate):
+        for i in range(200):
+            if predicate():
+                return
+            time.sleep(0.01)
+
+    def test_get_access(self):
+        sot = FakeAuth(delay=0)
+        xport = mock.Mock()
+
+        self.assertEqual('token1', sot.get_token(xport))
+        self.assertEqual('token1', sot.get_token(xport))
+        self.assertEqual(1, sot.count)
+
+    def test_concurrent_authorize(self):
+        sot = FakeAuth()
+        xport = mock.Mock()
+
+        tokens = self.get_tokens(sot, xport)
+
+        self.assertEqual(1, sot.count)
+        self.assertEqual(['token1'] * self.THREADS, tokens)
+
+    def test_concurrent_reauthorize(self):
+        sot = FakeAuth()
+        xport = mock.Mock()
+        sot.access_info = FakeAccess('old', expiring=True)
+
+        tokens = self.get_tokens(sot, xport)
+
+        self.assertEqual(1, sot.count)
+        self.assertEqual(['token1'] * self.THREADS, tokens)
+
+    def test_no_reauthenticate(self):
+        sot = FakeAuth(delay=0)
+        sot.reauthenticate = False
+        xport = mock.Mock()
+        sot.access_info = FakeAccess('old', expiring=True)
+
+        self.assertEqual('old', sot.get_token(xport))
+        self.assertEqual(0, sot.count)
+
+    def test_refresh(self):
+        sot = FakeAuth(delay=0, lifetime=0.3)
+        xport = mock.Mock()
+        self.addCleanup(sot.stop_refresh)
+
+        sot.start_refresh(xport, before=0.2)
+        self.wait_for(lambda: sot.count >= 2)
+        sot.stop_refresh()
+
+        self.assertTrue(sot.count >= 2)
+        self.assertEqual('token%d' % sot.count, sot.access_info.auth_token)
+
+    def test_stop_refresh(self):
+        sot = FakeAuth(delay=0)
+        xport = mock.Mock()
+
+        sot.start_refresh(xport)
+        self.wait_for(lambda: sot.access_info is not None)
+        sot.stop_refresh()
+
+        self.assertEqual(1, sot.count)
+        self.assertEqual(None, sot._refresher)
+        # Stopping twice is harmless.
+        sot.stop_refresh()
+
+    def test_refresh_retries(self):
+        sot = FakeAuth(delay=0)
+        sot.REFRESH_RETRY_SECONDS = 0.01
+        xport = mock.Mock()
+        self.addCleanup(sot.stop_refresh)
+        authorize = sot.authorize
+        sot.authorize = mock.Mock(side_effect=[Exception('down'),
+                                               authorize(xport)])
+
+        sot.start_refresh(xport)
+        self.wait_for(lambda: sot.access_info is not None)
+        sot.stop_refresh()
+
+        self.assertEqual(2, sot.authorize.call_count)
+        self.assertEqual('token1', sot.access_info.auth_token)
+
+
+class FakeCache(token_cache.BaseTokenCache):
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, access_info):
+        self.data[key] = access_info
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestTokenCache(testtools.TestCase):
+
+    def test_store(self):
+        cache = FakeCache()
+        sot = FakeAuth(delay=0)
+        sot.token_cache = cache
+
+        self.assertEqual('token1', sot.get_token(mock.Mock()))
+        self.assertEqual('token1',
+                         cache.get(sot.get_cache_id()).auth_token)
+
+    def test_load(self):
+        cache = FakeCache()
+        first = FakeAuth(delay=0)
+        first.token_cache = cache
+        first.get_token(mock.Mock())
+
+        second = FakeAuth(delay=0)
+        second.token_cache = cache
+
+        self.assertEqual('token1', second.get_token(mock.Mock()))
+        self.assertEqual(0, second.count)
+
+    def test_load_expiring(self):
+        cache = FakeCache()
+        sot = FakeAuth(delay=0)
+        sot.token_cache = cache
+        cache.set(sot.get_cache_id(), FakeAccess('old', expiring=True))
+
+        self.assertEqual('token1', sot.get_token(mock.Mock()))
+        self.assertEqual('token1',
+                         cache.get(sot.get_cache_id()).auth_token)
+
+    def test_invalidate(self):
+        cache = FakeCache()
+        sot = FakeAuth(delay=0)
+        sot.token_cache = cache
+        sot.get_token(mock.Mock())
+
+        sot.invalidate()
+
+        self.assertEqual(None, cache.get(sot.get_cache_id()))
+
+    def test_invalidate_keeps_newer(self):
+        cache = FakeCache()
+        sot = FakeAuth(delay=0)
+        sot.token_cache = cache
+        sot.get_token(mock.Mock())
+        cache.set(sot.get_cache_id(), FakeAccess('newer'))
+
+        sot.invalidate()
+
+        self.assertEqual('newer', cache.get(sot.get_cache_id()).auth_token)
+
+    def test_cache_id(self):
+        sot = FakeAuth()
+        other = FakeAuth()
+        self.assertEqual(sot.get_cache_id(), other.get_cache_id())
+        other.auth_url = 'http://127.0.0.2:5000/v3'
+        self.assertNotEqual(sot.get_cache_id(), other.get_cache_id())
@@ -32,6 +32,7 @@ class TestDiscoverableAuth(testtools.TestCase):
             'project_name',
             'reauthenticate',
             'token',
+            'token_cache',
             'trust_id',
             'user_domain_id',
             'user_domain_name',
@@ -219,6 +219,18 @@ class TestV2Auth(testtools.TestCase):
         self.assertEqual(expected, sot.get_auth_data(headers))
         self.assertEqual({}, headers)
 
+    def test_cache_id(self):
+        kargs = {'password': common.TEST_PASS,
+                 'user_name': common.TEST_USER,
+                 'project_id': common.TEST_TENANT_ID}
+        sot = v2.Auth(TEST_URL, **kargs)
+        same = v2.Auth(TEST_URL, **kargs)
+        kargs['user_name'] = 'other'
+        other = v2.Auth(TEST_URL, **kargs)
+
+        self.assertEqual(sot.get_cache_id(), same.get_cache_id())
+        self.assertNotEqual(sot.get_cache_id(), other.get_cache_id())
+
     def test_valid_options(self):
         expected = [
             'access_info',
@@ -230,6 +242,7 @@ class TestV2Auth(testtools.TestCase):
             'project_name',
             'reauthenticate',
             'token',
+            'token_cache',
             'trust_id',
         ]
         self.assertEqual(expected, v2.Auth.valid_options)
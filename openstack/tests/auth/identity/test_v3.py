@@ -352,6 +352,19 @@ class TestV3Auth(testtools.TestCase):
         self.assertEqual(common.TEST_USER, auther.user_name)
         self.assertEqual(common.TEST_PASS, auther.password)
 
+    def test_cache_id(self):
+        kargs = {'password': common.TEST_PASS,
+                 'user_name': common.TEST_USER,
+                 'project_id': common.TEST_PROJECT_ID}
+        sot = v3.Auth(TEST_URL, **kargs)
+        same = v3.Auth(TEST_URL, **kargs)
+        kargs['project_id'] = 'other'
+        other = v3.Auth(TEST_URL, **kargs)
+
+        self.assertEqual(sot.get_cache_id(), same.get_cache_id())
+        self.assertNotEqual(sot.get_cache_id(), other.get_cache_id())
+        self.assertNotIn(common.TEST_PASS, sot.get_cache_id())
+
     def test_valid_options(self):
         expected = [
             'access_info',
@@ -365,6 +378,7 @@ class TestV3Auth(testtools.TestCase):
             'project_name',
             'reauthenticate',
             'token',
+            'token_cache',
             'trust_id',
             'user_domain_id',
             'user_domain_name',
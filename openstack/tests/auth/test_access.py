@@ -10,6 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
+import datetime
+
+import iso8601
 import mock
 import testtools
 
@@ -86,3 +90,38 @@ class TestAccessInfo(testtools.TestCase):
     def test_factory_raises(self):
         self.assertRaises(NotImplementedError, access.AccessInfo.factory,
                           body={})
+
+    def _v3_expiring(self, seconds):
+        expires = datetime.datetime.utcnow() + datetime.timedelta(
+            seconds=seconds)
+        body = copy.deepcopy(common.TEST_RESPONSE_DICT_V3)
+        body['token']['expires_at'] = expires.isoformat() + 'Z'
+        return access.AccessInfoV3(common.TEST_TOKEN, **body['token'])
+
+    def test_will_expire_soon(self):
+        sot = self._v3_expiring(10)
+        self.assertFalse(sot.will_expire_soon(best_before=0))
+        self.assertTrue(sot.will_expire_soon(best_before=30))
+
+    def test_will_expire_soon_expired(self):
+        sot = self._v3_expiring(-10)
+        self.assertTrue(sot.will_expire_soon(best_before=0))
+
+    def test_expires_parsed_once(self):
+        with mock.patch('iso8601.parse_date',
+                        wraps=iso8601.parse_date) as parse:
+            sot = self._v3_expiring(3600)
+            sot.will_expire_soon()
+            sot.will_expire_soon()
+            sot.expires
+        self.assertEqual(1, parse.call_count)
+
+    def test_expires_invalid(self):
+        body = copy.deepcopy(common.TEST_RESPONSE_DICT_V3)
+        body['token']['expires_at'] = 'tomorrow'
+        self.assertRaises(ValueError, access.AccessInfoV3,
+                          common.TEST_TOKEN, **body['token'])
+
+    def test_expires_at(self):
+        sot = access.AccessInfo.factory(body=common.TEST_RESPONSE_DICT_V2)
+        self.assertEqual(1577836810.000123, sot.expires_at)
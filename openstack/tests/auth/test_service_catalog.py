@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import copy
+
 import testtools
 
 from openstack.auth import service_catalog as catalog
@@ -85,6 +87,19 @@ class TestServiceCatalog(testtools.TestCase):
         self.assertEqual(["http://identity.region1.public/v1.1/123123"],
                          sot.get_urls(sf))
 
+    def get_urls_any(self, sot):
+        sf = service_filter.ServiceFilter(visibility='admin')
+        exp = ["http://compute.region0.admin/v1.1",
+               "http://compute.region2.admin/v1",
+               "http://compute.region1.admin/v2.0",
+               "http://image.region1.admin/v2",
+               "http://identity.region1.admin/v1.1/123123",
+               "http://object-store.region1.admin/"]
+        self.assertEqual(exp, sot.get_urls(sf))
+        sf = service_filter.ServiceFilter(region='RegionTwo')
+        self.assertEqual(["http://compute.region2.public/v1"],
+                         sot.get_urls(sf))
+
 
 class TestServiceCatalogV2(TestServiceCatalog):
     def test_catalog(self):
@@ -95,6 +110,11 @@ class TestServiceCatalogV2(TestServiceCatalog):
     def test_catalog_empty(self):
         self.assertRaises(exc.EmptyCatalog, catalog.ServiceCatalogV2, None)
 
+    def test_catalog_not_modified(self):
+        data = copy.deepcopy(common.TEST_SERVICE_CATALOG_V2)
+        catalog.ServiceCatalogV2(data)
+        self.assertEqual(common.TEST_SERVICE_CATALOG_V2, data)
+
     def test_get_urls(self):
         sot = catalog.ServiceCatalogV2(common.TEST_SERVICE_CATALOG_V2)
         self.get_urls(sot)
@@ -111,6 +131,10 @@ class TestServiceCatalogV2(TestServiceCatalog):
         sot = catalog.ServiceCatalogV2(common.TEST_SERVICE_CATALOG_V2)
         self.get_urls_visibility(sot)
 
+    def test_get_urls_any(self):
+        sot = catalog.ServiceCatalogV2(common.TEST_SERVICE_CATALOG_V2)
+        self.get_urls_any(sot)
+
 
 class TestServiceCatalogV3(TestServiceCatalog):
     def test_catalog(self):
@@ -121,6 +145,11 @@ class TestServiceCatalogV3(TestServiceCatalog):
     def test_catalog_empty(self):
         self.assertRaises(exc.EmptyCatalog, catalog.ServiceCatalog, None)
 
+    def test_catalog_not_modified(self):
+        data = copy.deepcopy(common.TEST_SERVICE_CATALOG_V3)
+        catalog.ServiceCatalog(data)
+        self.assertEqual(common.TEST_SERVICE_CATALOG_V3, data)
+
     def test_get_urls(self):
         sot = catalog.ServiceCatalog(common.TEST_SERVICE_CATALOG_V3)
         self.get_urls(sot)
@@ -137,6 +166,10 @@ class TestServiceCatalogV3(TestServiceCatalog):
         sot = catalog.ServiceCatalog(common.TEST_SERVICE_CATALOG_V3)
         self.get_urls_visibility(sot)
 
+    def test_get_urls_any(self):
+        sot = catalog.ServiceCatalog(common.TEST_SERVICE_CATALOG_V3)
+        self.get_urls_any(sot)
+
     def test_get_versions(self):
         sot = catalog.ServiceCatalog(common.TEST_SERVICE_CATALOG_V3)
         service = compute_service.ComputeService()
@@ -0,0 +1,87 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import stat
+
+import fixtures
+import testtools
+
+from openstack.auth import access
+from openstack.auth import token_cache
+from openstack.tests.auth import common
+
+
+class TestFileTokenCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestFileTokenCache, self).setUp()
+        self.directory = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'tokens')
+        self.sot = token_cache.FileTokenCache(self.directory)
+        self.access_info = access.AccessInfo.factory(
+            resp=None, body=common.TEST_RESPONSE_DICT_V3)
+        self.access_info._info['auth_token'] = common.TEST_TOKEN
+
+    def test_default_directory(self):
+        self.useFixture(fixtures.EnvironmentVariable('XDG_CACHE_HOME',
+                                                     '/cache'))
+        sot = token_cache.FileTokenCache()
+        self.assertEqual('/cache/openstack/tokens', sot.directory)
+
+    def test_get_missing(self):
+        self.assertEqual(None, self.sot.get('key'))
+
+    def test_set_get(self):
+        self.sot.set('key', self.access_info)
+
+        result = self.sot.get('key')
+
+        self.assertTrue(isinstance(result, access.AccessInfoV3))
+        self.assertEqual(common.TEST_TOKEN, result.auth_token)
+        self.assertEqual(self.access_info.expires_at, result.expires_at)
+        self.assertEqual(self.access_info.service_catalog.catalog,
+                         result.service_catalog.catalog)
+
+    def test_permissions(self):
+        self.sot.set('key', self.access_info)
+
+        mode = os.stat(self.directory).st_mode
+        self.assertEqual(0o700, stat.S_IMODE(mode))
+        mode = os.stat(os.path.join(self.directory, 'key.json')).st_mode
+        self.assertEqual(0o600, stat.S_IMODE(mode))
+
+    def test_ignore_readable_by_others(self):
+        self.sot.set('key', self.access_info)
+        os.chmod(os.path.join(self.directory, 'key.json'), 0o644)
+
+        self.assertEqual(None, self.sot.get('key'))
+
+    def test_ignore_corrupt(self):
+        self.sot.set('key', self.access_info)
+        path = os.path.join(self.directory, 'key.json')
+        with open(path, 'w') as f:
+            f.write('{not json')
+
+        self.assertEqual(None, self.sot.get('key'))
+
+    def test_delete(self):
+        self.sot.set('key', self.access_info)
+        self.sot.delete('key')
+        self.sot.delete('key')
+
+        self.assertEqual(None, self.sot.get('key'))
+
+    def test_lock(self):
+        with self.sot.lock('key'):
+            self.sot.set('key', self.access_info)
+        self.assertEqual(common.TEST_TOKEN, self.sot.get('key').auth_token)
@@ -39,6 +39,10 @@ class TestComputeProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.compute.v2.flavor.Flavor.find',
                          self.proxy.find_flavor)
 
+    def test_flavor_find_many(self):
+        self.verify_find_many('openstack.compute.v2.flavor.Flavor.find_many',
+                              self.proxy.find_flavors)
+
     def test_flavor_get(self):
         self.verify_get('openstack.compute.v2.flavor.Flavor.get',
                         self.proxy.get_flavor)
@@ -63,6 +67,10 @@ class TestComputeProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.compute.v2.image.Image.find',
                          self.proxy.find_image)
 
+    def test_image_find_many(self):
+        self.verify_find_many('openstack.compute.v2.image.Image.find_many',
+                              self.proxy.find_images)
+
     def test_image_get(self):
         self.verify_get('openstack.compute.v2.image.Image.get',
                         self.proxy.get_image)
@@ -167,6 +175,10 @@ class TestComputeProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.compute.v2.server.Server.find',
                          self.proxy.find_server)
 
+    def test_server_find_many(self):
+        self.verify_find_many('openstack.compute.v2.server.Server.find_many',
+                              self.proxy.find_servers)
+
     def test_server_get(self):
         self.verify_get('openstack.compute.v2.server.Server.get',
                         self.proxy.get_server)
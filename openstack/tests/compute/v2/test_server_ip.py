@@ -113,3 +113,29 @@ class TestServerIP(testtools.TestCase):
         self.assertEqual('public', caps[5].network_label)
         self.assertEqual(IDENTIFIER, caps[5].server_id)
         self.assertEqual(6, caps[5].version)
+
+    def test_list_ignores_paging_flags(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=BODY)
+        path_args = {'server_id': IDENTIFIER}
+
+        caps = server_ip.ServerIP.list(sess, path_args=path_args,
+                                       prefetch=2, stream=True)
+
+        self.assertEqual(6, len(caps))
+        sess.get.assert_called_with('/servers/IDENTIFIER/ips',
+                                    service=server_ip.ServerIP.service,
+                                    params={})
+
+    def test_list_many(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=BODY)
+        parents = [{'server_id': 'a'}, {'server_id': 'b'}]
+
+        results = list(server_ip.ServerIP.list_many(sess, parents))
+
+        self.assertEqual(12, len(results))
+        for parent, ip in results:
+            self.assertIsInstance(ip, server_ip.ServerIP)
+            self.assertEqual(parent['server_id'], ip.server_id)
+        self.assertEqual(2, sess.get.call_count)
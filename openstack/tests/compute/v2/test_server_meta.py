@@ -14,6 +14,7 @@ import mock
 import testtools
 
 from openstack.compute.v2 import server_meta
+from openstack import find_cache
 
 FAKE_KEY = 'cervus'
 FAKE_SERVER_ID = 'cervidae'
@@ -112,6 +113,17 @@ class TestServerMeta(testtools.TestCase):
         url = 'servers/' + FAKE_SERVER_ID + '/metadata/' + FAKE_KEY
         sess.delete.assert_called_with(url, service=sot.service, accept=None)
 
+    def test_delete_invalidates_find(self):
+        sess = mock.Mock()
+        sess.find_cache = find_cache.FindCache()
+        key = sess.find_cache.make_key(server_meta.ServerMeta, FAKE_KEY)
+        sess.find_cache.set(key, EXAMPLE)
+        sot = server_meta.ServerMeta(EXAMPLE)
+
+        sot.delete(sess)
+
+        self.assertEqual((False, None), sess.find_cache.get(key))
+
     def test_list(self):
         resp = mock.Mock()
         resp.body = FAKE_RESPONSES
@@ -129,3 +141,14 @@ class TestServerMeta(testtools.TestCase):
         self.assertEqual(FAKE_SERVER_ID, resp[0].server_id)
         self.assertEqual(FAKE_KEY, resp[0].key)
         self.assertEqual(FAKE_VALUE, resp[0].value)
+
+    def test_list_raw(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=FAKE_RESPONSES)
+        path_args = {'server_id': FAKE_SERVER_ID}
+
+        resp = server_meta.ServerMeta.list(sess, path_args=path_args,
+                                           raw=True)
+
+        self.assertEqual([{'server_id': FAKE_SERVER_ID, 'key': FAKE_KEY,
+                           'value': FAKE_VALUE}], resp)
@@ -35,3 +35,5 @@ class FakeAuthenticator(mock.Mock):
         self.get_token.return_value = self.TOKEN
         self.get_endpoint = mock.Mock()
         self.get_endpoint.return_value = self.ENDPOINT
+        self.invalidate = mock.Mock()
+        self.invalidate.return_value = True
@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
 import testtools
 
 from openstack.image.v2 import image
@@ -63,4 +64,17 @@ class TestImage(testtools.TestCase):
         self.assertEqual(EXAMPLE['tags'], sot.tags)
         self.assertEqual(EXAMPLE['updated_at'], sot.updated_at)
         self.assertEqual(EXAMPLE['virtual_size'], sot.virtual_size)
-        self.assertEqual(EXAMPLE['visibility'], sot.visibility)
\ No newline at end of file
+        self.assertEqual(EXAMPLE['visibility'], sot.visibility)
+
+    def test_list_next(self):
+        sess = mock.Mock()
+        sess.get.side_effect = [
+            mock.Mock(body={'images': [{'id': '1'}],
+                            'next': '/v2/images?marker=1'}),
+            mock.Mock(body={'images': [{'id': '2'}]}),
+        ]
+
+        result = list(image.Image.list(sess))
+
+        self.assertEqual(['1', '2'], [i.id for i in result])
+        self.assertEqual(2, sess.get.call_count)
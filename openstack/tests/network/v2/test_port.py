@@ -73,3 +73,17 @@ class TestPort(testtools.TestCase):
         self.assertEqual(EXAMPLE['tenant_id'], sot.project_id)
         self.assertEqual(EXAMPLE['security_groups'], sot.security_groups)
         self.assertEqual(EXAMPLE['status'], sot.status)
+
+    def test_compact(self):
+        class CompactPort(port.Port):
+            compact = True
+
+        sot = CompactPort.existing(**EXAMPLE)
+        self.assertEqual(EXAMPLE['binding:vif_details'],
+                         sot.binding_vif_details)
+        self.assertEqual(EXAMPLE['tenant_id'], sot.project_id)
+        self.assertEqual(EXAMPLE['tenant_id'], sot['tenant_id'])
+        self.assertFalse(hasattr(sot, 'tenant_id'))
+
+        sot = port.Port.existing(**EXAMPLE)
+        self.assertEqual(EXAMPLE['tenant_id'], sot.tenant_id)
@@ -212,6 +212,10 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.network.v2.network.Network.find',
                          self.proxy.find_network)
 
+    def test_network_find_many(self):
+        self.verify_find_many('openstack.network.v2.network.Network.find_many',
+                              self.proxy.find_networks)
+
     def test_network_get(self):
         self.verify_get('openstack.network.v2.network.Network.get',
                         self.proxy.get_network)
@@ -287,6 +291,10 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.network.v2.port.Port.find',
                          self.proxy.find_port)
 
+    def test_port_find_many(self):
+        self.verify_find_many('openstack.network.v2.port.Port.find_many',
+                              self.proxy.find_ports)
+
     def test_port_get(self):
         self.verify_get('openstack.network.v2.port.Port.get',
                         self.proxy.get_port)
@@ -315,6 +323,10 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.network.v2.router.Router.find',
                          self.proxy.find_router)
 
+    def test_router_find_many(self):
+        self.verify_find_many('openstack.network.v2.router.Router.find_many',
+                              self.proxy.find_routers)
+
     def test_router_get(self):
         self.verify_get('openstack.network.v2.router.Router.get',
                         self.proxy.get_router)
@@ -342,6 +354,11 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
             'openstack.network.v2.security_group.SecurityGroup.find',
             self.proxy.find_security_group)
 
+    def test_security_group_find_many(self):
+        self.verify_find_many(
+            'openstack.network.v2.security_group.SecurityGroup.find_many',
+            self.proxy.find_security_groups)
+
     def test_security_group_get(self):
         self.verify_get(
             'openstack.network.v2.security_group.SecurityGroup.get',
@@ -402,6 +419,10 @@ class TestNetworkProxy(test_proxy_base.TestProxyBase):
         self.verify_find('openstack.network.v2.subnet.Subnet.find',
                          self.proxy.find_subnet)
 
+    def test_subnet_find_many(self):
+        self.verify_find_many('openstack.network.v2.subnet.Subnet.find_many',
+                              self.proxy.find_subnets)
+
     def test_subnet_get(self):
         self.verify_get('openstack.network.v2.subnet.Subnet.get',
                         self.proxy.get_subnet)
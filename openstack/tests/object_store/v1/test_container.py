@@ -14,6 +14,7 @@ import mock
 import testtools
 
 from openstack import exceptions
+from openstack import find_cache
 from openstack.object_store.v1 import container
 
 
@@ -176,6 +177,17 @@ class TestContainer(testtools.TestCase):
         sot = container.Container.new(name=CONTAINER_NAME)
         self._test_create_update(sot, sot.create, self.sess.put)
 
+    def test_create_invalidates_find(self):
+        self.sess.find_cache = find_cache.FindCache()
+        key = self.sess.find_cache.make_key(container.Container,
+                                            CONTAINER_NAME)
+        self.sess.find_cache.set(key, None)
+        sot = container.Container.new(name=CONTAINER_NAME)
+
+        sot.create(self.sess)
+
+        self.assertEqual((False, None), self.sess.find_cache.get(key))
+
     def test_update(self):
         sot = container.Container.new(name=CONTAINER_NAME)
         self._test_create_update(sot, sot.update, self.sess.post)
@@ -115,3 +115,14 @@ class TestObject(testtools.TestCase):
         sot = obj.Object.new(container=CONTAINER_NAME, name=OBJECT_NAME)
         sot.allow_retrieve = False
         self.assertRaises(exceptions.MethodNotSupported, sot.get, self.sess)
+
+    def test_list_stops_at_count(self):
+        resp = mock.Mock(body=[{"name": "a"}, {"name": "b"}],
+                         headers={"x-container-object-count": "2"})
+        self.sess.get.return_value = resp
+
+        objs = list(obj.Object.list(self.sess,
+                                    path_args={"container": CONTAINER_NAME}))
+
+        self.assertEqual(["a", "b"], [o.name for o in objs])
+        self.assertEqual(1, self.sess.get.call_count)
@@ -91,3 +91,42 @@ class TestStatistics(testtools.TestCase):
         self.assertEqual(EXAMPLE['period_start'], reply[0].period_start)
         self.assertEqual(EXAMPLE['sum'], reply[0].sum)
         self.assertEqual(EXAMPLE['unit'], reply[0].unit)
+
+    def test_list_raw(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=[EXAMPLE])
+
+        args = {'meter_name': 'example'}
+        reply = statistics.Statistics.list(sess, path_args=args, raw=True)
+
+        self.assertEqual([EXAMPLE], reply)
+        sess.get.assert_called_with('/meters/example/statistics',
+                                    service=statistics.Statistics.service,
+                                    params={})
+
+    def test_list_ignores_paging_flags(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=[EXAMPLE])
+
+        args = {'meter_name': 'example'}
+        reply = statistics.Statistics.list(sess, path_args=args, prefetch=2,
+                                           stream=True, q='x')
+
+        self.assertEqual(1, len(reply))
+        sess.get.assert_called_with('/meters/example/statistics',
+                                    service=statistics.Statistics.service,
+                                    params={'q': 'x'})
+
+    def test_list_many(self):
+        sess = mock.Mock()
+        sess.get.return_value = mock.Mock(body=[EXAMPLE, EXAMPLE])
+        parents = [{'meter_name': 'a'}, {'meter_name': 'b'}]
+
+        results = list(statistics.Statistics.list_many(sess, parents,
+                                                       raw=True))
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(2, sess.get.call_count)
+        self.assertEqual(
+            ['/meters/a/statistics', '/meters/b/statistics'],
+            sorted(call[0][0] for call in sess.get.call_args_list))
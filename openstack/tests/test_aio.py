@@ -0,0 +1,244 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import threading
+
+from six.moves import BaseHTTPServer
+import testtools
+
+from openstack import exceptions
+from openstack import resource
+from openstack import retry
+from openstack import session
+from openstack.tests import fakes
+from openstack import transport
+
+try:
+    from openstack import aio
+except (ImportError, SyntaxError):
+    # Needs Python 3.6 and aiohttp.
+    aio = None
+
+
+class FakeServer(BaseHTTPServer.HTTPServer):
+    """Answer requests with canned responses, recording what was asked."""
+
+    def __init__(self):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0),
+                                           FakeHandler)
+        self.requests = []
+        self.responses = []
+        self.url = 'http://127.0.0.1:%d' % self.server_port
+
+
+class FakeHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        self.server.requests.append((self.command, self.path,
+                                     dict(self.headers), body))
+        status, headers, data = self.server.responses.pop(0)
+        content = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeResource(resource.Resource):
+    resource_key = 'fake'
+    resources_key = 'fakes'
+    base_path = '/fakes/%(parent)s/items'
+    allow_create = allow_retrieve = allow_list = True
+
+    name = resource.prop('name')
+
+
+@testtools.skipIf(aio is None, 'Needs Python 3.6 and aiohttp')
+class TestAio(testtools.TestCase):
+
+    def setUp(self):
+        super(TestAio, self).setUp()
+        self.server = FakeServer()
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  args=(0.01,))
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.auth = fakes.FakeAuthenticator()
+        self.auth.get_endpoint.return_value = self.server.url
+        self.sess = session.Session(transport.Transport(), self.auth)
+        self.asess = aio.AsyncSession(self.sess)
+
+        self.loop = aio.asyncio.new_event_loop()
+        aio.asyncio.set_event_loop(self.loop)
+        self.addCleanup(aio.asyncio.set_event_loop, None)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(self.wait, self.asess.close())
+
+    def wait(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def collect(self, agen):
+        items = []
+        while True:
+            try:
+                items.append(self.wait(agen.__anext__()))
+            except StopAsyncIteration:  # noqa
+                return items
+
+    def test_get(self):
+        self.server.responses.append((200, {}, {'a': 1}))
+
+        resp = self.wait(self.asess.get('/path', params={'q': 'x'}))
+
+        self.assertEqual({'a': 1}, resp.body)
+        method, path, headers, body = self.server.requests[0]
+        self.assertEqual('GET', method)
+        self.assertEqual('/path?q=x', path)
+        self.assertEqual(self.auth.TOKEN, headers['X-Auth-Token'])
+        self.assertEqual('application/json', headers['Accept'])
+
+    def test_post_json(self):
+        self.server.responses.append((201, {}, {'id': 'x'}))
+
+        resp = self.wait(self.asess.post('/path', json={'a': 1}))
+
+        self.assertEqual({'id': 'x'}, resp.body)
+        method, path, headers, body = self.server.requests[0]
+        self.assertEqual('POST', method)
+        self.assertEqual({'a': 1}, json.loads(body.decode('utf-8')))
+        self.assertEqual('application/json', headers['Content-Type'])
+
+    def test_error(self):
+        self.server.responses.append((404, {}, {'itemNotFound': {
+            'message': 'Not found'}}))
+
+        exc = self.assertRaises(exceptions.HttpException, self.wait,
+                                self.asess.get('/path'))
+
+        self.assertEqual(404, exc.status_code)
+        self.assertEqual('Not found', exc.details)
+
+    def test_unauthorized(self):
+        self.server.responses.append((401, {}, None))
+        self.server.responses.append((200, {}, {'a': 1}))
+        self.auth.get_token.side_effect = ['old', 'old', 'new']
+
+        resp = self.wait(self.asess.get('/path'))
+
+        self.assertEqual({'a': 1}, resp.body)
+        self.auth.invalidate.assert_called_once_with()
+        self.assertEqual('new', self.server.requests[1][2]['X-Auth-Token'])
+
+    def test_retry(self):
+        self.asess.transport._retry = retry.RetryPolicy(backoff=0)
+        self.server.responses.append((503, {}, None))
+        self.server.responses.append((200, {}, {'a': 1}))
+
+        resp = self.wait(self.asess.get('/path'))
+
+        self.assertEqual({'a': 1}, resp.body)
+        self.assertEqual({self.server.url: {503: 1}},
+                         self.asess.transport.get_retry_stats())
+
+    def test_concurrent(self):
+        for i in range(20):
+            self.server.responses.append((200, {}, {'a': 1}))
+
+        resps = self.wait(aio.asyncio.gather(
+            *[self.asess.get('/path') for i in range(20)]))
+
+        self.assertEqual(20, len(resps))
+        self.assertEqual(20, len(self.server.requests))
+
+    def test_resource_get_by_id(self):
+        self.server.responses.append((200, {}, {'fake': {'id': 'x',
+                                                         'name': 'y'}}))
+        sot = aio.AsyncResource(FakeResource)
+
+        result = self.wait(sot.get_by_id(self.asess, 'x',
+                                         path_args={'parent': 'p'}))
+
+        self.assertTrue(isinstance(result, FakeResource))
+        self.assertEqual('y', result.name)
+        self.assertEqual('/fakes/p/items/x', self.server.requests[0][1])
+
+    def test_resource_create_by_id(self):
+        self.server.responses.append((200, {}, {'fake': {'id': 'x'}}))
+        sot = aio.AsyncResource(FakeResource)
+
+        result = self.wait(sot.create_by_id(self.asess, {'name': 'y'},
+                                            path_args={'parent': 'p'}))
+
+        self.assertEqual({'id': 'x'}, result)
+        method, path, headers, body = self.server.requests[0]
+        self.assertEqual('POST', method)
+        self.assertEqual({'fake': {'name': 'y'}},
+                         json.loads(body.decode('utf-8')))
+
+    def test_resource_list(self):
+        self.server.responses.append((200, {}, {'fakes': [{'id': '1'},
+                                                          {'id': '2'}]}))
+        self.server.responses.append((200, {}, {'fakes': [{'id': '3'}]}))
+        sot = aio.AsyncResource(FakeResource)
+
+        results = self.collect(sot.list(self.asess, limit=2,
+                                        path_args={'parent': 'p'}))
+
+        self.assertEqual(['1', '2', '3'], [r.id for r in results])
+        self.assertEqual('/fakes/p/items?limit=2',
+                         self.server.requests[0][1])
+        self.assertEqual('/fakes/p/items?limit=2&marker=2',
+                         self.server.requests[1][1])
+
+    def test_resource_list_links(self):
+        self.server.responses.append((200, {}, {'fakes': [{'id': '1'}],
+                                                'fakes_links': []}))
+        sot = aio.AsyncResource(FakeResource)
+
+        results = self.collect(sot.list(self.asess,
+                                        path_args={'parent': 'p'}))
+
+        self.assertEqual(['1'], [r.id for r in results])
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_resource_list_raw(self):
+        self.server.responses.append((200, {}, {'fakes': [{'id': '1'}]}))
+        self.server.responses.append((200, {}, {'fakes': []}))
+        sot = aio.AsyncResource(FakeResource)
+
+        results = self.collect(sot.list(self.asess, raw=True,
+                                        path_args={'parent': 'p'}))
+
+        self.assertEqual([{'id': '1'}], results)
+        self.assertEqual('/fakes/p/items?marker=1',
+                         self.server.requests[1][1])
+
+    def test_resource_not_supported(self):
+        class NoList(FakeResource):
+            allow_list = False
+
+        sot = aio.AsyncResource(NoList)
+        self.assertRaises(exceptions.MethodNotSupported, self.collect,
+                          sot.list(self.asess))
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+
 import mock
 
 from openstack.auth.identity import v2
@@ -38,6 +40,13 @@ class TestConnection(base.TestCase):
         self.assertTrue(conn.transport.verify)
         self.assertIn('1', conn.transport._user_agent)
 
+    def test_create_transport_pool_args(self):
+        conn = connection.Connection(authenticator='2', pool_maxsize=25,
+                                     pool_block=True)
+        adapter = conn.transport.get_adapter('https://127.0.0.1')
+        self.assertEqual(25, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
     def test_create_authenticator_v2(self):
         auth_args = {
             'auth_url': '0',
@@ -121,6 +130,52 @@ class TestConnection(base.TestCase):
         self.assertEqual('openstack.telemetry.v2._proxy',
                          conn.telemetry.__class__.__module__)
 
+    def test_lazy_load(self):
+        conn = connection.Connection(transport=self.xport,
+                                     authenticator=self.auth)
+        self.assertNotIn('compute', conn.__dict__)
+        self.assertIn('compute', dir(conn))
+
+        proxy = conn.compute
+
+        self.assertEqual('openstack.compute.v2._proxy',
+                         proxy.__class__.__module__)
+        self.assertIs(proxy, conn.__dict__['compute'])
+        self.assertIs(proxy, conn.compute)
+        self.assertNotIn('network', conn.__dict__)
+
+    def test_lazy_load_failure(self):
+        conn = connection.Connection(transport=self.xport,
+                                     authenticator=self.auth)
+        with mock.patch.object(conn, '_load') as mock_load:
+            self.assertRaises(AttributeError, getattr, conn, 'compute')
+            self.assertRaises(AttributeError, getattr, conn, 'compute')
+        self.assertEqual(1, mock_load.call_count)
+
+    def test_lazy_load_concurrent(self):
+        conn = connection.Connection(transport=self.xport,
+                                     authenticator=self.auth)
+        proxy = object()
+        seen = []
+
+        def load(service):
+            other = threading.Thread(
+                target=lambda: seen.append(getattr(conn, 'compute')))
+            other.start()
+            # The other thread waits for this load instead of failing.
+            other.join(0.1)
+            self.assertTrue(other.is_alive())
+            conn.compute = proxy
+            load.other = other
+
+        with mock.patch.object(conn, '_load', side_effect=load):
+            self.assertIs(proxy, conn.compute)
+        load.other.join()
+        self.assertEqual([proxy], seen)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, self.conn, 'nope')
+
     def test_custom_user_agent(self):
         user_agent = "MyProgram/1.0"
         conn = connection.Connection(authenticator=self.auth,
@@ -0,0 +1,83 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from openstack import find_cache
+
+
+class TestFindCache(testtools.TestCase):
+
+    def setUp(self):
+        super(TestFindCache, self).setUp()
+        self.now = 1000.0
+        self.sot = find_cache.FindCache(ttl=10, max_size=2,
+                                        clock=lambda: self.now)
+
+    def test_get_set(self):
+        key = self.sot.make_key(dict, 'name')
+
+        self.assertEqual((False, None), self.sot.get(key))
+        self.sot.set(key, {'id': 'x'})
+        self.assertEqual((True, {'id': 'x'}), self.sot.get(key))
+        self.assertEqual({'hits': 1, 'misses': 1, 'evictions': 0,
+                          'size': 1}, self.sot.get_stats())
+
+    def test_expiry(self):
+        key = self.sot.make_key(dict, 'name')
+        self.sot.set(key, None)
+
+        self.now += 9
+        self.assertEqual((True, None), self.sot.get(key))
+        self.now += 1
+        self.assertEqual((False, None), self.sot.get(key))
+        self.assertEqual(0, self.sot.get_stats()['size'])
+
+    def test_lru(self):
+        a, b, c = [self.sot.make_key(dict, n) for n in 'abc']
+        self.sot.set(a, 1)
+        self.sot.set(b, 2)
+        self.sot.get(a)
+
+        self.sot.set(c, 3)
+
+        self.assertEqual((True, 1), self.sot.get(a))
+        self.assertEqual((False, None), self.sot.get(b))
+        self.assertEqual((True, 3), self.sot.get(c))
+        self.assertEqual(1, self.sot.evictions)
+
+    def test_invalidate(self):
+        a = self.sot.make_key(dict, 'a')
+        b = self.sot.make_key(list, 'b')
+        self.sot.set(a, 1)
+        self.sot.set(b, 2)
+
+        self.sot.invalidate(dict)
+
+        self.assertEqual((False, None), self.sot.get(a))
+        self.assertEqual((True, 2), self.sot.get(b))
+
+    def test_make_key(self):
+        self.assertEqual(self.sot.make_key(dict, 'a', {'x': 1, 'y': 2}),
+                         self.sot.make_key(dict, 'a', {'y': 2, 'x': 1}))
+        self.assertIsNone(self.sot.make_key(dict, 'a', {'x': []}))
+
+    def test_set_existing_key(self):
+        a, b = [self.sot.make_key(dict, n) for n in 'ab']
+        self.sot.set(a, 1)
+        self.sot.set(b, 2)
+
+        self.sot.set(a, 3)
+
+        self.assertEqual((True, 3), self.sot.get(a))
+        self.assertEqual((True, 2), self.sot.get(b))
+        self.assertEqual(0, self.sot.evictions)
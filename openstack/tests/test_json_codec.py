@@ -0,0 +1,61 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from openstack import json_codec
+
+BODY = {'servers': [{'id': 'x', 'name': u'caf\xe9', 'ram': 512,
+                     'ratio': 1.5, 'tags': [], 'image': None,
+                     'locked': False}]}
+
+
+class Unavailable(object):
+
+    def __init__(self):
+        raise ImportError('not installed')
+
+
+class TestJSONCodec(testtools.TestCase):
+
+    def setUp(self):
+        super(TestJSONCodec, self).setUp()
+        patcher = mock.patch.object(json_codec, '_default', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_codecs(self):
+        for name, codec_cls in json_codec.CODECS:
+            try:
+                codec = json_codec.get_codec(name)
+            except ImportError:
+                continue
+            encoded = codec.dumps(BODY)
+            if not isinstance(encoded, bytes):
+                encoded = encoded.encode('utf-8')
+
+            self.assertEqual(name, codec.name)
+            self.assertEqual(BODY, codec.loads(encoded))
+            self.assertRaises(ValueError, codec.loads, b'{"a": ')
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, json_codec.get_codec, 'yaml')
+
+    def test_default(self):
+        codecs = (('fast', Unavailable), ('json', json_codec.JSONCodec))
+        with mock.patch.multiple(json_codec, CODECS=codecs,
+                                 DEFAULT_CODECS=('fast', 'json')):
+            codec = json_codec.get_codec()
+
+            self.assertEqual('json', codec.name)
+            self.assertIs(codec, json_codec.get_codec())
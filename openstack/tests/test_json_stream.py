@@ -0,0 +1,76 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import testtools
+
+from openstack import json_stream
+
+ITEMS = [{'id': 1, 'name': u'caf\u00e9'}, {'id': 22, 'tags': ['a', 'b']},
+         12345, None, 'x']
+BODY = {'first': {'a': [1, 2]}, 'servers': ITEMS,
+        'servers_links': [{'rel': 'next', 'href': 'http://x'}]}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestArrayStream(testtools.TestCase):
+
+    def test_object(self):
+        data = json.dumps(BODY, indent=1).encode('utf-8')
+        for size in (1, 2, 7, len(data)):
+            sot = json_stream.ArrayStream(chunked(data, size), 'servers')
+
+            self.assertEqual(ITEMS, list(sot))
+            self.assertEqual({'first': {'a': [1, 2]},
+                              'servers_links': BODY['servers_links']},
+                             sot.body)
+
+    def test_array(self):
+        data = json.dumps(ITEMS).encode('utf-8')
+        for size in (1, 3, len(data)):
+            sot = json_stream.ArrayStream(chunked(data, size))
+
+            self.assertEqual(ITEMS, list(sot))
+            self.assertEqual({}, sot.body)
+
+    def test_lazy(self):
+        chunks = iter([b'{"servers": [{"id": 1},', b' {"id": 2}]}'])
+        sot = iter(json_stream.ArrayStream(chunks, 'servers'))
+
+        self.assertEqual({'id': 1}, next(sot))
+        self.assertEqual([b' {"id": 2}]}'], list(chunks))
+
+    def test_empty(self):
+        sot = json_stream.ArrayStream([b'{"servers": []}'], 'servers')
+        self.assertEqual([], list(sot))
+
+        sot = json_stream.ArrayStream([b'{}'], 'servers')
+        self.assertEqual([], list(sot))
+
+    def test_missing_key(self):
+        sot = json_stream.ArrayStream([b'{"a": 1, "b": [2]}'], 'servers')
+
+        self.assertEqual([], list(sot))
+        self.assertEqual({'a': 1, 'b': [2]}, sot.body)
+
+    def test_truncated(self):
+        sot = json_stream.ArrayStream([b'{"servers": [{"id": 1}, {"i'],
+                                      'servers')
+        self.assertRaises(ValueError, list, sot)
+
+    def test_invalid(self):
+        sot = json_stream.ArrayStream([b'{"servers": {"id": 1}}'], 'servers')
+        self.assertRaises(ValueError, list, sot)
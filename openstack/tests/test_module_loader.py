@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+
 from openstack import exceptions
 from openstack import module_loader
 from openstack.tests import base
@@ -46,3 +48,28 @@ class TestModuleLoader(base.TestCase):
     def test_list_auth_plugins(self):
         plugins = sorted(module_loader.ModuleLoader().list_auth_plugins())
         self.assertEqual(['identity', 'identity_v2', 'identity_v3'], plugins)
+
+    def test_builtin_skips_entry_points(self):
+        with mock.patch.object(module_loader, '_auth_mgr', None):
+            with mock.patch('stevedore.extension.ExtensionManager') as mgr:
+                loader = module_loader.ModuleLoader()
+                for name in module_loader.BUILTIN_AUTH_PLUGINS:
+                    loader.get_auth_plugin(name)
+        self.assertFalse(mgr.called)
+
+    def test_entry_points_scanned_once(self):
+        with mock.patch.object(module_loader, '_auth_mgr', None):
+            with mock.patch('stevedore.extension.ExtensionManager') as mgr:
+                mgr.return_value.__getitem__.side_effect = KeyError
+                for i in range(3):
+                    self.assertRaises(
+                        exceptions.NoMatchingPlugin,
+                        module_loader.ModuleLoader().get_auth_plugin, 'wot')
+        self.assertEqual(1, mgr.call_count)
+
+    def test_builtin_matches_entry_points(self):
+        mgr = module_loader.ModuleLoader().auth_mgr
+        for name, (module, attr) in module_loader.BUILTIN_AUTH_PLUGINS.items():
+            plugin = mgr[name].plugin
+            self.assertEqual((module, attr),
+                             (plugin.__module__, plugin.__name__))
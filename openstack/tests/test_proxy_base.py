@@ -43,6 +43,9 @@ class TestProxyBase(base.TestCase):
     def verify_find(self, mock_method, test_method):
         self._verify(mock_method, test_method, ["name_or_id"], "result")
 
+    def verify_find_many(self, mock_method, test_method):
+        self._verify(mock_method, test_method, ["name_or_id"], "result")
+
     def verify_list(self, mock_method, test_method):
         self._verify(mock_method, test_method, expected=["result"])
 
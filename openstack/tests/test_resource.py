@@ -11,12 +11,19 @@
 # under the License.
 
 import copy
+import json
+import threading
+import time
 
 import httpretty
 import mock
+import six
+from six.moves.urllib import parse as url_parse
+import testtools
 from testtools import matchers
 
 from openstack import exceptions
+from openstack import find_cache
 from openstack import format
 from openstack import resource
 from openstack import session
@@ -112,6 +119,60 @@ class PropTests(base.TestCase):
 
         self.assertThat(should_raise, matchers.raises(TypeError))
 
+    def _counting_test(self):
+        calls = []
+
+        class Counted(object):
+            def __init__(self, value):
+                calls.append(value)
+                self.parsed = int(value)
+
+            def __str__(self):
+                return str(self.parsed)
+
+        class Test(resource.Resource):
+            attr = resource.prop("attr", type=Counted)
+
+        return Test, calls
+
+    def test_get_coerces_once(self):
+        Test, calls = self._counting_test()
+        t = Test.existing(attr='1')
+
+        self.assertEqual(1, t.attr)
+        count = len(calls)
+        self.assertEqual(1, t.attr)
+        self.assertEqual(1, t.attr)
+        self.assertEqual(count, len(calls))
+
+    def test_set_invalidates(self):
+        Test, calls = self._counting_test()
+        t = Test.existing(attr='1')
+        self.assertEqual(1, t.attr)
+
+        del calls[:]
+
+        t.attr = '2'
+        self.assertEqual(2, t.attr)
+        self.assertEqual('2', t['attr'])
+        self.assertEqual(2, t.attr)
+        # Validating the new value and the first get after it.
+        self.assertEqual(['2', '2'], calls)
+
+    def test_raw_change_invalidates(self):
+        Test, calls = self._counting_test()
+        t = Test.existing(attr='1')
+        self.assertEqual(1, t.attr)
+
+        t._attrs.update({'attr': '3'})
+        self.assertEqual(3, t.attr)
+
+        t['attr'] = '4'
+        self.assertEqual(4, t.attr)
+
+        del t.attr
+        self.assertEqual(None, t.attr)
+
 
 class ResourceTests(base.TestTransportBase):
 
@@ -324,6 +385,211 @@ class ResourceTests(base.TestTransportBase):
             self.assertEqual(fake_name, obj.name)
             self.assertIsInstance(obj, FakeResource)
 
+    def test_list_raw(self):
+        results = [fake_data.copy(), fake_data.copy()]
+        results[1]['id'] = fake_id + 1
+        session = mock.Mock()
+        session.get.side_effect = [mock.Mock(body={fake_resources: results}),
+                                   mock.Mock(body={fake_resources: []})]
+
+        objs = list(FakeResource.list(session, raw=True,
+                                      path_args=fake_arguments))
+
+        self.assertEqual(results, objs)
+        session.get.assert_called_with(
+            fake_path + '?marker=%d' % (fake_id + 1), params={},
+            service=None)
+
+    def _list_pages(self, cls, *bodies, **kwargs):
+        session = mock.Mock()
+        session.get.side_effect = [mock.Mock(body=body) for body in bodies]
+        objs = list(cls.list(session, path_args=fake_arguments, **kwargs))
+        return objs, session.get.call_count
+
+    def test_list_next_link(self):
+        link = {'rel': 'next', 'href': 'http://x/fakes?marker=1'}
+        objs, calls = self._list_pages(
+            FakeResource,
+            {fake_resources: [{'id': 1}], 'fakes_links': [link]},
+            {fake_resources: [{'id': 2}], 'fakes_links': []})
+
+        self.assertEqual([1, 2], [obj.id for obj in objs])
+        self.assertEqual(2, calls)
+
+    def test_list_next_links_required(self):
+        class Test(FakeResource):
+            next_links = True
+
+        objs, calls = self._list_pages(
+            Test, {fake_resources: [{'id': 1}, {'id': 2}]}, limit=2)
+
+        self.assertEqual(2, len(objs))
+        self.assertEqual(1, calls)
+
+    def test_list_without_links(self):
+        objs, calls = self._list_pages(
+            FakeResource,
+            {fake_resources: [{'id': 1}]},
+            {fake_resources: []})
+
+        self.assertEqual(1, len(objs))
+        self.assertEqual(2, calls)
+
+    def test_list_links_next_null(self):
+        objs, calls = self._list_pages(
+            FakeResource,
+            {fake_resources: [{'id': 1}], 'links': {'next': None}})
+
+        self.assertEqual(1, len(objs))
+        self.assertEqual(1, calls)
+
+    def test_list_prefetch(self):
+        fetched = threading.Event()
+        bodies = [{fake_resources: [{'id': 1}, {'id': 2}]},
+                  {fake_resources: [{'id': 3}]}]
+
+        def get(url, **kwargs):
+            if len(bodies) == 1:
+                fetched.set()
+            return mock.Mock(body=bodies.pop(0))
+
+        session = mock.Mock()
+        session.get.side_effect = get
+
+        objs = FakeResource.list(session, limit=2, prefetch=1,
+                                 path_args=fake_arguments)
+        first = next(objs)
+
+        # The second page is read while the first one is in use.
+        self.assertTrue(fetched.wait(5))
+        self.assertEqual([1, 2, 3], [first.id] + [obj.id for obj in objs])
+        query = url_parse.urlencode({'limit': 2, 'marker': 2})
+        session.get.assert_called_with(fake_path + '?' + query,
+                                       params={}, service=None)
+
+    def test_list_prefetch_error(self):
+        session = mock.Mock()
+        session.get.side_effect = [
+            mock.Mock(body={fake_resources: [{'id': 1}]}),
+            exceptions.HttpException('boom'),
+        ]
+
+        objs = FakeResource.list(session, prefetch=2,
+                                 path_args=fake_arguments)
+
+        self.assertEqual(1, next(objs).id)
+        self.assertRaises(exceptions.HttpException, next, objs)
+
+    def _stream_response(self, body):
+        data = json.dumps(body).encode('utf-8')
+        resp = mock.Mock(encoding=None)
+        resp.iter_content.return_value = [data[:7], data[7:]]
+        return resp
+
+    def test_list_stream(self):
+        resps = [
+            self._stream_response({fake_resources: [{'id': 1}, {'id': 2}],
+                                   'links': {'next': 'x'}}),
+            self._stream_response({fake_resources: [{'id': 3}],
+                                   'links': {'next': None}}),
+        ]
+        session = mock.Mock()
+        session.get.side_effect = resps
+
+        objs = FakeResource.list(session, limit=2, stream=True,
+                                 path_args=fake_arguments)
+
+        self.assertEqual(1, next(objs).id)
+        self.assertEqual(1, session.get.call_count)
+        self.assertEqual([2, 3], [obj.id for obj in objs])
+        query = url_parse.urlencode({'limit': 2, 'marker': 2})
+        session.get.assert_called_with(
+            fake_base_path % fake_arguments + '?' + query,
+            service=FakeResource.service, params={}, stream=True)
+        for resp in resps:
+            resp.close.assert_called_once_with()
+            resp.iter_content.assert_called_once_with(
+                FakeResource.STREAM_CHUNK_SIZE)
+        self.assertEqual({'links': {'next': None}}, resps[1].body)
+
+    def test_list_stream_raw(self):
+        session = mock.Mock()
+        session.get.return_value = self._stream_response(
+            {fake_resources: [{'id': 1}]})
+
+        objs = list(FakeResource.list(session, limit=2, raw=True,
+                                      stream=True, path_args=fake_arguments))
+
+        self.assertEqual([{'id': 1}], objs)
+        self.assertEqual(1, session.get.call_count)
+
+    def test_list_stream_prefetch(self):
+        objs = FakeResource.list(mock.Mock(), stream=True, prefetch=1)
+        self.assertRaises(ValueError, next, objs)
+
+    def test_list_many(self):
+        bodies = {'/fakes/a/data': {fake_resources: [{'id': 1}, {'id': 2}]},
+                  '/fakes/b/data': {fake_resources: [{'id': 3}]}}
+        session = mock.Mock()
+        session.get.side_effect = lambda url, **kw: mock.Mock(
+            body=bodies.pop(url, {fake_resources: []}))
+        parents = [{'name': 'a'}, {'name': 'b'}]
+
+        results = list(FakeResource.list_many(session, parents))
+
+        self.assertEqual(
+            [('a', 1), ('a', 2), ('b', 3)],
+            sorted((parent['name'], obj.id) for parent, obj in results))
+        self.assertIsInstance(results[0][1], FakeResource)
+
+    def test_list_many_sessions(self):
+        sessions = []
+        for i in range(3):
+            sess = mock.Mock()
+            sess.get.return_value = mock.Mock(
+                body={fake_resources: [{'id': i}]})
+            sessions.append(sess)
+
+        results = list(FakeResource.list_many(None, sessions, limit=2,
+                                              raw=True,
+                                              path_args=fake_arguments))
+
+        self.assertEqual(sorted([(sess, {'id': i})
+                                 for i, sess in enumerate(sessions)],
+                                key=lambda r: r[1]['id']),
+                         sorted(results, key=lambda r: r[1]['id']))
+
+    def test_list_many_concurrency(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def get(url, **kwargs):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return mock.Mock(body={fake_resources: []})
+
+        session = mock.Mock()
+        session.get.side_effect = get
+        parents = [{'name': str(i)} for i in range(10)]
+
+        results = list(FakeResource.list_many(session, parents,
+                                              concurrency=3))
+
+        self.assertEqual([], results)
+        self.assertEqual(10, session.get.call_count)
+        self.assertTrue(1 <= running[1] <= 3)
+
+    def test_list_many_error(self):
+        session = mock.Mock()
+        session.get.side_effect = exceptions.HttpException('boom')
+
+        self.assertRaises(exceptions.HttpException, list,
+                          FakeResource.list_many(session, [{'name': 'a'}]))
+
     def test_list_bail_out(self):
         results = [fake_data.copy(), fake_data.copy(), fake_data.copy()]
         body = mock.Mock(body={fake_resources: results})
@@ -481,6 +747,123 @@ class TestFind(base.TestCase):
         path = fake_path + "?limit=2"
         self.mock_get.assert_any_call(path, params=p, service=None)
 
+    def test_cache(self):
+        self.mock_session.find_cache = find_cache.FindCache()
+        self.mock_get.return_value = FakeResponse(
+            {FakeResource.resources_key: [self.matrix]})
+
+        first = FakeResource.find(self.mock_session, self.ID,
+                                  path_args=fake_arguments)
+        second = FakeResource.find(self.mock_session, self.ID,
+                                   path_args=fake_arguments)
+
+        self.assertEqual(self.ID, second.id)
+        self.assertIsNot(first, second)
+        self.assertEqual(1, self.mock_get.call_count)
+        self.assertEqual(1, self.mock_session.find_cache.hits)
+
+    def test_cache_copies(self):
+        self.mock_session.find_cache = find_cache.FindCache()
+        self.mock_get.return_value = FakeResponse(
+            {FakeResource.resources_key: [{'id': self.ID,
+                                           'meta': {'a': '1'}}]})
+
+        FakeResource.find(self.mock_session, self.ID)['meta']['b'] = '2'
+        second = FakeResource.find(self.mock_session, self.ID)
+        second['meta']['c'] = '3'
+        third = FakeResource.find(self.mock_session, self.ID)
+
+        self.assertEqual({'a': '1'}, third['meta'])
+        self.assertEqual(1, self.mock_get.call_count)
+
+    def test_cache_not_found(self):
+        self.mock_session.find_cache = find_cache.FindCache()
+        self.mock_get.return_value = FakeResponse(
+            {FakeResource.resources_key: []})
+
+        self.assertIsNone(FakeResource.find(self.mock_session, self.NAME))
+        self.assertIsNone(FakeResource.find(self.mock_session, self.NAME))
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_cache_invalidated(self):
+        self.mock_session.find_cache = find_cache.FindCache()
+        self.mock_get.return_value = FakeResponse(
+            {FakeResource.resources_key: [self.matrix]})
+        self.mock_session.delete.return_value = None
+
+        FakeResource.find(self.mock_session, self.ID)
+        FakeResource.delete_by_id(self.mock_session, self.ID,
+                                  path_args=fake_arguments)
+        FakeResource.find(self.mock_session, self.ID)
+
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_find_many(self):
+        items = [{'id': 'a', 'name': 'alpha'}, {'id': 'b', 'name': 'beta'},
+                 {'id': 'c', 'name': 'beta'}, {'id': 'd', 'name': 'a'}]
+        self.mock_get.side_effect = [
+            FakeResponse({FakeResource.resources_key: items}),
+            FakeResponse({FakeResource.resources_key: []}),
+        ]
+
+        result = FakeResource.find_many(self.mock_session,
+                                        ['a', 'alpha', 'gamma', 'a'])
+
+        self.assertEqual(set(['a', 'alpha', 'gamma']), set(result))
+        # An id match wins over a name match.
+        self.assertEqual('a', result['a'].id)
+        self.assertEqual('a', result['alpha'].id)
+        self.assertIsNone(result['gamma'])
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_find_many_dups(self):
+        items = [{'id': 'b', 'name': 'beta'}, {'id': 'c', 'name': 'beta'}]
+        self.mock_get.side_effect = [
+            FakeResponse({FakeResource.resources_key: items}),
+            FakeResponse({FakeResource.resources_key: []}),
+        ]
+
+        exc = self.assertRaises(exceptions.DuplicateResource,
+                                FakeResource.find_many, self.mock_session,
+                                ['beta', 'b'])
+        self.assertIn("'beta'", exc.message)
+
+    def test_find_many_filters(self):
+        class Test(FakeResource):
+            multi_value_filters = True
+            next_links = True
+
+        self.mock_get.side_effect = [
+            FakeResponse({FakeResource.resources_key: [{'id': 'a'}]}),
+            FakeResponse({FakeResource.resources_key: [
+                {'id': 'b', 'name': 'beta', 'status': 'ACTIVE'}]}),
+        ]
+
+        result = Test.find_many(self.mock_session, ['a', 'beta'])
+
+        self.assertEqual('a', result['a'].id)
+        self.assertEqual({'id': 'b', 'name': 'beta', 'status': 'ACTIVE'},
+                         dict(result['beta']))
+        self.mock_get.assert_any_call(
+            fake_base_path, service=None, params={'id': ['a', 'beta']})
+        self.mock_get.assert_called_with(
+            fake_base_path, service=None, params={'name': ['beta']})
+
+    def test_find_many_cache(self):
+        self.mock_session.find_cache = find_cache.FindCache()
+        self.mock_get.side_effect = [
+            FakeResponse({FakeResource.resources_key: [
+                {'id': self.ID, 'meta': {'a': '1'}}]}),
+            FakeResponse({FakeResource.resources_key: []}),
+        ]
+
+        found = FakeResource.find_many(self.mock_session, [self.ID])
+        found[self.ID]['meta']['b'] = '2'
+        result = FakeResource.find(self.mock_session, self.ID)
+
+        self.assertEqual({'id': self.ID, 'meta': {'a': '1'}}, dict(result))
+        self.assertEqual(2, self.mock_get.call_count)
+
     def test_dups(self):
         dup = {'id': 'Larry'}
         resp = FakeResponse({FakeResource.resources_key: [self.matrix, dup]})
@@ -554,3 +937,81 @@ class TestFind(base.TestCase):
         def set_invalid():
             faker.enabled = 'INVALID'
         self.assertRaises(ValueError, set_invalid)
+
+
+class CompactResource(resource.Resource):
+    __slots__ = ()
+    compact = True
+
+    enabled = resource.prop('enabled', type=format.BoolStr)
+    name = resource.prop('name')
+    first = resource.prop('attr1')
+
+
+class TestCompact(base.TestCase):
+
+    def setUp(self):
+        super(TestCompact, self).setUp()
+        self.data = {'id': fake_id, 'enabled': True, 'name': fake_name,
+                     'attr1': fake_attr1, 'attr2': fake_attr2}
+
+    @testtools.skipIf(six.PY2, 'the Mapping ABCs have no __slots__')
+    def test_no_dict(self):
+        sot = CompactResource.existing(**self.data)
+
+        self.assertFalse(hasattr(sot, '__dict__'))
+        self.assertRaises(AttributeError, setattr, sot, 'other', 1)
+
+    def test_existing(self):
+        sot = CompactResource.existing(**self.data)
+
+        self.assertEqual(fake_id, sot.id)
+        self.assertEqual(fake_name, sot.name)
+        self.assertEqual(fake_attr1, sot.first)
+        self.assertTrue(sot.enabled)
+        # Server data isn't rewritten by the prop setters.
+        self.assertIs(True, sot['enabled'])
+        self.assertFalse(sot.is_dirty)
+        self.assertIsNone(sot._dirty)
+
+    def test_new(self):
+        sot = CompactResource.new(name=fake_name, enabled=True, other=1)
+
+        self.assertEqual('True', sot['enabled'])
+        self.assertEqual(1, sot['other'])
+        self.assertEqual(set(['name', 'enabled', 'other']), sot._dirty)
+        self.assertRaises(ValueError, CompactResource.new, enabled='INVALID')
+
+    def test_dirty(self):
+        sot = CompactResource.existing(**self.data)
+
+        sot['attr1'] = fake_attr1
+        self.assertIsNone(sot._dirty)
+
+        sot['attr1'] = 'changed'
+        self.assertTrue(sot.is_dirty)
+        self.assertEqual(set(['attr1']), sot._dirty)
+
+        sot._reset_dirty()
+        self.assertFalse(sot.is_dirty)
+        del sot['attr2']
+        self.assertEqual(set(['attr2']), sot._dirty)
+
+    def test_compact_subclass(self):
+        class Test(FakeResource):
+            compact = True
+
+        sot = Test.existing(**self.data)
+
+        self.assertIs(True, sot['enabled'])
+        self.assertEqual(fake_attr2, sot['attr2'])
+        self.assertFalse(hasattr(sot, 'attr2'))
+        sot.other = 1
+        self.assertEqual(1, sot.other)
+
+    def test_not_compact(self):
+        sot = FakeResource.existing(**self.data)
+
+        self.assertTrue(hasattr(sot, '__dict__'))
+        self.assertIsNone(sot._dirty)
+        self.assertEqual('True', sot['enabled'])
@@ -0,0 +1,93 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import email.utils
+import time
+
+import mock
+import testtools
+
+from openstack import retry
+
+
+def fake_response(status_code, headers=None):
+    resp = mock.Mock()
+    resp.status_code = status_code
+    resp.headers = headers or {}
+    return resp
+
+
+class TestRetryPolicy(testtools.TestCase):
+
+    def test_connection_error(self):
+        sot = retry.RetryPolicy(backoff=1, jitter=False)
+        self.assertEqual(1, sot.get_delay('GET', 1))
+
+    def test_backoff(self):
+        sot = retry.RetryPolicy(max_attempts=10, backoff=1, max_backoff=5,
+                                jitter=False)
+        resp = fake_response(503)
+        delays = [sot.get_delay('GET', attempt, resp)
+                  for attempt in range(1, 6)]
+        self.assertEqual([1, 2, 4, 5, 5], delays)
+
+    def test_jitter(self):
+        sot = retry.RetryPolicy(max_attempts=10, backoff=1)
+        for i in range(20):
+            delay = sot.get_delay('GET', 3, fake_response(503))
+            self.assertTrue(0 <= delay <= 4)
+
+    def test_max_attempts(self):
+        sot = retry.RetryPolicy(max_attempts=2)
+        self.assertNotEqual(None, sot.get_delay('GET', 1, fake_response(503)))
+        self.assertEqual(None, sot.get_delay('GET', 2, fake_response(503)))
+
+    def test_status(self):
+        sot = retry.RetryPolicy()
+        self.assertEqual(None, sot.get_delay('GET', 1, fake_response(200)))
+        self.assertEqual(None, sot.get_delay('GET', 1, fake_response(404)))
+        self.assertNotEqual(None, sot.get_delay('GET', 1, fake_response(429)))
+
+    def test_methods(self):
+        sot = retry.RetryPolicy()
+        self.assertEqual(None, sot.get_delay('POST', 1, fake_response(503)))
+        self.assertEqual(None, sot.get_delay('PATCH', 1))
+        self.assertNotEqual(None, sot.get_delay('put', 1, fake_response(503)))
+
+        sot = retry.RetryPolicy(methods=['post'])
+        self.assertNotEqual(None, sot.get_delay('POST', 1))
+
+    def test_retry_after_seconds(self):
+        sot = retry.RetryPolicy()
+        resp = fake_response(429, {'Retry-After': '7'})
+        self.assertEqual(7, sot.get_delay('GET', 1, resp))
+
+    def test_retry_after_date(self):
+        sot = retry.RetryPolicy()
+        date = email.utils.formatdate(time.time() + 10, usegmt=True)
+        resp = fake_response(503, {'Retry-After': date})
+        self.assertTrue(8 <= sot.get_delay('GET', 1, resp) <= 10)
+
+    def test_retry_after_too_long(self):
+        sot = retry.RetryPolicy(max_backoff=5)
+        resp = fake_response(503, {'Retry-After': '60'})
+        self.assertEqual(None, sot.get_delay('GET', 1, resp))
+
+    def test_retry_after_ignored(self):
+        sot = retry.RetryPolicy(backoff=1, jitter=False, retry_after=False)
+        resp = fake_response(503, {'Retry-After': '7'})
+        self.assertEqual(1, sot.get_delay('GET', 1, resp))
+
+    def test_retry_after_invalid(self):
+        sot = retry.RetryPolicy(backoff=1, jitter=False)
+        resp = fake_response(503, {'Retry-After': 'soon'})
+        self.assertEqual(1, sot.get_delay('GET', 1, resp))
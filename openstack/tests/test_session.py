@@ -10,7 +10,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import six
+
 from openstack.auth import service_filter
+from openstack import exceptions
+from openstack import retry
 from openstack import session
 from openstack.tests import base
 from openstack.tests import fakes
@@ -73,6 +77,16 @@ class TestSession(base.TestCase):
         url = self.auth.ENDPOINT + self.TEST_PATH
         self.xport.request.assert_called_with('DELETE', url, **self.expected)
 
+    def test_retry(self):
+        policy = retry.RetryPolicy()
+        sess = session.Session(self.xport, self.auth, retry=policy)
+
+        sess.get(self.TEST_PATH, service=self.serv)
+
+        url = self.auth.ENDPOINT + self.TEST_PATH
+        self.xport.request.assert_called_with('GET', url, retry=policy,
+                                              **self.expected)
+
     def test_patch(self):
         resp = self.sess.patch(self.TEST_PATH, service=self.serv)
 
@@ -81,3 +95,114 @@ class TestSession(base.TestCase):
         self.auth.get_endpoint.assert_called_with(self.xport, self.serv)
         url = self.auth.ENDPOINT + self.TEST_PATH
         self.xport.request.assert_called_with('PATCH', url, **self.expected)
+
+    def test_endpoint_cached(self):
+        self.sess.get(self.TEST_PATH, service=self.serv)
+        self.sess.get(self.TEST_PATH, service=self.serv)
+
+        self.assertEqual(1, self.auth.get_endpoint.call_count)
+        self.assertEqual(2, self.xport.request.call_count)
+
+    def test_endpoint_cache_new_token(self):
+        self.sess.get(self.TEST_PATH, service=self.serv)
+        self.auth.get_token.return_value = 'new_token'
+        self.sess.get(self.TEST_PATH, service=self.serv)
+
+        self.assertEqual(2, self.auth.get_endpoint.call_count)
+
+    def test_endpoint_cache_preference(self):
+        self.sess.get(self.TEST_PATH, service=self.serv)
+        self.sess.preference.set_region('identity', 'zion')
+        self.sess.get(self.TEST_PATH, service=self.serv)
+
+        self.assertEqual(2, self.auth.get_endpoint.call_count)
+        joined = self.auth.get_endpoint.call_args[0][1]
+        self.assertEqual('zion', joined.region)
+
+    def test_endpoint_not_cached_without_authenticate(self):
+        self.sess.get(self.TEST_PATH, service=self.serv, authenticate=False)
+        self.sess.get(self.TEST_PATH, service=self.serv, authenticate=False)
+
+        self.assertEqual(2, self.auth.get_endpoint.call_count)
+
+    def test_unauthorized_retry(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        self.xport.request.side_effect = [unauthorized, self.xport.RESPONSE]
+        self.auth.invalidate.return_value = True
+
+        resp = self.sess.get(self.TEST_PATH, service=self.serv)
+
+        self.assertEqual(self.xport.RESPONSE, resp)
+        self.assertEqual(1, self.auth.invalidate.call_count)
+        self.assertEqual(2, self.xport.request.call_count)
+
+    def test_unauthorized_already_reauthenticated(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        self.xport.request.side_effect = [unauthorized, self.xport.RESPONSE]
+        self.auth.get_token.side_effect = ['old', 'new', 'new']
+
+        resp = self.sess.get(self.TEST_PATH, service=self.serv)
+
+        self.assertEqual(self.xport.RESPONSE, resp)
+        self.assertFalse(self.auth.invalidate.called)
+        headers = self.xport.request.call_args[1]['headers']
+        self.assertEqual('new', headers['X-Auth-Token'])
+
+    def test_unauthorized_retry_once(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        self.xport.request.side_effect = unauthorized
+        self.auth.invalidate.return_value = True
+
+        self.assertRaises(exceptions.HttpException, self.sess.get,
+                          self.TEST_PATH, service=self.serv)
+        self.assertEqual(2, self.xport.request.call_count)
+
+    def test_unauthorized_cannot_invalidate(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        self.xport.request.side_effect = unauthorized
+        self.auth.invalidate.return_value = False
+
+        self.assertRaises(exceptions.HttpException, self.sess.get,
+                          self.TEST_PATH, service=self.serv)
+        self.assertEqual(1, self.xport.request.call_count)
+
+    def test_forbidden_not_retried(self):
+        forbidden = exceptions.HttpException('Forbidden', status_code=403)
+        self.xport.request.side_effect = forbidden
+
+        self.assertRaises(exceptions.HttpException, self.sess.get,
+                          self.TEST_PATH, service=self.serv)
+        self.assertFalse(self.auth.invalidate.called)
+
+    def test_unauthorized_rewinds_body(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        bodies = []
+
+        def request(method, url, data=None, **kwargs):
+            bodies.append(data.read())
+            if len(bodies) == 1:
+                raise unauthorized
+            return self.xport.RESPONSE
+
+        self.xport.request.side_effect = request
+        data = six.BytesIO(b'payload')
+
+        self.sess.put(self.TEST_PATH, service=self.serv, data=data)
+
+        self.assertEqual([b'payload', b'payload'], bodies)
+
+    def test_unauthorized_body_not_replayable(self):
+        unauthorized = exceptions.HttpException('Unauthorized',
+                                                status_code=401)
+        self.xport.request.side_effect = unauthorized
+        data = (chunk for chunk in [b'pay', b'load'])
+
+        self.assertRaises(exceptions.HttpException, self.sess.put,
+                          self.TEST_PATH, service=self.serv, data=data)
+        self.assertEqual(1, self.xport.request.call_count)
+        self.assertFalse(self.auth.invalidate.called)
@@ -20,6 +20,7 @@ import requests
 import six
 
 from openstack import exceptions
+from openstack import retry
 from openstack.tests import base
 from openstack import transport
 
@@ -111,8 +112,8 @@ class TestTransport(base.TestTransportBase):
         resp = xport.patch(self.TEST_URL, json=fake_record2)
         self.assertEqual(httpretty.PATCH, httpretty.last_request().method)
         self.assertEqual(
-            json.dumps(fake_record2),
-            httpretty.last_request().body.decode('utf-8'),
+            fake_record2,
+            json.loads(httpretty.last_request().body.decode('utf-8')),
         )
         self.assertResponseOK(resp, body=fake_response_json)
 
@@ -123,8 +124,8 @@ class TestTransport(base.TestTransportBase):
         resp = xport.post(self.TEST_URL, json=fake_record2)
         self.assertEqual(httpretty.POST, httpretty.last_request().method)
         self.assertEqual(
-            json.dumps(fake_record2),
-            httpretty.last_request().body.decode('utf-8'),
+            fake_record2,
+            json.loads(httpretty.last_request().body.decode('utf-8')),
         )
         self.assertResponseOK(resp, body=fake_response_json)
 
@@ -149,8 +150,8 @@ class TestTransport(base.TestTransportBase):
         resp = xport.put(self.TEST_URL, json=fake_record2)
         self.assertEqual(httpretty.PUT, httpretty.last_request().method)
         self.assertEqual(
-            json.dumps(fake_record2),
-            httpretty.last_request().body.decode('utf-8'),
+            fake_record2,
+            json.loads(httpretty.last_request().body.decode('utf-8')),
         )
         self.assertResponseOK(resp, body=fake_response_json)
 
@@ -173,6 +174,51 @@ class TestTransport(base.TestTransportBase):
         self.assertRequestHeaderEqual('Accept', transport.JSON)
         self.assertEqual(fake_record1, resp.json())
 
+    @httpretty.activate
+    def test_json_codec(self):
+        self.stub_url(httpretty.POST, json=fake_record1)
+        codec = mock.Mock()
+        codec.dumps.return_value = b'encoded'
+        codec.loads.return_value = {'decoded': True}
+        xport = transport.Transport(json_codec=codec)
+
+        resp = xport.post(self.TEST_URL, json=fake_record2)
+
+        codec.dumps.assert_called_once_with(fake_record2)
+        self.assertEqual(b'encoded', httpretty.last_request().body)
+        codec.loads.assert_called_once_with(resp.content)
+        self.assertEqual({'decoded': True}, resp.body)
+
+    @httpretty.activate
+    def test_json_codec_name(self):
+        self.stub_url(httpretty.GET, body='{"a": ')
+        xport = transport.Transport(json_codec='json')
+
+        self.assertEqual('json', xport._json_codec.name)
+        self.assertRaises(exceptions.InvalidResponse, xport.get,
+                          self.TEST_URL)
+
+    @httpretty.activate
+    def test_json_unknown_charset(self):
+        self.stub_url(httpretty.GET, body=u'{"name": "caf\u00e9"}',
+                      content_type='application/json; charset=utf8mb4')
+        xport = transport.Transport(accept=transport.JSON)
+
+        resp = xport.get(self.TEST_URL)
+
+        self.assertEqual({'name': u'caf\u00e9'}, resp.body)
+
+    @httpretty.activate
+    def test_stream_json(self):
+        self.stub_url(httpretty.GET, json=fake_record1)
+        xport = transport.Transport(accept=transport.JSON)
+
+        resp = xport.get(self.TEST_URL, stream=True)
+
+        self.assertFalse(hasattr(resp, 'body'))
+        self.assertFalse(resp._content_consumed)
+        self.assertEqual(fake_record1, resp.json())
+
     @httpretty.activate
     def test_user_agent_no_arg(self):
         self.stub_url(httpretty.GET, body=fake_response)
@@ -267,6 +313,112 @@ class TestTransport(base.TestTransportBase):
         xport = transport.Transport(verify='ca-file')
         self.assertEqual('ca-file', xport.verify)
 
+    def test_pool_args_default(self):
+        xport = transport.Transport()
+        adapter = xport.get_adapter(self.TEST_URL)
+        self.assertEqual(transport.Transport.DEFAULT_POOL_MAXSIZE,
+                         adapter._pool_maxsize)
+        self.assertEqual(transport.Transport.DEFAULT_POOL_BLOCK,
+                         adapter._pool_block)
+
+    def test_pool_args(self):
+        xport = transport.Transport(pool_connections=2, pool_maxsize=20,
+                                    pool_block=True, max_retries=3)
+        for url in ('http://127.0.0.1', 'https://127.0.0.1'):
+            adapter = xport.get_adapter(url)
+            self.assertEqual(2, adapter._pool_connections)
+            self.assertEqual(20, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+            self.assertEqual(3, adapter.max_retries.total)
+
+    @httpretty.activate
+    def test_pool_stats(self):
+        xport = transport.Transport()
+        self.stub_url(httpretty.GET, body=fake_response_json)
+        self.assertEqual({}, xport.get_pool_stats())
+
+        xport.get(self.TEST_URL)
+        xport.get(self.TEST_URL)
+
+        stats = xport.get_pool_stats()
+        self.assertEqual(1, len(stats))
+        pool = list(stats.values())[0]
+        self.assertEqual(2, pool['requests'])
+        self.assertEqual(pool['requests'] - pool['connections'],
+                         pool['reused'])
+
+    @httpretty.activate
+    @mock.patch('time.sleep')
+    def test_retry(self, mock_sleep):
+        policy = retry.RetryPolicy(backoff=1, jitter=False)
+        xport = transport.Transport(retry=policy)
+        self.stub_url(httpretty.GET, responses=[
+            httpretty.Response(body='', status=503),
+            httpretty.Response(body='', status=429, Retry_After='3'),
+            httpretty.Response(body=fake_response_json, status=200),
+        ])
+
+        resp = xport.get(self.TEST_URL)
+
+        self.assertTrue(resp.ok)
+        self.assertEqual([mock.call(1), mock.call(3)],
+                         mock_sleep.call_args_list)
+        self.assertEqual({'http://www.root.url': {503: 1, 429: 1}},
+                         xport.get_retry_stats())
+
+    @httpretty.activate
+    @mock.patch('time.sleep')
+    def test_retry_exhausted(self, mock_sleep):
+        xport = transport.Transport(retry=retry.RetryPolicy(max_attempts=2))
+        self.stub_url(httpretty.GET, status=503)
+
+        exc = self.assertRaises(exceptions.HttpException, xport.get,
+                                self.TEST_URL)
+
+        self.assertEqual(503, exc.status_code)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @httpretty.activate
+    @mock.patch('time.sleep')
+    def test_retry_not_idempotent(self, mock_sleep):
+        xport = transport.Transport(retry=retry.RetryPolicy())
+        self.stub_url(httpretty.POST, status=503)
+
+        self.assertRaises(exceptions.HttpException, xport.post,
+                          self.TEST_URL, json={})
+
+        self.assertEqual(0, mock_sleep.call_count)
+        self.assertEqual({}, xport.get_retry_stats())
+
+    @httpretty.activate
+    @mock.patch('time.sleep')
+    def test_retry_per_request(self, mock_sleep):
+        xport = transport.Transport()
+        self.stub_url(httpretty.GET, responses=[
+            httpretty.Response(body='', status=503),
+            httpretty.Response(body=fake_response_json, status=200),
+        ])
+
+        resp = xport.get(self.TEST_URL, retry=retry.RetryPolicy())
+
+        self.assertTrue(resp.ok)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @mock.patch('time.sleep')
+    def test_retry_connection_error(self, mock_sleep):
+        xport = transport.Transport(retry=retry.RetryPolicy(max_attempts=3))
+        resp = mock.Mock(status_code=200, headers={}, history=[],
+                         content=b'{}', encoding=None)
+        send = self.useFixture(fixtures.MockPatchObject(
+            xport, '_send_request', side_effect=[
+                requests.ConnectionError('reset'), resp])).mock
+
+        self.assertEqual(resp, xport.get(self.TEST_URL))
+
+        self.assertEqual(2, send.call_count)
+        self.assertEqual({'http://www.root.url': {'connection': 1}},
+                         xport.get_retry_stats())
+
     @httpretty.activate
     def test_not_found(self):
         xport = transport.Transport()
@@ -300,7 +452,7 @@ class TestTransportDebug(base.TestTransportBase):
     @httpretty.activate
     def test_debug_post(self):
         self.stub_url(httpretty.POST, body=fake_response)
-        xport = transport.Transport()
+        xport = transport.Transport(json_codec='json')
         headers = {
             'User-Agent': 'fake-curl',
             'X-Random-Header': 'x-random-value',
@@ -318,8 +470,8 @@ class TestTransportDebug(base.TestTransportBase):
         )
         self.assertEqual(httpretty.POST, httpretty.last_request().method)
         self.assertEqual(
-            json.dumps(fake_record2),
-            httpretty.last_request().body.decode('utf-8'),
+            fake_record2,
+            json.loads(httpretty.last_request().body.decode('utf-8')),
         )
         self.assertResponseOK(resp, body=fake_response)
 
@@ -340,6 +492,61 @@ class TestTransportDebug(base.TestTransportBase):
             self.assertIn(k, self.log_fixture.output)
             self.assertIn(v, self.log_fixture.output)
 
+    @httpretty.activate
+    def test_debug_response_once(self):
+        self.stub_url(httpretty.GET, body=fake_response)
+        xport = transport.Transport()
+
+        xport.get(self.TEST_URL, accept=None)
+
+        self.assertEqual(1, self.log_fixture.output.count('RESP:'))
+        self.assertEqual(1, self.log_fixture.output.count(fake_response))
+
+    @httpretty.activate
+    def test_debug_binary(self):
+        self.stub_url(httpretty.PUT, body=b'\x00\xff' * 8,
+                      content_type='application/octet-stream')
+        xport = transport.Transport()
+
+        xport.put(self.TEST_URL, data=b'\x01\xfe' * 4, accept=None,
+                  headers={'Content-Type': 'application/octet-stream'})
+
+        self.assertIn("--data ' <8 bytes of application/octet-stream> '",
+                      self.log_fixture.output)
+        self.assertIn('RESP BODY: <16 bytes of application/octet-stream>',
+                      self.log_fixture.output)
+
+    @httpretty.activate
+    def test_debug_body_limit(self):
+        self.stub_url(httpretty.POST, body=fake_response)
+        xport = transport.Transport(log_body_limit=10)
+
+        xport.post(self.TEST_URL, json=fake_record2, accept=None)
+
+        self.assertIn('bytes of application/json>', self.log_fixture.output)
+        self.assertIn('RESP BODY: <%d bytes of text/plain' %
+                      len(fake_response), self.log_fixture.output)
+        self.assertNotIn(fake_response, self.log_fixture.output)
+
+    @httpretty.activate
+    def test_debug_stream(self):
+        self.stub_url(httpretty.GET, body=fake_response)
+        xport = transport.Transport()
+
+        resp = xport.get(self.TEST_URL, accept=None, stream=True)
+
+        self.assertIn('RESP BODY: <not read>', self.log_fixture.output)
+        self.assertEqual(fake_response, resp.text)
+
+    def test_no_debug(self):
+        self.log_fixture = self.useFixture(
+            fixtures.FakeLogger(level=logging.INFO),
+        )
+        xport = transport.Transport()
+
+        # Nothing of the response is looked at.
+        xport._log_response(mock.NonCallableMock(spec=[]))
+
 
 class TestTransportRedirects(base.TestTransportBase):
 
@@ -509,6 +716,99 @@ class TestTransportRedirects(base.TestTransportBase):
             self.assertEqual(s.url, r.url)
             self.assertEqual(s.status_code, r.status_code)
 
+    @httpretty.activate
+    def test_permanent_redirect_cached(self):
+        self.setup_redirects(status=301)
+        xport = transport.Transport(accept=None)
+
+        resp = xport.get(self.REDIRECT_CHAIN[0])
+        self.assertEqual(len(self.REDIRECT_CHAIN) - 1, len(resp.history))
+
+        resp = xport.get(self.REDIRECT_CHAIN[0])
+        self.assertResponseOK(resp, body=fake_response)
+        self.assertEqual([], resp.history)
+        self.assertEqual(self.REDIRECT_CHAIN[-1], resp.url)
+
+        xport.clear_redirect_cache()
+        resp = xport.get(self.REDIRECT_CHAIN[0])
+        self.assertEqual(len(self.REDIRECT_CHAIN) - 1, len(resp.history))
+
+    @httpretty.activate
+    def test_permanent_redirect_cached_with_params(self):
+        old = 'http://oldhost/servers'
+        new = 'http://newhost/servers'
+
+        def moved(request, uri, headers):
+            query = uri.split('?', 1)[1]
+            headers['location'] = new + '?' + query
+            return 301, headers, fake_redirect
+
+        httpretty.register_uri(httpretty.GET, old, body=moved)
+        httpretty.register_uri(httpretty.GET, new, body=fake_response)
+        xport = transport.Transport(accept=None)
+
+        resp = xport.get(old, params={'name': 'a'})
+        self.assertEqual(new + '?name=a', resp.url)
+
+        resp = xport.get(old, params={'name': 'b'})
+        self.assertEqual(1, len(resp.history))
+        self.assertEqual(new + '?name=b', resp.url)
+
+        resp = xport.get(old, params={'name': 'a'})
+        self.assertEqual([], resp.history)
+        self.assertEqual(new + '?name=a', resp.url)
+
+    @httpretty.activate
+    def test_permanent_redirect_308(self):
+        self.setup_redirects(status=308)
+        xport = transport.Transport(accept=None)
+
+        xport.get(self.REDIRECT_CHAIN[1])
+        resp = xport.get(self.REDIRECT_CHAIN[1])
+
+        self.assertResponseOK(resp, body=fake_response)
+        self.assertEqual([], resp.history)
+
+    @httpretty.activate
+    def test_temporary_redirect_not_cached(self):
+        self.setup_redirects(status=302)
+        xport = transport.Transport(accept=None)
+
+        xport.get(self.REDIRECT_CHAIN[0])
+        resp = xport.get(self.REDIRECT_CHAIN[0])
+
+        self.assertEqual(len(self.REDIRECT_CHAIN) - 1, len(resp.history))
+
+    @httpretty.activate
+    def test_no_redirect_not_cached(self):
+        self.setup_redirects(status=301)
+        xport = transport.Transport(accept=None)
+        xport.get(self.REDIRECT_CHAIN[0])
+
+        resp = xport.get(self.REDIRECT_CHAIN[0], redirect=False)
+
+        self.assertEqual(301, resp.status_code)
+        self.assertEqual(self.REDIRECT_CHAIN[0], resp.url)
+
+    @httpretty.activate
+    def test_redirect_cache_size(self):
+        self.setup_redirects(status=301)
+        xport = transport.Transport(accept=None, redirect_cache_size=2)
+
+        xport.get(self.REDIRECT_CHAIN[0])
+
+        self.assertEqual(
+            {('GET', self.REDIRECT_CHAIN[1]): self.REDIRECT_CHAIN[2],
+             ('GET', self.REDIRECT_CHAIN[2]): self.REDIRECT_CHAIN[3]},
+            xport._redirect_cache)
+
+        resp = xport.get(self.REDIRECT_CHAIN[1])
+        self.assertEqual([], resp.history)
+
+        xport = transport.Transport(accept=None, redirect_cache_size=0)
+        xport.get(self.REDIRECT_CHAIN[0])
+        self.assertEqual({}, xport._redirect_cache)
+
     def test_parse_error_response(self):
         xport = transport.Transport(redirect=True)
         resp = mock.Mock()
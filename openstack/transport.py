@@ -51,7 +51,8 @@ Creating a new object in an OpenStack service is similarly simple::
 
 Passing in the new_record dict with the ``json`` keyword argument performs the
 ``json.dumps()`` prior to the request being sent.  This is an addition to
-the capabilities of ``requests.Session``.
+the capabilities of ``requests.Session``.  Bodies are encoded and decoded with
+the fastest JSON library installed, see :mod:`~openstack.json_codec`.
 
 Additional HTTP Methods
 ~~~~~~~~~~~~~~~~~~~~~~~
@@ -92,6 +93,32 @@ for an API.
 
 See: https://en.wikipedia.org/wiki/Post/Redirect/Get
 
+Permanent redirections (301 and 308) are remembered for each method and URL,
+query string included, so later requests go straight to the new location
+without the extra round trip.  See the ``redirect_cache_size`` argument of
+:class:`~openstack.transport.Transport`.  A location is followed as given,
+the ``params`` of the request are not added to it again.
+
+Connection Pooling
+~~~~~~~~~~~~~~~~~~
+
+Connections are kept open and reused between requests to the same host.
+The size and behaviour of the pools can be tuned when creating the
+Transport, for example for an application running many threads::
+
+    from openstack import transport
+    trans = transport.Transport(pool_maxsize=50, pool_block=True)
+
+``pool_connections`` is the number of hosts to keep pools for,
+``pool_maxsize`` the number of connections kept open to each host and
+``pool_block`` whether a request waits for a free connection rather than
+opening one that won't be kept once the pool is full.  ``max_retries`` is
+the number of times a failed connection attempt is retried.  Retrying
+requests that did get a response is up to a
+:class:`~openstack.retry.RetryPolicy` given as ``retry``.  How well the
+pools are doing can be seen with
+:meth:`~openstack.transport.Transport.get_pool_stats`.
+
 User-Agent
 ~~~~~~~~~~
 
@@ -116,30 +143,71 @@ such that ``MyProgram/1.0`` is a proper user-agent.
 
 """
 
-import json
+import codecs
+import collections
 import logging
+import sys
+import threading
+import time
 
 import requests
+from requests import adapters
 import six
 from six.moves import urllib
 
 import openstack
 from openstack import exceptions
-
-#: Default value for the HTTP User-Agent header. The default includes the
-#: version information of the SDK as well as ``requests``, Python,
-#: and the operating system.
-USER_AGENT = "python-openstacksdk/%s %s" % (
-    openstack.__version__, requests.utils.default_user_agent())
+from openstack import json_codec as json_codec_
+from openstack import utils
+
+
+def _get_default_user_agent():
+    # Applications may replace USER_AGENT, so always look it up.
+    agent = globals().get('USER_AGENT')
+    if agent is None:
+        agent = "python-openstacksdk/%s %s" % (
+            openstack.__version__, requests.utils.default_user_agent())
+        globals()['USER_AGENT'] = agent
+    return agent
+
+
+if sys.version_info >= (3, 7):
+    # Finding the SDK version is slow, so where modules can compute their
+    # attributes on demand, wait for the first Transport to do it.
+    def __getattr__(name):
+        if name == 'USER_AGENT':
+            return _get_default_user_agent()
+        raise AttributeError("module %r has no attribute %r" %
+                             (__name__, name))
+else:
+    #: Default value for the HTTP User-Agent header. The default includes
+    #: the version information of the SDK as well as ``requests``, Python,
+    #: and the operating system.
+    USER_AGENT = _get_default_user_agent()
 
 _logger = logging.getLogger(__name__)
 JSON = 'application/json'
 
+# The content types of bodies that are worth logging, besides text/*.
+_TEXT_TYPES = frozenset([
+    JSON,
+    'application/xml',
+    'application/x-www-form-urlencoded',
+    'application/javascript',
+])
+
 
 class Transport(requests.Session):
 
-    REDIRECT_STATUSES = (301, 302, 303, 305, 307)
+    REDIRECT_STATUSES = (301, 302, 303, 305, 307, 308)
+    PERMANENT_REDIRECT_STATUSES = (301, 308)
     DEFAULT_REDIRECT_LIMIT = 30
+    DEFAULT_REDIRECT_CACHE_SIZE = 100
+    DEFAULT_POOL_CONNECTIONS = adapters.DEFAULT_POOLSIZE
+    DEFAULT_POOL_MAXSIZE = adapters.DEFAULT_POOLSIZE
+    DEFAULT_POOL_BLOCK = adapters.DEFAULT_POOLBLOCK
+    DEFAULT_MAX_RETRIES = adapters.DEFAULT_RETRIES
+    DEFAULT_LOG_BODY_LIMIT = 65536
 
     def __init__(
             self,
@@ -147,6 +215,14 @@ class Transport(requests.Session):
             verify=True,
             redirect=DEFAULT_REDIRECT_LIMIT,
             accept=JSON,
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE,
+            pool_block=DEFAULT_POOL_BLOCK,
+            max_retries=DEFAULT_MAX_RETRIES,
+            retry=None,
+            json_codec=None,
+            log_body_limit=DEFAULT_LOG_BODY_LIMIT,
+            redirect_cache_size=DEFAULT_REDIRECT_CACHE_SIZE,
     ):
         """Create a new :class:`~openstack.transport.Transport` object.
 
@@ -168,24 +244,74 @@ class Transport(requests.Session):
                                          requests.Session handles redirection
                                          if True. (optional)
         :param string accept: Type of output to accept
+        :param integer pool_connections: The number of hosts to keep
+                                         connection pools for.
+        :param integer pool_maxsize: The maximum number of connections
+                                     kept open to each host.
+        :param boolean pool_block: Whether to wait for a free connection
+                                   when a host's pool is exhausted rather
+                                   than opening a connection that is not
+                                   kept afterwards.
+        :param integer max_retries: The number of times a failed connection
+                                    attempt is retried.
+        :param retry: The policy for sending failed requests again. By
+                      default requests are not retried.
+        :type retry: :class:`~openstack.retry.RetryPolicy`
+        :param json_codec: The codec that encodes and decodes JSON bodies,
+                           or the name of one.  By default the fastest one
+                           installed, see :mod:`~openstack.json_codec`.
+        :param integer log_body_limit: The size in bytes above which request
+                                       and response bodies are not logged.
+                                       Bodies that aren't text, such as
+                                       object contents, are never logged.
+        :param integer redirect_cache_size: The number of permanent
+                                            redirections (301 and 308)
+                                            remembered, so that later
+                                            requests with the same method
+                                            and URL go straight to the new
+                                            location.  0 disables the cache.
+                                            Only used when the transport
+                                            handles redirections itself, that
+                                            is when ``redirect`` is an
+                                            integer.
 
         """
 
         super(Transport, self).__init__()
 
+        for prefix in ('https://', 'http://'):
+            self.mount(prefix, adapters.HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=max_retries))
+
         # Per RFC 7231 Section 5.5.3, identifiers in a user-agent should
         # be ordered by decreasing significance. If a user sets their product,
         # we prepend it to the SDK version and then the Python version.
         if user_agent is None:
-            self._user_agent = USER_AGENT
+            self._user_agent = _get_default_user_agent()
         else:
-            self._user_agent = "%s %s" % (user_agent, USER_AGENT)
+            self._user_agent = "%s %s" % (user_agent,
+                                          _get_default_user_agent())
 
         self.verify = verify
         self._redirect = redirect
         self._accept = accept
-
-    def request(self, method, url, redirect=None, **kwargs):
+        self._retry = retry
+        self._retries = {}
+        self._retries_lock = threading.Lock()
+        if json_codec is None or isinstance(json_codec, six.string_types):
+            json_codec = json_codec_.get_codec(json_codec)
+        self._json_codec = json_codec
+        self._log_body_limit = log_body_limit
+        self._redirect_cache_size = redirect_cache_size
+        # (method, url) -> location, and the keys from oldest to newest.
+        self._redirect_cache = {}
+        self._redirect_keys = collections.deque()
+        self._redirect_lock = threading.Lock()
+
+    def request(self, method, url, redirect=None, retry=None, **kwargs):
         """Send a request
 
         Perform an HTTP request. The following arguments differ from
@@ -198,6 +324,9 @@ class Transport(requests.Session):
                                          (boolean) No redirections if False,
                                          requests.Session handles redirection
                                          if True. (optional)
+        :param retry: The policy for sending the request again if it fails.
+                      Defaults to the transport's policy.
+        :type retry: :class:`~openstack.retry.RetryPolicy`
 
         The following additional kw args are supported:
 
@@ -208,6 +337,9 @@ class Transport(requests.Session):
                                   Header is omitted if ``None``.
         :param string user_agent: Prepend an additional value to the existing
                                   ``User-Agent`` header.
+        :param bool stream: If true, the body is not read and so not decoded
+                            either, see
+                            :class:`~openstack.json_stream.ArrayStream`.
 
         Remaining kw args from requests.Session.request() supported
 
@@ -219,7 +351,7 @@ class Transport(requests.Session):
         # Overwrites any existing 'data' value
         json_data = kwargs.pop('json', None)
         if json_data is not None:
-            kwargs['data'] = json.dumps(json_data)
+            kwargs['data'] = self._json_codec.dumps(json_data)
             headers['Content-Type'] = JSON
 
         # Prepend the caller's user_agent to User-Agent header if included,
@@ -255,9 +387,8 @@ class Transport(requests.Session):
 
         self._log_request(method, url, **kwargs)
 
-        resp = self._send_request(method, url, redirect, **kwargs)
-
-        self._log_response(resp)
+        resp = self._send_with_retry(method, url, redirect,
+                                     retry or self._retry, **kwargs)
 
         try:
             resp.raise_for_status()
@@ -266,9 +397,9 @@ class Transport(requests.Session):
                 six.text_type(e),
                 details=self._parse_error_response(resp),
                 status_code=resp.status_code)
-        if accept == JSON:
+        if accept == JSON and not kwargs.get('stream'):
             try:
-                resp.body = resp.json()
+                resp.body = self._decode_json(resp)
             except ValueError as e:
                 # this may be simplejson.decode.JSONDecodeError
                 # Re-raise into our own exception
@@ -276,47 +407,177 @@ class Transport(requests.Session):
 
         return resp
 
+    def _decode_json(self, resp):
+        encoding = resp.encoding
+        if encoding:
+            try:
+                utf8 = codecs.lookup(encoding).name == 'utf-8'
+            except LookupError:
+                # An unknown charset such as utf8mb4, JSON is UTF-8.
+                utf8 = True
+            if not utf8:
+                return self._json_codec.loads(resp.text)
+        # Skip decoding the body to text, which the codec does faster.
+        return self._json_codec.loads(resp.content)
+
+    def _send_with_retry(self, method, url, redirect, retry, **kwargs):
+        if retry is None:
+            return self._send_request(method, url, redirect, **kwargs)
+
+        data = kwargs.get('data')
+        position = utils.tell_body(data)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                resp = self._send_request(method, url, redirect, **kwargs)
+            except requests.ConnectionError as e:
+                delay = retry.get_delay(method, attempt)
+                if delay is None or not utils.rewind_body(data, position):
+                    raise
+                reason = 'connection'
+                _logger.debug("Connection to %s failed: %s", url, e)
+            else:
+                delay = retry.get_delay(method, attempt, response=resp)
+                if delay is None or not utils.rewind_body(data, position):
+                    return resp
+                reason = resp.status_code
+                resp.close()
+            self._count_retry(url, reason)
+            _logger.info("Retrying %s %s in %.2f seconds after %s",
+                         method, url, delay, reason)
+            time.sleep(delay)
+
+    def _count_retry(self, url, reason):
+        parts = urllib.parse.urlsplit(url)
+        host = '%s://%s' % (parts.scheme, parts.netloc)
+        with self._retries_lock:
+            counts = self._retries.setdefault(host, {})
+            counts[reason] = counts.get(reason, 0) + 1
+
+    def get_retry_stats(self):
+        """Get the number of requests retried for each host.
+
+        :returns dict: For each host, keyed by ``scheme://host:port``, a
+                       dict of the retries by reason: the response status
+                       code or ``'connection'`` for connection failures.
+        """
+        with self._retries_lock:
+            return dict((host, dict(counts))
+                        for host, counts in self._retries.items())
+
     def _send_request(self, method, url, redirect, **kwargs):
         # NOTE(jamielennox): We handle redirection manually because the
         # requests lib follows some browser patterns where it will redirect
         # POSTs as GETs for certain statuses which is not want we want for an
         # API. See: https://en.wikipedia.org/wiki/Post/Redirect/Get
 
-        resp = super(Transport, self).request(method, url, **kwargs)
-
-        self._log_response(resp)
-
-        if resp.status_code in self.REDIRECT_STATUSES:
-            # Be careful here in python True == 1 and False == 0
+        # Be careful here in python True == 1 and False == 0
+        use_cache = not isinstance(redirect, bool) and redirect > 0
+        params = kwargs.pop('params', None)
+        if params:
+            # Send the query string as part of the URL, so that a location
+            # is followed as given rather than with the params added again,
+            # and the redirections cached are those of the full URL.
+            prepared = requests.PreparedRequest()
+            prepared.prepare_url(url, params)
+            url = prepared.url
+
+        history = []
+        while True:
+            if use_cache:
+                url = self._get_cached_redirect(method, url)
+            resp = super(Transport, self).request(method, url, **kwargs)
+
+            self._log_response(resp)
+
+            if resp.status_code not in self.REDIRECT_STATUSES:
+                break
             if isinstance(redirect, bool):
-                redirect_allowed = redirect
+                if not redirect:
+                    break
             else:
                 redirect -= 1
-                redirect_allowed = redirect >= 0
-
-            if redirect_allowed:
-                try:
-                    location = resp.headers['location']
-                except KeyError:
-                    _logger.warn(
-                        "Redirection from %s failed, no location provided",
-                        resp.url,
-                    )
-                else:
-                    new_resp = self._send_request(
-                        method,
-                        location,
-                        redirect,
-                        **kwargs
-                    )
-
-                    new_resp.history = list(new_resp.history)
-                    new_resp.history.insert(0, resp)
-                    resp = new_resp
+                if redirect < 0:
+                    break
 
+            try:
+                location = resp.headers['location']
+            except KeyError:
+                _logger.warn(
+                    "Redirection from %s failed, no location provided",
+                    resp.url,
+                )
+                break
+
+            if resp.status_code in self.PERMANENT_REDIRECT_STATUSES:
+                self._cache_redirect(method, url, location)
+            history.append(resp)
+            url = location
+
+        if history:
+            resp.history = history + list(resp.history)
         return resp
 
-    def _parse_error_response(self, resp):
+    def _get_cached_redirect(self, method, url):
+        """Follow the permanent redirections known for a URL."""
+        if not self._redirect_cache:
+            return url
+        with self._redirect_lock:
+            seen = set()
+            while url not in seen:
+                seen.add(url)
+                location = self._redirect_cache.get((method, url))
+                if location is None:
+                    break
+                url = location
+        return url
+
+    def _cache_redirect(self, method, url, location):
+        if self._redirect_cache_size <= 0:
+            return
+        key = (method, url)
+        with self._redirect_lock:
+            if key not in self._redirect_cache:
+                if len(self._redirect_keys) >= self._redirect_cache_size:
+                    del self._redirect_cache[self._redirect_keys.popleft()]
+                self._redirect_keys.append(key)
+            self._redirect_cache[key] = location
+
+    def clear_redirect_cache(self):
+        """Forget the permanent redirections seen so far."""
+        with self._redirect_lock:
+            self._redirect_cache.clear()
+            self._redirect_keys.clear()
+
+    def get_pool_stats(self):
+        """Get statistics about the connection pools.
+
+        :returns dict: For each pool, keyed by ``scheme://host:port``, a
+                       dict with the number of ``requests`` made, the new
+                       ``connections`` opened for them (pool misses) and
+                       the number of requests that ``reused`` an open
+                       connection (pool hits).
+        """
+        stats = {}
+        for adapter in self.adapters.values():
+            manager = getattr(adapter, 'poolmanager', None)
+            if manager is None:
+                continue
+            for key in manager.pools.keys():
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                name = '%s://%s:%s' % (pool.scheme, pool.host, pool.port)
+                stats[name] = {
+                    'requests': pool.num_requests,
+                    'connections': pool.num_connections,
+                    'reused': pool.num_requests - pool.num_connections,
+                }
+        return stats
+
+    @staticmethod
+    def _parse_error_response(resp):
         try:
             jresp = resp.json()
             # compute
@@ -361,24 +622,46 @@ class Transport(requests.Session):
             string_parts.append(header)
 
         if 'data' in kwargs and kwargs['data'] is not None:
+            data = kwargs['data']
+            content_type = kwargs['headers'].get('Content-Type')
+            if not isinstance(data, (six.binary_type, six.text_type)):
+                data = '<%s>' % type(data).__name__
+            elif not self._should_log_body(content_type, len(data)):
+                data = '<%d bytes of %s>' % (len(data), content_type)
+            elif isinstance(data, six.binary_type):
+                data = data.decode('utf-8', 'replace')
             string_parts.append("--data '")
-            string_parts.append(kwargs['data'])
+            string_parts.append(data)
             string_parts.append("'")
-        _logger.debug("REQ: %s" % " ".join(string_parts))
+        _logger.debug("REQ: %s", " ".join(string_parts))
 
     def _log_response(self, response):
-        _logger.debug(
-            "RESP: [%s] %r" % (
-                response.status_code,
-                response.headers,
-            ),
-        )
-        if response._content_consumed:
-            _logger.debug(
-                "RESP BODY: %s",
-                response.text,
-            )
-        _logger.debug(
-            "encoding: %s",
-            response.encoding,
-        )
+        if not _logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # A streamed body hasn't been read, and reading it here would leave
+        # nothing for the caller.
+        if not response._content_consumed:
+            body = '<not read>'
+        else:
+            content_type = response.headers.get('Content-Type')
+            size = len(response.content or b'')
+            if self._should_log_body(content_type, size):
+                body = response.text
+            else:
+                body = '<%d bytes of %s>' % (size, content_type)
+        _logger.debug("RESP: [%s] %r\nRESP BODY: %s\nencoding: %s",
+                      response.status_code, response.headers, body,
+                      response.encoding)
+
+    def _should_log_body(self, content_type, size):
+        """Tell whether a body is text and small enough to be logged."""
+        if size > self._log_body_limit:
+            return False
+        if not content_type:
+            # Without a type it's most likely a small text body.
+            return True
+        content_type = content_type.split(';', 1)[0].strip().lower()
+        return (content_type.startswith('text/') or
+                content_type in _TEXT_TYPES or
+                content_type.endswith(('+json', '+xml')))
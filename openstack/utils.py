@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import six
+
 
 def urljoin(*args):
     """A custom version of urljoin that simply joins strings into a path.
@@ -19,3 +21,32 @@ def urljoin(*args):
     link. We generally won't care about that in client.
     """
     return '/'.join(str(a or '').strip('/') for a in args)
+
+
+def tell_body(data):
+    """Get the position of a file-like request body, if it has one."""
+    try:
+        return data.tell()
+    except Exception:
+        return None
+
+
+def rewind_body(data, position):
+    """Prepare a request body to be sent again.
+
+    :param data: The request body.
+    :param position: The position of the body from :func:`tell_body` before
+                     it was first sent.
+
+    :returns bool: True if the body can be replayed.
+    """
+    if data is None or isinstance(data, (six.string_types, six.binary_type,
+                                         dict, list, tuple)):
+        return True
+    if position is None:
+        return False
+    try:
+        data.seek(position)
+    except Exception:
+        return False
+    return True
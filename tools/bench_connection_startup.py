@@ -0,0 +1,79 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the startup cost of a Connection.
+
+Each measurement runs in a fresh interpreter so module imports are counted.
+It times importing the connection module, creating a Connection and then
+touching one service, as a single service CLI would, or every service, which
+is what creating a Connection used to cost before proxies were loaded
+lazily::
+
+    python tools/bench_connection_startup.py --runs 10 --service object_store
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+SCRIPT = """
+import json
+import sys
+import time
+
+start = time.time()
+from openstack import connection
+from openstack import transport
+imported = time.time()
+conn = connection.Connection(transport=transport.Transport(),
+                             authenticator=object())
+created = time.time()
+names = sys.argv[1:] or sorted(conn._services)
+for name in names:
+    getattr(conn, name)
+done = time.time()
+print(json.dumps({'import': imported - start, 'create': created - imported,
+                  'services': done - created,
+                  'modules': len(sys.modules)}))
+"""
+
+
+def measure(runs, services):
+    results = []
+    for i in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, '-c', SCRIPT] + services)
+        results.append(json.loads(out.decode('utf-8')))
+    results.sort(key=lambda r: r['import'] + r['create'] + r['services'])
+    return results[len(results) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--service', default='object_store')
+    args = parser.parse_args()
+
+    for label, services in (('one service', [args.service]),
+                            ('all services', [])):
+        r = measure(args.runs, services)
+        total = r['import'] + r['create'] + r['services']
+        print('%-12s import %6.1f ms  create %6.1f ms  services %6.1f ms  '
+              'total %6.1f ms  modules %d' % (
+                  label, r['import'] * 1000, r['create'] * 1000,
+                  r['services'] * 1000, total * 1000, r['modules']))
+
+
+if __name__ == '__main__':
+    main()
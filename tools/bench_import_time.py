@@ -0,0 +1,100 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Profile the import time of the SDK's main entry points.
+
+Each entry point is imported in a fresh interpreter run with
+``python -X importtime``, which needs Python 3.7 or later, and the median
+of several runs is reported along with the top level packages and the
+modules that cost the most::
+
+    python3 tools/bench_import_time.py --runs 10
+    python3 tools/bench_import_time.py openstack.connection --top 20
+
+``--python`` runs the imports with another interpreter, for example one from
+a virtualenv that has the SDK's requirements installed.
+"""
+
+import argparse
+import collections
+import re
+import subprocess
+import sys
+
+ENTRY_POINTS = (
+    'openstack.connection',
+    'openstack.network.v2.thin',
+    'openstack.auth.identity.discoverable',
+)
+
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def profile(python, module):
+    """Import a module in a new interpreter and parse -X importtime."""
+    proc = subprocess.Popen([python, '-X', 'importtime', '-c',
+                             'import %s' % module],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(err.decode('utf-8', 'replace'))
+    modules = []
+    for line in err.decode('utf-8', 'replace').splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us),
+                            len(indent) // 2))
+    return modules
+
+
+def report(python, module, runs, top):
+    profiles = [profile(python, module) for i in range(runs)]
+    totals = sorted((sum(m[1] for m in p), i)
+                    for i, p in enumerate(profiles))
+    total, index = totals[len(totals) // 2]
+    median = profiles[index]
+
+    print('%s: %.1f ms, %d modules' % (module, total / 1000.0, len(median)))
+
+    # Charge every module's own time to its top level package.
+    packages = collections.Counter()
+    for name, self_us, cumulative_us, depth in median:
+        packages[name.split('.')[0]] += self_us
+    for name, self_us in packages.most_common(top):
+        print('  %-40s %8.1f ms' % (name, self_us / 1000.0))
+
+    print('  slowest modules, cumulative:')
+    firsts = [m for m in median if m[3] <= 1]
+    for name, self_us, cumulative_us, depth in sorted(
+            firsts, key=lambda m: -m[2])[:top]:
+        print('  %-40s %8.1f ms' % (name, cumulative_us / 1000.0))
+    print('')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=ENTRY_POINTS)
+    parser.add_argument('--python', default=sys.executable)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        report(args.python, module, args.runs, args.top)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the JSON codecs of openstack.json_codec.
+
+Each codec that is installed encodes and decodes listings shaped like those
+of Nova's ``/servers/detail``, Neutron's ``/ports`` and a Swift container,
+and the median time of several runs is reported along with the speedup over
+the standard library's json::
+
+    python tools/bench_json.py --count 1000 --runs 20
+"""
+
+import argparse
+import json
+import timeit
+
+from openstack import json_codec
+
+
+def nova_server(i):
+    return {
+        'id': '2ce4c5b3-2866-4972-93ce-77a2ea46%04d' % i,
+        'name': 'server-%d' % i,
+        'status': 'ACTIVE',
+        'tenant_id': '6f70656e737461636b20342065766572',
+        'user_id': 'fake',
+        'created': '2015-03-09T12:14:57Z',
+        'updated': '2015-03-09T12:15:57Z',
+        'hostId': '3a86ba21d88bfe7cd5fd3d2d4f4e1eedea8d1b44cbba2ea5d2e8fe8d',
+        'accessIPv4': '',
+        'accessIPv6': '',
+        'progress': 0,
+        'metadata': {'My Server Name': 'Apache1', 'role': 'web'},
+        'flavor': {'id': '1', 'links': [{
+            'href': 'http://openstack.example.com/flavors/1',
+            'rel': 'bookmark'}]},
+        'image': {'id': '70a599e0-31e7-49b7-b260-868f441e862b', 'links': [{
+            'href': 'http://openstack.example.com/images/70a599e0',
+            'rel': 'bookmark'}]},
+        'addresses': {'private': [{
+            'addr': '192.168.0.%d' % (i % 250 + 3), 'version': 4,
+            'OS-EXT-IPS:type': 'fixed',
+            'OS-EXT-IPS-MAC:mac_addr': 'aa:bb:cc:dd:ee:ff'}]},
+        'links': [
+            {'href': 'http://openstack.example.com/v2/servers/%d' % i,
+             'rel': 'self'},
+            {'href': 'http://openstack.example.com/servers/%d' % i,
+             'rel': 'bookmark'}],
+        'key_name': None,
+        'security_groups': [{'name': 'default'}],
+        'OS-DCF:diskConfig': 'AUTO',
+        'OS-EXT-AZ:availability_zone': 'nova',
+        'OS-EXT-STS:power_state': 1,
+        'OS-EXT-STS:task_state': None,
+        'OS-EXT-STS:vm_state': 'active',
+        'os-extended-volumes:volumes_attached': [],
+    }
+
+
+def neutron_port(i):
+    return {
+        'id': '46d4bfb9-b26e-41f3-bd2e-e6dcc1cc%04d' % i,
+        'name': '',
+        'network_id': 'a87cc70a-3e15-4acf-8205-9b711a3531b7',
+        'tenant_id': 'd6700c0c9ffa4f1cb322cd4a1f3906fa',
+        'admin_state_up': True,
+        'status': 'ACTIVE',
+        'mac_address': 'fa:16:3e:%02x:%02x:%02x' % (
+            i >> 16 & 255, i >> 8 & 255, i & 255),
+        'fixed_ips': [{'subnet_id': 'a0304c3a-4f08-4c43-88af-d796509c97d2',
+                       'ip_address': '10.0.%d.%d' % (i // 250, i % 250)}],
+        'device_id': '5e3898d7-11be-483e-9732-b2f5eccd2b2e',
+        'device_owner': 'compute:nova',
+        'security_groups': ['f0ac4394-7e4a-4409-9701-ba8be283dbc3'],
+        'allowed_address_pairs': [],
+        'extra_dhcp_opts': [],
+        'binding:host_id': 'devstack',
+        'binding:vif_type': 'ovs',
+        'binding:vnic_type': 'normal',
+        'binding:vif_details': {'port_filter': True, 'ovs_hybrid_plug': True},
+        'binding:profile': {},
+        'port_security_enabled': True,
+    }
+
+
+def swift_object(i):
+    return {
+        'name': 'logs/2015/03/09/host-%d.log.gz' % i,
+        'hash': '451e372e48e0f6b1114fa0724aa7%04x' % (i & 0xffff),
+        'bytes': 12345 + i,
+        'content_type': 'application/x-gzip',
+        'last_modified': '2015-03-09T12:14:57.123450',
+    }
+
+
+PAYLOADS = (
+    ('nova servers', lambda n: {'servers': [nova_server(i)
+                                            for i in range(n)]}),
+    ('neutron ports', lambda n: {'ports': [neutron_port(i)
+                                           for i in range(n)]}),
+    # Swift sends its listings as a top level array.
+    ('swift objects', lambda n: [swift_object(i) for i in range(n)]),
+)
+
+
+def median(timer, number, runs):
+    times = sorted(t / number for t in timer.repeat(runs, number))
+    return times[len(times) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1000,
+                        help='The number of items in each listing.')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--number', type=int, default=5,
+                        help='The number of times each run repeats.')
+    args = parser.parse_args()
+
+    codecs = []
+    for name, codec_cls in json_codec.CODECS:
+        try:
+            codecs.append(codec_cls())
+        except ImportError:
+            print('%s is not available' % name)
+    print('default codec: %s' % json_codec.get_codec().name)
+
+    for label, make in PAYLOADS:
+        obj = make(args.count)
+        data = json.dumps(obj).encode('utf-8')
+        print('%s: %d items, %.1f KiB' % (label, args.count,
+                                          len(data) / 1024.0))
+        base = None
+        for codec in reversed(codecs):
+            dumps = median(timeit.Timer(lambda: codec.dumps(obj)),
+                           args.number, args.runs)
+            loads = median(timeit.Timer(lambda: codec.loads(data)),
+                           args.number, args.runs)
+            if base is None:
+                base = (dumps, loads)
+            print('  %-12s dumps %8.2f ms (x%4.1f)  loads %8.2f ms (x%4.1f)'
+                  % (codec.name, dumps * 1000, base[0] / dumps,
+                     loads * 1000, base[1] / loads))
+        print('')
+
+
+if __name__ == '__main__':
+    main()
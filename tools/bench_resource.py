@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Micro-benchmarks for Resource construction and prop access.
+
+Builds a large list of resources the way a listing does, from server-side
+dicts, then times reading and writing their props::
+
+    python tools/bench_resource.py --count 100000
+
+The resource is :class:`~openstack.network.v2.port.Port`, or a subclass of it
+that sets ``compact`` with ``--compact``.  On Python 3.4 or later the memory
+taken by each resource, not counting the dicts it was built from, is measured
+with tracemalloc.
+"""
+
+import argparse
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from openstack import format
+from openstack.network.v2 import port
+from openstack import resource
+
+
+class Port(port.Port):
+    # The shipped Port with a couple of typed props that it doesn't have.
+    mtu = resource.prop('mtu', type=int)
+    shared = resource.prop('shared', type=format.BoolStr)
+
+
+class CompactPort(Port):
+    compact = True
+
+
+def make_data(i):
+    return {
+        'id': 'port-%08d' % i,
+        'name': 'port%d' % i,
+        'admin_state_up': True,
+        'binding:vif_details': {'port_filter': True},
+        'mtu': '1500',
+        'shared': 'false',
+        'status': 'ACTIVE',
+    }
+
+
+def timed(label, count, func):
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    print('%-32s %8.1f ms  %6.2f us/item' % (label, elapsed * 1000,
+                                             elapsed * 1000000 / count))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--reads', type=int, default=5)
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+    count = args.count
+    cls = CompactPort if args.compact else Port
+
+    data = [make_data(i) for i in range(count)]
+    ports = []
+
+    def construct():
+        ports.extend(cls.existing(**d) for d in data)
+
+    def measure():
+        # The attrs dicts are built by existing() so they are counted.
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        objs = [cls.existing(**d) for d in data]
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del objs
+        print('%-32s %8.1f MB  %6d bytes/item' % (
+            'memory', used / 1048576.0, used // count))
+
+    def read(name):
+        def func():
+            for i in range(args.reads):
+                for p in ports:
+                    getattr(p, name)
+        return func
+
+    def write():
+        for p in ports:
+            p.mtu = 9000
+            p.shared = 'true'
+            p.name = 'renamed'
+
+    print(cls.__name__)
+    if tracemalloc is not None:
+        measure()
+    timed('existing()', count, construct)
+    timed('get untyped (name) x%d' % args.reads, count * args.reads,
+          read('name'))
+    timed('get type=bool x%d' % args.reads, count * args.reads,
+          read('admin_state_up'))
+    timed('get type=dict x%d' % args.reads, count * args.reads,
+          read('binding_vif_details'))
+    timed('get type=int x%d' % args.reads, count * args.reads,
+          read('mtu'))
+    timed('get BoolStr x%d' % args.reads, count * args.reads,
+          read('shared'))
+    timed('set int, BoolStr, untyped', count * 3, write)
+    timed('get int after set x%d' % args.reads, count * args.reads,
+          read('mtu'))
+
+
+if __name__ == '__main__':
+    main()
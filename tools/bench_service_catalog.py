@@ -0,0 +1,96 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark service catalog parsing and endpoint lookups.
+
+Builds synthetic v2 and v3 catalogs with many services and regions and
+times catalog construction and ``get_url`` for a few typical filters::
+
+    python tools/bench_service_catalog.py --services 40 --regions 50
+"""
+
+import argparse
+import timeit
+
+from openstack.auth import service_catalog
+from openstack.auth import service_filter
+
+INTERFACES = ('public', 'internal', 'admin')
+
+
+def make_v3(services, regions):
+    catalog = []
+    for s in range(services):
+        endpoints = []
+        for r in range(regions):
+            for interface in INTERFACES:
+                endpoints.append({
+                    'interface': interface,
+                    'region': 'Region%d' % r,
+                    'url': 'https://svc%d.%s.region%d.example.com/v2/abc' % (
+                        s, interface, r),
+                })
+        catalog.append({'type': 'service%d' % s, 'name': 'name%d' % s,
+                        'endpoints': endpoints})
+    return catalog
+
+
+def make_v2(services, regions):
+    catalog = []
+    for s in range(services):
+        endpoints = []
+        for r in range(regions):
+            endpoint = {'region': 'Region%d' % r}
+            for interface in INTERFACES:
+                endpoint['%sURL' % interface] = (
+                    'https://svc%d.%s.region%d.example.com/v2/abc' % (
+                        s, interface, r))
+            endpoints.append(endpoint)
+        catalog.append({'type': 'service%d' % s, 'name': 'name%d' % s,
+                        'endpoints': endpoints})
+    return catalog
+
+
+def bench(name, cls, data, regions, number):
+    last = len(data) - 1
+    filters = [
+        ('type', service_filter.ServiceFilter('service%d' % last)),
+        ('type+region', service_filter.ServiceFilter(
+            'service%d' % last, region='Region%d' % (regions - 1))),
+        ('type+name+admin', service_filter.ServiceFilter(
+            'service%d' % last, visibility='admin',
+            service_name='name%d' % last)),
+    ]
+    parse = timeit.timeit(lambda: cls(data), number=10) / 10
+    print('%s: parse %.3f ms' % (name, parse * 1000))
+    sot = cls(data)
+    for label, sf in filters:
+        t = timeit.timeit(lambda: sot.get_url(sf), number=number) / number
+        print('%s: get_url %-16s %.2f us' % (name, label, t * 1000000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--services', type=int, default=40)
+    parser.add_argument('--regions', type=int, default=50)
+    parser.add_argument('--number', type=int, default=10000)
+    args = parser.parse_args()
+
+    bench('v2', service_catalog.ServiceCatalogV2,
+          make_v2(args.services, args.regions), args.regions, args.number)
+    bench('v3', service_catalog.ServiceCatalog,
+          make_v3(args.services, args.regions), args.regions, args.number)
+
+
+if __name__ == '__main__':
+    main()